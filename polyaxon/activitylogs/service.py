@@ -9,12 +9,10 @@ class ActivityLogService(EventService):
     def __init__(self):
         self.activity_log_manager = None
 
-    def record_event(self, event):
-        if not event.ref_id:
-            return
+    def get_activity_log(self, event):
         assert event.actor_id is not None
         actor_id = event.data[event.actor_id]
-        return self.activity_log_manager.create(
+        return self.activity_log_manager.model(
             ref=event.ref_id,
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
@@ -24,6 +22,18 @@ class ActivityLogService(EventService):
             content_type_id=event.instance_contenttype
         )
 
+    def record_event(self, event):
+        if not event.ref_id:
+            return
+        activity_log = self.get_activity_log(event)
+        activity_log.save(force_insert=True)
+        return activity_log
+
+    def record_events(self, events):
+        return self.activity_log_manager.bulk_create([
+            self.get_activity_log(event) for event in events if event.ref_id
+        ])
+
     def setup(self):
         super().setup()
         # Load default event types
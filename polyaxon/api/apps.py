@@ -16,9 +16,11 @@ class APIConfig(AppConfig):
         import signals.project_tensorboard_jobs  # noqa
         import signals.nodes  # noqa
         import signals.repos  # noqa
+        import signals.searches  # noqa
         import signals.users  # noqa
         import signals.pipelines  # noqa
         import signals.deletion  # noqa
         import signals.statuses  # noqa
+        import signals.lookups  # noqa
         if settings.AUTH_LDAP_ENABLED:
             from api.users.ldap_signals import populate_user_handler  # noqa
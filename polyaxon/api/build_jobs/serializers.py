@@ -23,6 +23,7 @@ class BuildJobSerializer(serializers.ModelSerializer):
     project = fields.SerializerMethodField()
     started_at = fields.DateTimeField(read_only=True)
     finished_at = fields.DateTimeField(read_only=True)
+    last_status = fields.CharField(read_only=True)
 
     class Meta:
         model = BuildJob
@@ -1,9 +1,12 @@
 from rest_framework.generics import get_object_or_404
 
+from django.http import Http404
+
 import access
 
 from access.resources import Resources
 from api.endpoint.project import ProjectPermission, ProjectResourceEndpoint
+from db.getters.experiments import get_cached_experiment_ref
 from db.models.experiments import Experiment
 
 
@@ -27,12 +30,26 @@ class ExperimentResourceListEndpoint(ProjectResourceEndpoint):
     def enrich_queryset(self, queryset):
         return queryset.filter(experiment=self.experiment)
 
+    def use_experiment_ref(self):
+        """Whether the view only uses the experiment's id and project.
+
+        The reference is resolved from the lookups' cache, otherwise the experiment is loaded.
+        """
+        return False
+
     def _initialize_context(self):
         #  pylint:disable=attribute-defined-outside-init
         super()._initialize_context()
-        self.experiment = get_object_or_404(Experiment,
-                                            id=self.experiment_id,
-                                            project=self.project)
+        if not self.use_experiment_ref():
+            self.experiment = get_object_or_404(Experiment,
+                                                id=self.experiment_id,
+                                                project=self.project)
+            return
+
+        self.experiment = get_cached_experiment_ref(project=self.project,
+                                                    experiment_id=self.experiment_id)
+        if not self.experiment:
+            raise Http404
 
 
 class ExperimentResourcePermission(ProjectPermission):
@@ -1,10 +1,11 @@
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 
 import access
 
 from access.resources import Resources
 from api.endpoint.admin import AdminPermission
 from api.endpoint.base import BaseEndpoint
+from db.getters.projects import get_cached_project
 from db.models.projects import Project
 
 
@@ -70,9 +71,10 @@ class ProjectResourceListEndpoint(BaseEndpoint):
     def _initialize_context(self):
         #  pylint:disable=attribute-defined-outside-init
         super()._initialize_context()
-        self.project = get_object_or_404(Project,
-                                         owner__name=self.owner_name,
-                                         name=self.project_name)
+        self.project = get_cached_project(owner_name=self.owner_name,
+                                          project_name=self.project_name)
+        if not self.project:
+            raise Http404
         self.owner = self.project.owner
 
     def _validate_resource_permission(self):
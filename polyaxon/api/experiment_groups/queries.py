@@ -4,6 +4,5 @@ groups = ExperimentGroup.objects.select_related(
     'user',
     'project',
     'project__user',
-    'status',
 )
 groups_details = groups
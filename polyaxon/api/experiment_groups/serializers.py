@@ -24,6 +24,7 @@ class ExperimentGroupSerializer(serializers.ModelSerializer):
     uuid = fields.UUIDField(format='hex', read_only=True)
     project = fields.SerializerMethodField()
     user = fields.SerializerMethodField()
+    last_status = fields.CharField(read_only=True)
 
     class Meta:
         model = ExperimentGroup
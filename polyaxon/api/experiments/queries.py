@@ -18,8 +18,7 @@ experiments = Experiment.objects.select_related(
     'original_experiment__project__user',
     'original_experiment__experiment_group',
     'original_experiment__experiment_group__project',
-    'original_experiment__experiment_group__project__user',
-    'status')
+    'original_experiment__experiment_group__project__user')
 
 experiments_details = experiments.annotate(
     Count('jobs', distinct=True)
@@ -32,5 +31,38 @@ experiments_auditing = Experiment.objects.select_related(
     'experiment_group',
     'experiment_group__project',
     'experiment_group__project__user',
-    'status'
+)
+
+# Only the columns and joins needed by the light serializers
+experiments_projection_fields = (
+    'id',
+    'uuid',
+    'name',
+    'updated_at',
+    'project',
+    'project__name',
+    'project__user',
+    'project__user__username',
+    'experiment_group',
+    'experiment_group__project',
+    'experiment_group__project__name',
+    'experiment_group__project__user',
+    'experiment_group__project__user__username',
+)
+
+experiments_projection = Experiment.objects.select_related(
+    'project__user',
+    'experiment_group__project__user',
+)
+
+experiments_metrics = experiments_projection.only(
+    *experiments_projection_fields,
+    'last_metric',
+    'started_at',
+    'finished_at'
+)
+
+experiments_declarations = experiments_projection.only(
+    *experiments_projection_fields,
+    'declarations'
 )
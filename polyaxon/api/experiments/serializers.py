@@ -29,6 +29,7 @@ class ExperimentJobSerializer(serializers.ModelSerializer):
     resources = JobResourcesSerializer(required=False)
     started_at = fields.DateTimeField(read_only=True)
     finished_at = fields.DateTimeField(read_only=True)
+    last_status = fields.CharField(read_only=True)
 
     class Meta:
         model = ExperimentJob
@@ -121,6 +122,7 @@ class ExperimentSerializer(serializers.ModelSerializer):
     project = fields.SerializerMethodField()
     started_at = fields.DateTimeField(read_only=True)
     finished_at = fields.DateTimeField(read_only=True)
+    last_status = fields.CharField(read_only=True)
 
     class Meta:
         model = Experiment
@@ -12,7 +12,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
-from django.http import StreamingHttpResponse
+from django.http import Http404, StreamingHttpResponse
 
 import auditor
 import stores
@@ -53,10 +53,12 @@ from api.experiments.serializers import (
     ExperimentStatusSerializer
 )
 from api.filters import OrderingFilter, QueryFilter
-from api.paginator import LargeLimitOffsetPagination
+from api.paginator import KeysetPagination, LargeLimitOffsetPagination
 from api.utils.views.bookmarks_mixin import BookmarkedListMixinView
 from api.utils.views.protected import ProtectedView
+from api.utils.views.streaming_mixin import StreamingListMixinView
 from constants.experiments import ExperimentLifeCycle
+from db.getters.experiments import get_cached_experiment_ref
 from db.models.experiment_groups import ExperimentGroup
 from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
 from db.models.experiments import (
@@ -114,6 +116,7 @@ class ExperimentListView(ListAPIView):
 
 
 class ProjectExperimentListView(BookmarkedListMixinView,
+                                StreamingListMixinView,
                                 ProjectResourceListEndpoint,
                                 ListEndpoint,
                                 CreateEndpoint):
@@ -121,6 +124,9 @@ class ProjectExperimentListView(BookmarkedListMixinView,
     get:
         List experiments under a project.
 
+        `?cursor=` paginates on the last update with the `next` links,
+        `?stream=true` streams all the experiments.
+
     post:
         Create an experiment under a project.
     """
@@ -153,9 +159,22 @@ class ProjectExperimentListView(BookmarkedListMixinView,
 
         return self.serializer_class
 
+    def get_queryset(self):
+        # The light serializers only join and load the columns they need
+        serializer_class = self.get_serializer_class()
+        if serializer_class is self.metrics_serializer_class:
+            return queries.experiments_metrics.all()
+        if serializer_class is self.declarations_serializer_class:
+            return queries.experiments_declarations.all()
+        return super().get_queryset()
+
     @property
     def paginator(self):
-        if self.request.query_params.get('all', None):
+        if KeysetPagination.is_requested(self.request):
+            if self.request.query_params.get(OrderingFilter.ordering_param, None):
+                raise ValidationError('The cursor pagination only supports the default ordering.')
+            self.pagination_class = KeysetPagination
+        elif self.request.query_params.get('all', None):
             self.pagination_class = LargeLimitOffsetPagination
         return super().paginator
 
@@ -473,6 +492,11 @@ class ExperimentMetricListView(ExperimentResourceEndpoint,
     pagination_class = LargeLimitOffsetPagination
     throttle_scope = 'high'
 
+    def use_experiment_ref(self):
+        # The batches of metrics are handed to a task with the experiment's id,
+        # the single metrics update the experiment's last metric and need the loaded experiment
+        return self.request.method == 'POST' and isinstance(self.request.data, list)
+
     def perform_create(self, serializer):
         serializer.save(experiment=self.experiment)
 
@@ -615,6 +639,15 @@ class ExperimentHeartBeatView(ExperimentEndpoint, PostEndpoint):
         InternalAuthentication,
     ]
 
+    def get_object(self):
+        # The heartbeats are frequent and only use the experiment's id, it is not loaded
+        experiment = get_cached_experiment_ref(project=self.project,
+                                               experiment_id=self.experiment_id)
+        if not experiment:
+            raise Http404
+        self.check_object_permissions(self.request, experiment)
+        return experiment
+
     def post(self, request, *args, **kwargs):
         RedisHeartBeat.experiment_ping(experiment_id=self.experiment.id)
         return Response(status=status.HTTP_200_OK)
@@ -6,7 +6,6 @@ jobs = Job.objects.select_related(
     'project__user',
     'build_job',
     'build_job__project',
-    'build_job__project__user',
-    'status')
+    'build_job__project__user')
 
 jobs_details = jobs.select_related('original_job')
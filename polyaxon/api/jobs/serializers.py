@@ -22,6 +22,7 @@ class JobSerializer(serializers.ModelSerializer):
     project = fields.SerializerMethodField()
     build_job = fields.SerializerMethodField()
     original = fields.SerializerMethodField()
+    last_status = fields.CharField(read_only=True)
 
     class Meta:
         model = Job
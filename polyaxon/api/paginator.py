@@ -1,5 +1,93 @@
-from rest_framework.pagination import LimitOffsetPagination
+import base64
+
+from collections import OrderedDict
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 
 
 class LargeLimitOffsetPagination(LimitOffsetPagination):
     default_limit = 300000
+
+
+class KeysetPagination(BasePagination):
+    """Paginates on (`updated_at`, `id`) descending, a page starts after the previous last row.
+
+    Unlike the offset pagination, a page does not need to count nor to skip the previous rows.
+    The first page is requested with an empty `cursor`, the next ones with the `next` link.
+    """
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    default_limit = 100
+    max_limit = 10000
+    ordering = ('-updated_at', '-id')
+
+    def __init__(self):
+        self.request = None
+        self.limit = None
+        self.next_position = None
+
+    @classmethod
+    def is_requested(cls, request):
+        return cls.cursor_query_param in request.query_params
+
+    def get_limit(self, request):
+        try:
+            return _positive_int(request.query_params[self.limit_query_param],
+                                 strict=True,
+                                 cutoff=self.max_limit)
+        except (KeyError, ValueError):
+            return self.default_limit
+
+    @staticmethod
+    def encode_cursor(instance):
+        position = '{}|{}'.format(instance.updated_at.isoformat(), instance.id)
+        return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            position = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+            updated_at, pk = position.split('|')
+            updated_at = parse_datetime(updated_at)
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound('Invalid cursor.')
+        if updated_at is None:
+            raise NotFound('Invalid cursor.')
+        return updated_at, pk
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        position = self.decode_cursor(request)
+        queryset = queryset.order_by(*self.ordering)
+        if position:
+            updated_at, pk = position
+            queryset = queryset.filter(Q(updated_at__lt=updated_at) |
+                                       Q(updated_at=updated_at, id__lt=pk))
+
+        # Fetch one more row to know if there's a next page
+        results = list(queryset[:self.limit + 1])
+        self.next_position = results[self.limit - 1] if len(results) > self.limit else None
+        return results[:self.limit]
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(),
+                                   self.cursor_query_param,
+                                   self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data)
+        ]))
@@ -55,6 +55,7 @@ class ProjectTensorboardJobSerializer(serializers.ModelSerializer):
     uuid = fields.UUIDField(format='hex', read_only=True)
     user = fields.SerializerMethodField()
     project = fields.SerializerMethodField()
+    last_status = fields.CharField(read_only=True)
 
     class Meta:
         model = TensorboardJob
@@ -11,32 +11,14 @@ from db.models.repos import Repo
 from event_manager.events.repo import REPO_NEW_COMMIT
 from libs.paths.utils import delete_path
 from libs.repos import git
+from libs.repos.upload import sync_repo_files
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import ReposCeleryTasks
 
 _logger = logging.getLogger('polyaxon.tasks.repos')
 
 
-@celery_app.task(name=ReposCeleryTasks.REPOS_HANDLE_FILE_UPLOAD, ignore_result=True)
-def handle_new_files(user_id, repo_id, tar_file_name):
-    if not tarfile.is_tarfile(tar_file_name):
-        raise ValueError('Received wrong file format.')
-
-    User = get_user_model()  # noqa
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        _logger.warning('User with id `%s` does not exist anymore.', user_id)
-        return
-
-    try:
-        repo = Repo.objects.get(id=repo_id)
-        # Checkout to master
-        git.checkout_commit(repo.path)
-    except User.DoesNotExist:
-        _logger.warning('Repo with id `%s` does not exist anymore.', repo_id)
-        return
-
+def replace_repo_files(repo, tar_file_name):
     # Destination files
     new_repo_path = repo.get_tmp_tar_path()
 
@@ -61,9 +43,41 @@ def handle_new_files(user_id, repo_id, tar_file_name):
     # Delete the current tar
     os.remove(new_repo_path)
 
+
+@celery_app.task(name=ReposCeleryTasks.REPOS_HANDLE_FILE_UPLOAD, ignore_result=True)
+def handle_new_files(user_id, repo_id, tar_file_name, incremental=False):
+    if not tarfile.is_tarfile(tar_file_name):
+        raise ValueError('Received wrong file format.')
+
+    User = get_user_model()  # noqa
+    try:
+        user = User.objects.get(id=user_id)
+    except User.DoesNotExist:
+        _logger.warning('User with id `%s` does not exist anymore.', user_id)
+        return
+
+    try:
+        repo = Repo.objects.get(id=repo_id)
+        # Checkout to master
+        git.checkout_commit(repo.path)
+    except User.DoesNotExist:
+        _logger.warning('Repo with id `%s` does not exist anymore.', repo_id)
+        return
+
+    if incremental:
+        summary = sync_repo_files(repo_path=repo.path, tar_file_name=tar_file_name)
+        os.remove(tar_file_name)
+        _logger.info('Repo `%s` upload: %s added, %s modified and %s deleted files.',
+                     repo_id, summary['added'], summary['modified'], summary['deleted'])
+        if not any(summary.values()):
+            return summary
+    else:
+        summary = None
+        replace_repo_files(repo=repo, tar_file_name=tar_file_name)
+
     # Get the git repo
     if not git.get_status(repo.path):
-        return
+        return summary
 
     # commit changes
     git.commit(repo.path, user.email, user.username)
@@ -71,3 +85,4 @@ def handle_new_files(user_id, repo_id, tar_file_name):
                    instance=repo,
                    actor_id=user.id,
                    actor_name=user.username)
+    return summary
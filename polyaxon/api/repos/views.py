@@ -114,13 +114,21 @@ class UploadFilesView(ProjectResourceListEndpoint, UploadView):
 
         json_data = self._handle_json_data(request)
         is_async = json_data.get('async', False)
+        # Only write the changed files instead of replacing the whole working tree
+        incremental = json_data.get('incremental', False)
 
         if is_async is False:
-            file_handler = handle_new_files
+            summary = handle_new_files(user_id=user.id,
+                                       repo_id=repo.id,
+                                       tar_file_name=tar_file_name,
+                                       incremental=incremental)
+            if incremental:
+                # The summary of the files added, modified and deleted by the upload
+                return Response(data=summary, status=200)
         else:
-            file_handler = handle_new_files.delay
+            handle_new_files.delay(user_id=user.id,
+                                   repo_id=repo.id,
+                                   tar_file_name=tar_file_name,
+                                   incremental=incremental)
 
-        file_handler(user_id=user.id, repo_id=repo.id, tar_file_name=tar_file_name)
-
-        # do some stuff with uploaded file
         return Response(status=200)
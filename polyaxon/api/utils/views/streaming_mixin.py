@@ -0,0 +1,47 @@
+import json
+
+from hestia.bool_utils import to_bool
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+
+from django.http import StreamingHttpResponse
+
+
+class StreamingListMixinView(object):
+    """Streams the whole list with `?stream=true` instead of paginating it.
+
+    The rows are fetched with a server-side cursor and serialized chunk by chunk,
+    the response is never held in memory.
+    """
+    stream_query_param = 'stream'
+    stream_chunk_size = 1000
+
+    def get_chunks(self, queryset):
+        chunk = []
+        for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+            chunk.append(instance)
+            if len(chunk) == self.stream_chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def stream_results(self, queryset):
+        yield '{"results": ['
+        separator = ''
+        for chunk in self.get_chunks(queryset):
+            for data in self.get_serializer(chunk, many=True).data:
+                yield separator + json.dumps(data, cls=JSONEncoder)
+                separator = ','
+        yield ']}'
+
+    def list(self, request, *args, **kwargs):
+        stream = to_bool(request.query_params.get(self.stream_query_param, None),
+                         handle_none=True,
+                         exception=ValidationError)
+        if not stream:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(self.stream_results(queryset),
+                                     content_type='application/json')
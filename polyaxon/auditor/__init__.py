@@ -6,7 +6,11 @@ from auditor.service import AuditorService
 
 
 def get_access_backend():
-    return settings.AUDITOR_BACKEND or 'auditor.service.AuditorService'
+    if settings.AUDITOR_BACKEND:
+        return settings.AUDITOR_BACKEND
+    if settings.AUDITOR_BUFFER_SIZE > 0:
+        return 'auditor.service.BufferedAuditorService'
+    return 'auditor.service.AuditorService'
 
 
 backend = LazyServiceWrapper(
@@ -1,10 +1,23 @@
+import atexit
+import random
+import threading
+
+import stats
+
 from auditor.manager import default_manager
+from event_manager import event_actions
 from event_manager.event_service import EventService
 
 
 class AuditorService(EventService):
     """An service that just passes the event to author services."""
-    __all__ = EventService.__all__ + ('log', 'notify', 'track')
+    __all__ = EventService.__all__ + ('log',
+                                      'notify',
+                                      'track',
+                                      'log_batch',
+                                      'notify_batch',
+                                      'track_batch',
+                                      'flush')
 
     event_manager = default_manager
 
@@ -26,6 +39,31 @@ class AuditorService(EventService):
             pass
         return self.ref_id
 
+    @staticmethod
+    def is_sampled_out(event_type):
+        """Viewed events are only recorded at the `AUDITOR_VIEWED_EVENTS_SAMPLE_RATE` rate."""
+        from django.conf import settings
+
+        if not (isinstance(event_type, str) and event_type.endswith(event_actions.VIEWED)):
+            return False
+        sample_rate = settings.AUDITOR_VIEWED_EVENTS_SAMPLE_RATE
+        if sample_rate >= 1:
+            return False
+        return sample_rate <= 0 or random.random() >= sample_rate
+
+    def record(self, event_type, event_data=None, instance=None, **kwargs):
+        if self.is_sampled_out(event_type=event_type):
+            return
+        return super().record(event_type=event_type,
+                              event_data=event_data,
+                              instance=instance,
+                              **kwargs)
+
+    def serialize_event(self, event):
+        if not event.ref_id:
+            event.ref_id = self.get_ref_id()
+        return event.serialize(dumps=False, include_actor_name=True, include_instance_info=True)
+
     def record_event(self, event):
         """
         Record the event async.
@@ -33,23 +71,36 @@ class AuditorService(EventService):
         from polyaxon.celery_api import celery_app
         from polyaxon.settings import EventsCeleryTasks
 
-        if not event.ref_id:
-            event.ref_id = self.get_ref_id()
-        event = event.serialize(dumps=False, include_actor_name=True, include_instance_info=True)
+        celery_app.send_task(EventsCeleryTasks.EVENTS_RECORD,
+                             kwargs={'event': self.serialize_event(event)})
 
-        celery_app.send_task(EventsCeleryTasks.EVENTS_TRACK, kwargs={'event': event})
-        celery_app.send_task(EventsCeleryTasks.EVENTS_LOG, kwargs={'event': event})
-        celery_app.send_task(EventsCeleryTasks.EVENTS_NOTIFY, kwargs={'event': event})
+    def flush(self):
+        """Send the buffered events if any, this service does not buffer events."""
 
     def notify(self, event):
+        stats.incr('auditor.notifier')
         self.notifier.record(event_type=event['type'], event_data=event)
 
     def track(self, event):
+        stats.incr('auditor.tracker')
         self.tracker.record(event_type=event['type'], event_data=event)
 
     def log(self, event):
+        stats.incr('auditor.activitylogs')
         self.activitylogs.record(event_type=event['type'], event_data=event)
 
+    def notify_batch(self, events):
+        stats.incr('auditor.notifier', len(events))
+        self.notifier.record_batch(events)
+
+    def track_batch(self, events):
+        stats.incr('auditor.tracker', len(events))
+        self.tracker.record_batch(events)
+
+    def log_batch(self, events):
+        stats.incr('auditor.activitylogs', len(events))
+        self.activitylogs.record_batch(events)
+
     def setup(self):
         super().setup()
         # Load default event types
@@ -62,3 +113,55 @@ class AuditorService(EventService):
         self.notifier = notifier
         self.tracker = tracker
         self.activitylogs = activitylogs
+
+
+class BufferedAuditorService(AuditorService):
+    """An auditor service that buffers the serialized events per process.
+
+    The events are sent as one batch task when the buffer reaches `AUDITOR_BUFFER_SIZE`
+    or when the oldest event has been waiting for `AUDITOR_BUFFER_TIMEOUT` seconds.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def _start_timer(self):
+        from django.conf import settings
+
+        self._timer = threading.Timer(settings.AUDITOR_BUFFER_TIMEOUT, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def record_event(self, event):
+        from django.conf import settings
+
+        event = self.serialize_event(event)
+        with self._lock:
+            self._buffer.append(event)
+            should_flush = len(self._buffer) >= settings.AUDITOR_BUFFER_SIZE
+            if not should_flush and self._timer is None:
+                self._start_timer()
+
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        from polyaxon.celery_api import celery_app
+        from polyaxon.settings import EventsCeleryTasks
+
+        with self._lock:
+            events, self._buffer = self._buffer, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if events:
+            celery_app.send_task(EventsCeleryTasks.EVENTS_RECORD_BATCH,
+                                 kwargs={'events': events})
+
+    def setup(self):
+        super().setup()
+        atexit.register(self.flush)
@@ -0,0 +1,26 @@
+from checks.base import Check
+from checks.results import Result
+from db.redis.lookups import RedisLookups
+
+
+class LookupsCheck(Check):
+
+    @staticmethod
+    def get_hit_rate_message(kind, hit_rate):
+        if hit_rate['hit_rate'] is None:
+            return '{} no requests'.format(kind)
+        return '{} {:.1%} of {} requests'.format(kind, hit_rate['hit_rate'], hit_rate['requests'])
+
+    @classmethod
+    def run(cls):
+        try:
+            hit_rates = RedisLookups.get_hit_rates()
+        except Exception as e:
+            return {'LOOKUPS': Result(
+                message='Service unable to connect, encountered error "{}".'.format(e),
+                severity=Result.ERROR)}
+
+        message = 'Cache hit rates: {}'.format(', '.join(
+            cls.get_hit_rate_message(kind=kind, hit_rate=hit_rates[kind])
+            for kind in RedisLookups.KINDS))
+        return {'LOOKUPS': Result(message=message)}
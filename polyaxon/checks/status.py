@@ -3,6 +3,7 @@ from checks.events import EventsCheck
 from checks.hpsearch import HPSearchCheck
 from checks.k8s_events import K8SEventsCheck
 from checks.logs import LogsCheck
+from checks.lookups import LookupsCheck
 from checks.pipelines import PipelinesCheck
 from checks.postgres import PostgresCheck
 from checks.rabbitmq import RabbitMQCheck
@@ -16,6 +17,7 @@ def get_status():
     status.update(CronsCheck.run())
     status.update(EventsCheck.run())
     status.update(LogsCheck.run())
+    status.update(LookupsCheck.run())
     status.update(K8SEventsCheck.run())
     status.update(HPSearchCheck.run())
     status.update(PipelinesCheck.run())
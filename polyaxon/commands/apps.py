@@ -8,3 +8,4 @@ class CommandsConfig(AppConfig):
     def ready(self):
         import signals.users  # noqa
         import signals.deletion  # noqa
+        import signals.lookups  # noqa
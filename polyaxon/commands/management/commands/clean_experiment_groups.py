@@ -8,7 +8,7 @@ class Command(BaseCleanCommand):
     @staticmethod
     def _clean():
         for experiment_group in ExperimentGroup.objects.filter(
-                status__status__in=ExperimentGroupLifeCycle.RUNNING_STATUS):
+                last_status__in=ExperimentGroupLifeCycle.RUNNING_STATUS):
             experiments_group_stop_experiments(
                 experiment_group_id=experiment_group.id,
                 pending=True,
@@ -8,7 +8,7 @@ class Command(BaseCleanCommand):
     @staticmethod
     def _clean():
         for experiment in Experiment.objects.filter(
-                status__status__in=ExperimentLifeCycle.RUNNING_STATUS):
+                last_status__in=ExperimentLifeCycle.RUNNING_STATUS):
             group = experiment.experiment_group
             experiment_scheduler.stop_experiment(
                 project_name=experiment.project.unique_name,
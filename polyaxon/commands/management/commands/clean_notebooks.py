@@ -8,7 +8,7 @@ class Command(BaseCleanCommand):
     @staticmethod
     def _clean():
         for job in NotebookJob.objects.filter(
-                status__status__in=JobLifeCycle.RUNNING_STATUS):
+                last_status__in=JobLifeCycle.RUNNING_STATUS):
             notebook_scheduler.stop_notebook(
                 project_name=job.project.unique_name,
                 project_uuid=job.project.uuid.hex,
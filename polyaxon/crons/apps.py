@@ -8,3 +8,4 @@ class CronsConfig(AppConfig):
     def ready(self):
         import signals.nodes  # noqa
         import signals.deletion  # noqa
+        import signals.lookups  # noqa
@@ -6,6 +6,7 @@ from db.models.jobs import Job
 from db.models.notebooks import NotebookJob
 from db.models.projects import Project
 from db.models.tensorboards import TensorboardJob
+from libs.deletion import delete_experiment, delete_experiment_group, delete_project
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import CleaningIntervals, CronsCeleryTasks
 
@@ -23,9 +24,11 @@ def delete_archived_projects():
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_PROJECT, ignore_result=True)
 def delete_archived_project(project_id):
     try:
-        Project.archived.get(id=project_id).delete()
+        project = Project.archived.get(id=project_id)
     except Project.DoesNotExist:
-        pass
+        return
+    # Deletes the subtree in batches, an interrupted deletion resumes on the next check
+    delete_project(project)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENT_GROUPS, ignore_result=True)
@@ -44,9 +47,10 @@ def delete_archived_experiment_groups():
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENT_GROUP, ignore_result=True)
 def delete_archived_experiment_group(group_id):
     try:
-        ExperimentGroup.archived.get(id=group_id).delete()
+        group = ExperimentGroup.archived.get(id=group_id)
     except ExperimentGroup.DoesNotExist:
-        pass
+        return
+    delete_experiment_group(group)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENTS, ignore_result=True)
@@ -68,9 +72,10 @@ def delete_archived_experiments():
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_EXPERIMENT, ignore_result=True)
 def delete_archived_experiment(experiment_id):
     try:
-        Experiment.archived.get(id=experiment_id).delete()
+        experiment = Experiment.archived.get(id=experiment_id)
     except Experiment.DoesNotExist:
-        pass
+        return
+    delete_experiment(experiment)
 
 
 @celery_app.task(name=CronsCeleryTasks.DELETE_ARCHIVED_JOBS, ignore_result=True)
@@ -1,17 +1,46 @@
-from django.db.models import Count
-
 from constants.experiments import ExperimentLifeCycle
+from db.models.experiment_jobs import ExperimentJob
 from db.models.experiments import Experiment
+from db.redis.statuses import RedisExperimentJobStatuses
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import CronsCeleryTasks, SchedulerCeleryTasks
 
 
+def load_experiments_job_statuses(experiment_ids):
+    """Loads the job statuses of the experiments missing from redis with one query."""
+    experiments_jobs = {experiment_id: [] for experiment_id in experiment_ids}
+    jobs = ExperimentJob.objects.filter(experiment_id__in=experiment_ids).values_list(
+        'experiment_id', 'id', 'role', 'last_status')
+    for experiment_id, job_id, role, status in jobs:
+        experiments_jobs[experiment_id].append((job_id, role, status))
+    RedisExperimentJobStatuses.load(experiments_jobs)
+    return {experiment_id: [(role, status) for _, role, status in jobs]
+            for experiment_id, jobs in experiments_jobs.items()}
+
+
 @celery_app.task(name=CronsCeleryTasks.EXPERIMENTS_SYNC_JOBS_STATUSES, ignore_result=True)
 def experiments_sync_jobs_statuses():
-    experiments = Experiment.objects.exclude(
-        status__status__in=ExperimentLifeCycle.DONE_STATUS)
-    experiments = experiments.annotate(num_jobs=Count('jobs')).filter(num_jobs__gt=0)
-    for experiment in experiments:
+    experiments = dict(Experiment.objects.exclude(
+        last_status__in=ExperimentLifeCycle.DONE_STATUS).values_list('id', 'last_status'))
+    experiments_job_statuses = RedisExperimentJobStatuses.get_experiments_job_statuses(
+        list(experiments.keys()))
+    missing_experiment_ids = [experiment_id for experiment_id, job_statuses
+                              in experiments_job_statuses.items() if job_statuses is None]
+    if missing_experiment_ids:
+        experiments_job_statuses.update(load_experiments_job_statuses(missing_experiment_ids))
+
+    # Only the experiments whose status is out of sync with their jobs need to be checked
+    experiments_to_check = []
+    for experiment_id, job_statuses in experiments_job_statuses.items():
+        if not job_statuses:
+            continue
+        last_status = experiments[experiment_id]
+        calculated_status = Experiment.get_calculated_status(job_statuses=job_statuses,
+                                                             last_status=last_status)
+        if calculated_status != last_status:
+            experiments_to_check.append(experiment_id)
+
+    for experiment_id in experiments_to_check:
         celery_app.send_task(
             SchedulerCeleryTasks.EXPERIMENTS_CHECK_STATUS,
-            kwargs={'experiment_id': experiment.id})
+            kwargs={'experiment_id': experiment_id})
@@ -1,15 +1,50 @@
+import logging
+import time
+
+import conf
+
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
 from db.models.build_jobs import BuildJob
 from db.models.experiments import Experiment
 from db.models.jobs import Job
+from db.redis.heartbeat import RedisHeartBeat
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import CronsCeleryTasks, SchedulerCeleryTasks
 
+_logger = logging.getLogger('polyaxon.crons.heartbeats')
+
+
+def sweep_heartbeats(queryset, get_dead, status, message):
+    """Check all heartbeats at once and only load the dead runs to mark them as failed.
+
+    The dead runs are loaded with the sweep's queryset, and without the deleted runs,
+    so that the runs deleted or stopped since they were listed are not marked as failed.
+    """
+    start = time.time()
+    ids = list(queryset.values_list('id', flat=True))
+    dead_ids = get_dead(ids)
+    runs = list(queryset.filter(id__in=dead_ids, deleted=False))
+    for run in runs:
+        run.set_status(status, message=message)
+    _logger.info('Heartbeat sweep of `%s` checked %s keys, found %s dead, '
+                 'skipped %s deleted or stopped, took %.3fs.',
+                 queryset.model.__name__, len(ids), len(dead_ids), len(dead_ids) - len(runs),
+                 time.time() - start)
+    return [run.id for run in runs]
+
 
 @celery_app.task(name=CronsCeleryTasks.HEARTBEAT_EXPERIMENTS, ignore_result=True)
 def heartbeat_experiments():
-    experiments = Experiment.objects.filter(status__status__in=ExperimentLifeCycle.HEARTBEAT_STATUS)
+    experiments = Experiment.objects.filter(last_status__in=ExperimentLifeCycle.HEARTBEAT_STATUS)
+    if conf.get('HEARTBEAT_SWEEP'):
+        sweep_heartbeats(
+            queryset=experiments,
+            get_dead=RedisHeartBeat.get_dead_experiments,
+            status=ExperimentLifeCycle.FAILED,
+            message='Experiment is in zombie state (no heartbeat was reported).')
+        return
+
     for experiment in experiments.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.EXPERIMENTS_CHECK_HEARTBEAT,
@@ -18,7 +53,15 @@ def heartbeat_experiments():
 
 @celery_app.task(name=CronsCeleryTasks.HEARTBEAT_JOBS, ignore_result=True)
 def heartbeat_jobs():
-    jobs = Job.objects.filter(status__status__in=JobLifeCycle.HEARTBEAT_STATUS)
+    jobs = Job.objects.filter(last_status__in=JobLifeCycle.HEARTBEAT_STATUS)
+    if conf.get('HEARTBEAT_SWEEP'):
+        sweep_heartbeats(
+            queryset=jobs,
+            get_dead=RedisHeartBeat.get_dead_jobs,
+            status=JobLifeCycle.FAILED,
+            message='Job is in zombie state (no heartbeat was reported).')
+        return
+
     for job in jobs.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.JOBS_CHECK_HEARTBEAT,
@@ -27,7 +70,15 @@ def heartbeat_jobs():
 
 @celery_app.task(name=CronsCeleryTasks.HEARTBEAT_BUILDS, ignore_result=True)
 def heartbeat_builds():
-    build_jobs = BuildJob.objects.filter(status__status__in=JobLifeCycle.HEARTBEAT_STATUS)
+    build_jobs = BuildJob.objects.filter(last_status__in=JobLifeCycle.HEARTBEAT_STATUS)
+    if conf.get('HEARTBEAT_SWEEP'):
+        sweep_heartbeats(
+            queryset=build_jobs,
+            get_dead=RedisHeartBeat.get_dead_builds,
+            status=JobLifeCycle.FAILED,
+            message='BuildJob is in zombie state (no heartbeat was reported).')
+        return
+
     for build_job in build_jobs.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.BUILD_JOBS_CHECK_HEARTBEAT,
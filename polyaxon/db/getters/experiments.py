@@ -1,6 +1,7 @@
 import logging
 
 from db.models.experiments import Experiment
+from db.redis.lookups import RedisLookups
 
 _logger = logging.getLogger('polyaxon.db')
 
@@ -22,6 +23,28 @@ def get_valid_experiment(experiment_id=None, experiment_uuid=None, include_delet
     return experiment
 
 
+def get_cached_experiment_ref(project, experiment_id):
+    """Returns a reference to the project's experiment, None if it does not exist.
+
+    Only the experiment's existence in the project is cached, the reference has the experiment's
+    id and project, e.g. to filter by the experiment or to send its id to a task.
+    The callers using any other field of the experiment must load it.
+    A concurrent deletion can leave a stale reference for at most the lookups' ttl.
+    """
+    lookup = '{}.{}'.format(project.id, experiment_id)
+    value = RedisLookups.get(kind=RedisLookups.EXPERIMENTS, lookup=lookup)
+    if not value:
+        value = Experiment.objects.filter(id=experiment_id, project=project).values('id').first()
+        if not value:
+            return None
+        RedisLookups.set(kind=RedisLookups.EXPERIMENTS,
+                         lookup=lookup,
+                         ref=value['id'],
+                         value=value)
+
+    return Experiment(id=value['id'], project=project)
+
+
 def is_experiment_still_running(experiment_id=None, experiment_uuid=None):
     experiment = get_valid_experiment(experiment_id=experiment_id, experiment_uuid=experiment_uuid)
 
@@ -1,6 +1,7 @@
 import logging
 
 from db.models.projects import Project
+from db.redis.lookups import RedisLookups
 
 _logger = logging.getLogger('polyaxon.db')
 
@@ -20,3 +21,19 @@ def get_valid_project(project_id=None, project_uuid=None, include_deleted=False)
         return None
 
     return project
+
+
+def get_cached_project(owner_name, project_name):
+    """Returns the project with its owner and user, None if it does not exist."""
+    lookup = '{}.{}'.format(owner_name, project_name)
+    project = RedisLookups.get(kind=RedisLookups.PROJECTS, lookup=lookup)
+    if project:
+        return project
+
+    try:
+        project = Project.objects.select_related('owner', 'user').get(owner__name=owner_name,
+                                                                      name=project_name)
+    except Project.DoesNotExist:
+        return None
+    RedisLookups.set(kind=RedisLookups.PROJECTS, lookup=lookup, ref=project.id, value=project)
+    return project
@@ -0,0 +1,16 @@
+from db.models.tokens import Token
+from db.redis.lookups import RedisLookups
+
+
+def get_cached_token(key):
+    """Returns the token with its user, None if the key is not valid."""
+    token = RedisLookups.get(kind=RedisLookups.TOKENS, lookup=key)
+    if token:
+        return token
+
+    try:
+        token = Token.objects.select_related('user').get(key=key)
+    except Token.DoesNotExist:
+        return None
+    RedisLookups.set(kind=RedisLookups.TOKENS, lookup=key, ref=token.user_id, value=token)
+    return token
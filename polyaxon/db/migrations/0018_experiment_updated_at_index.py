@@ -0,0 +1,17 @@
+# Generated by Django 2.1.3 on 2019-01-10 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0017_auto_20190104_2032'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experiment',
+            index=models.Index(fields=['project', 'updated_at', 'id'], name='db_experiment_updated_at'),
+        ),
+    ]
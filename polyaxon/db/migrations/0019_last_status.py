@@ -0,0 +1,78 @@
+# Generated by Django 2.1.3 on 2019-01-11 09:24
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+MODELS_STATUSES = (
+    ('BuildJob', 'BuildJobStatus'),
+    ('Experiment', 'ExperimentStatus'),
+    ('ExperimentGroup', 'ExperimentGroupStatus'),
+    ('ExperimentJob', 'ExperimentJobStatus'),
+    ('Job', 'JobStatus'),
+    ('NotebookJob', 'NotebookJobStatus'),
+    ('TensorboardJob', 'TensorboardJobStatus'),
+)
+
+
+def backfill_last_status(apps, schema_editor):
+    # One update per table, the last status is read from the status the model points to
+    for model_name, status_model_name in MODELS_STATUSES:
+        model = apps.get_model('db', model_name)
+        status_model = apps.get_model('db', status_model_name)
+        last_status = status_model.objects.filter(id=OuterRef('status_id')).values('status')[:1]
+        model.objects.filter(status__isnull=False).update(last_status=Subquery(last_status))
+
+
+def last_status_field():
+    return models.CharField(
+        blank=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.',
+        max_length=64,
+        null=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0018_experiment_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='buildjob',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.AddField(
+            model_name='experiment',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.AddField(
+            model_name='experimentgroup',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.AddField(
+            model_name='experimentjob',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.AddField(
+            model_name='notebookjob',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.AddField(
+            model_name='tensorboardjob',
+            name='last_status',
+            field=last_status_field(),
+        ),
+        migrations.RunPython(backfill_last_status, migrations.RunPython.noop),
+    ]
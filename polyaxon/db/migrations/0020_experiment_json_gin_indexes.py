@@ -0,0 +1,23 @@
+# Generated by Django 2.1.3 on 2019-01-14 10:05
+
+import django.contrib.postgres.indexes
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0019_last_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experiment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['last_metric'], name='db_experiment_last_metric'),
+        ),
+        migrations.AddIndex(
+            model_name='experiment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['declarations'], name='db_experiment_declarations'),
+        ),
+    ]
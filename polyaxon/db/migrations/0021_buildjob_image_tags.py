@@ -0,0 +1,23 @@
+# Generated by Django 2.1.3 on 2019-01-15 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0020_experiment_json_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='buildjob',
+            name='image_tag',
+            field=models.CharField(blank=True, help_text='The tag of the image created with this job.', max_length=128, null=True),
+        ),
+        migrations.AddField(
+            model_name='buildjob',
+            name='dependencies_image_tag',
+            field=models.CharField(blank=True, help_text='The tag of the dependencies image used as base of the image.', max_length=128, null=True),
+        ),
+    ]
@@ -4,6 +4,7 @@ from django.db import models
 from django.utils.functional import cached_property
 
 import conf
+import stats
 
 from constants.images_tags import LATEST_IMAGE_TAG
 from constants.k8s_jobs import DOCKERIZER_JOB_NAME, JOB_NAME_FORMAT
@@ -55,6 +56,16 @@ class BuildJob(AbstractJob,
         blank=True,
         null=True,
         help_text='The dockerfile used to create the image with this job.')
+    image_tag = models.CharField(
+        max_length=128,
+        blank=True,
+        null=True,
+        help_text='The tag of the image created with this job.')
+    dependencies_image_tag = models.CharField(
+        max_length=128,
+        blank=True,
+        null=True,
+        help_text='The tag of the dependencies image used as base of the image.')
     status = models.OneToOneField(
         'db.BuildJobStatus',
         related_name='+',
@@ -62,6 +73,12 @@ class BuildJob(AbstractJob,
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
 
     class Meta:
         app_label = 'db'
@@ -88,6 +105,7 @@ class BuildJob(AbstractJob,
     def _ping_heartbeat(self):
         RedisHeartBeat.build_ping(self.id)
 
+    @stats.timed('db.buildjob.set_status')
     def set_status(self,  # pylint:disable=arguments-differ
                    status,
                    created_at=None,
@@ -11,6 +11,8 @@ from django.db import models
 from django.db.models import Q
 from django.utils.functional import cached_property
 
+import stats
+
 from constants.experiment_groups import ExperimentGroupLifeCycle
 from constants.experiments import ExperimentLifeCycle
 from db.models.abstract_jobs import TensorboardJobMixin
@@ -28,6 +30,7 @@ from db.models.utils import (
     SubPathModel,
     TagModel
 )
+from db.redis.lookups import RedisLookups
 from libs.paths.experiment_groups import get_experiment_group_subpath
 from libs.spec_validation import validate_group_hptuning_config, validate_group_spec_content
 from schemas.hptuning import HPTuningConfig, Optimization
@@ -107,6 +110,12 @@ class ExperimentGroup(DiffModel,
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
 
     class Meta:
         app_label = 'db'
@@ -155,6 +164,7 @@ class ExperimentGroup(DiffModel,
             created_at__lte=status_date).last()
         return status.status if status else None
 
+    @stats.timed('db.experimentgroup.set_status')
     def set_status(self, status, created_at=None, message=None, traceback=None, **kwargs):
         status_from = self.last_status_before(status_date=created_at)
 
@@ -171,7 +181,10 @@ class ExperimentGroup(DiffModel,
     def archive(self):
         if not super().archive():
             return False
+        experiment_ids = list(self.experiments.values_list('id', flat=True))
         self.experiments.update(deleted=True)
+        # The update does not send the experiments' post_save signal
+        RedisLookups.invalidate_many(kind=RedisLookups.EXPERIMENTS, refs=experiment_ids)
         return True
 
     def unarchive(self):
@@ -241,42 +254,42 @@ class ExperimentGroup(DiffModel,
     @property
     def scheduled_experiments(self):
         return self.group_experiments.filter(
-            status__status=ExperimentLifeCycle.SCHEDULED).distinct()
+            last_status=ExperimentLifeCycle.SCHEDULED).distinct()
 
     @property
     def succeeded_experiments(self):
         return self.group_experiments.filter(
-            status__status=ExperimentLifeCycle.SUCCEEDED).distinct()
+            last_status=ExperimentLifeCycle.SUCCEEDED).distinct()
 
     @property
     def failed_experiments(self):
         return self.group_experiments.filter(
-            status__status=ExperimentLifeCycle.FAILED).distinct()
+            last_status=ExperimentLifeCycle.FAILED).distinct()
 
     @property
     def stopped_experiments(self):
         return self.group_experiments.filter(
-            status__status=ExperimentLifeCycle.STOPPED).distinct()
+            last_status=ExperimentLifeCycle.STOPPED).distinct()
 
     @property
     def pending_experiments(self):
         return self.group_experiments.filter(
-            status__status__in=ExperimentLifeCycle.PENDING_STATUS).distinct()
+            last_status__in=ExperimentLifeCycle.PENDING_STATUS).distinct()
 
     @property
     def running_experiments(self):
         return self.group_experiments.filter(
-            status__status__in=ExperimentLifeCycle.RUNNING_STATUS).distinct()
+            last_status__in=ExperimentLifeCycle.RUNNING_STATUS).distinct()
 
     @property
     def done_experiments(self):
         return self.group_experiments.filter(
-            status__status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
+            last_status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
 
     @property
     def non_done_experiments(self):
         return self.group_experiments.exclude(
-            status__status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
+            last_status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
 
     @property
     def n_experiments_to_start(self):
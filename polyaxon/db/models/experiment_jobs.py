@@ -2,6 +2,8 @@ from django.contrib.postgres.fields import JSONField
 from django.db import models
 from django.utils.functional import cached_property
 
+import stats
+
 from constants.k8s_jobs import EXPERIMENT_JOB_NAME_FORMAT
 from db.models.abstract_jobs import AbstractJob, AbstractJobStatus
 from db.models.unique_names import EXPERIMENT_JOB_UNIQUE_NAME_FORMAT
@@ -40,6 +42,12 @@ class ExperimentJob(AbstractJob, NodeSchedulingModel):
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
 
     class Meta:
         app_label = 'db'
@@ -60,6 +68,7 @@ class ExperimentJob(AbstractJob, NodeSchedulingModel):
             experiment_uuid=self.experiment.uuid.hex
         )
 
+    @stats.timed('db.experimentjob.set_status')
     def set_status(self,  # pylint:disable=arguments-differ
                    status,
                    created_at=None,
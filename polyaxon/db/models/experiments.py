@@ -2,11 +2,13 @@ import uuid
 
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils import timezone
 from django.utils.functional import cached_property
 
 import auditor
+import stats
 
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
@@ -29,6 +31,7 @@ from db.models.utils import (
     TagModel
 )
 from db.redis.heartbeat import RedisHeartBeat
+from db.redis.statuses import RedisExperimentJobStatuses
 from event_manager.events.experiment import (
     EXPERIMENT_COPIED,
     EXPERIMENT_RESTARTED,
@@ -119,6 +122,12 @@ class Experiment(DiffModel,
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
     last_metric = JSONField(
         blank=True,
         null=True,
@@ -133,6 +142,13 @@ class Experiment(DiffModel,
     class Meta:
         app_label = 'db'
         unique_together = (('project', 'name'),)
+        indexes = [
+            # The keyset pagination of the project's experiments
+            models.Index(fields=['project', 'updated_at', 'id'], name='db_experiment_updated_at'),
+            # The containment conditions of the queries on the metrics and declarations
+            GinIndex(fields=['last_metric'], name='db_experiment_last_metric'),
+            GinIndex(fields=['declarations'], name='db_experiment_declarations'),
+        ]
 
     @property
     def unique_name(self):
@@ -172,7 +188,7 @@ class Experiment(DiffModel,
     def last_job_statuses(self):
         """The last constants of the job in this experiment."""
         statuses = []
-        for status in self.jobs.values_list('status__status', flat=True):
+        for status in self.jobs.values_list('last_status', flat=True):
             if status is not None:
                 statuses.append(status)
         return statuses
@@ -180,18 +196,35 @@ class Experiment(DiffModel,
     @property
     def has_running_jobs(self):
         """"Return a boolean indicating if the experiment has any running jobs"""
-        return self.jobs.exclude(status__status__in=ExperimentLifeCycle.DONE_STATUS).exists()
+        return self.jobs.exclude(last_status__in=ExperimentLifeCycle.DONE_STATUS).exists()
 
     @property
-    def calculated_status(self):
-        master_status = self.jobs.filter(role=TaskType.MASTER)[0].last_status
+    def job_statuses(self):
+        """The (role, last_status) of the jobs in this experiment, cached in redis."""
+        job_statuses = RedisExperimentJobStatuses.get_job_statuses(self.id)
+        if job_statuses is None:
+            jobs = list(self.jobs.values_list('id', 'role', 'last_status'))
+            RedisExperimentJobStatuses.load({self.id: jobs})
+            job_statuses = [(role, status) for _, role, status in jobs]
+        return job_statuses
+
+    @staticmethod
+    def get_calculated_status(job_statuses, last_status):
+        master_status = next(
+            (status for role, status in job_statuses if role == TaskType.MASTER), None)
         calculated_status = master_status if JobLifeCycle.is_done(master_status) else None
         if calculated_status is None:
-            calculated_status = ExperimentLifeCycle.jobs_status(self.last_job_statuses)
+            calculated_status = ExperimentLifeCycle.jobs_status(
+                [status for _, status in job_statuses if status is not None])
         if calculated_status is None:
-            return self.last_status
+            return last_status
         return calculated_status
 
+    @property
+    def calculated_status(self):
+        return self.get_calculated_status(job_statuses=self.job_statuses,
+                                          last_status=self.last_status)
+
     @property
     def is_clone(self):
         return self.original_experiment is not None
@@ -243,6 +276,7 @@ class Experiment(DiffModel,
             created_at__lte=status_date).last()
         return status.status if status else None
 
+    @stats.timed('db.experiment.set_status')
     def set_status(self, status, created_at=None, message=None, traceback=None, **kwargs):
         if status in ExperimentLifeCycle.HEARTBEAT_STATUS:
             RedisHeartBeat.experiment_ping(self.id)
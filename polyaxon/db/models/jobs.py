@@ -4,6 +4,7 @@ from django.db import models
 from django.utils.functional import cached_property
 
 import auditor
+import stats
 
 from constants.k8s_jobs import JOB_NAME, JOB_NAME_FORMAT
 from db.models.abstract_jobs import AbstractJob, AbstractJobStatus, JobMixin
@@ -83,6 +84,12 @@ class Job(AbstractJob,
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
 
     class Meta:
         app_label = 'db'
@@ -129,6 +136,7 @@ class Job(AbstractJob,
     def _ping_heartbeat(self):
         RedisHeartBeat.job_ping(self.id)
 
+    @stats.timed('db.job.set_status')
     def set_status(self,  # pylint:disable=arguments-differ
                    status,
                    created_at=None,
@@ -2,6 +2,8 @@ from django.contrib.postgres.fields import JSONField
 from django.db import models
 from django.utils.functional import cached_property
 
+import stats
+
 from constants.k8s_jobs import JOB_NAME_FORMAT, NOTEBOOK_JOB_NAME
 from db.models.abstract_jobs import AbstractJobStatus, JobMixin
 from db.models.plugins import PluginJobBase
@@ -30,6 +32,12 @@ class NotebookJob(PluginJobBase, DataReference, JobMixin):
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
 
     class Meta:
         app_label = 'db'
@@ -52,6 +60,7 @@ class NotebookJob(PluginJobBase, DataReference, JobMixin):
     def specification(self):
         return NotebookSpecification(values=self.config)
 
+    @stats.timed('db.notebookjob.set_status')
     def set_status(self,  # pylint:disable=arguments-differ
                    status,
                    created_at=None,
@@ -333,6 +333,10 @@ class RunModel(DiffModel, RunTimeModel, DeletedModel, LastStatusMixin):
     class Meta:
         abstract = True
 
+    @property
+    def last_status(self):
+        return self.status.status if self.status else None
+
     @property
     def skipped(self):
         return self.STATUSES.skipped(self.last_status)
@@ -44,7 +44,7 @@ class LastStatusMixin(object):
     """A mixin that extracts the logic of last_status.
 
     This is an abstract class, every subclass must implement a status attribute,
-    as well as a last_status attribute:
+    as well as a last_status attribute, a column kept in sync with the status:
 
     e.g.
 
@@ -55,13 +55,14 @@ class LastStatusMixin(object):
         null=True,
         editable=True,
         on_delete=db.SET_NULL)
+    last_status = db.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True)
     """
     STATUSES = None
 
-    @property
-    def last_status(self):
-        return self.status.status if self.status else None
-
     @property
     def is_running(self):
         return self.STATUSES.is_running(self.last_status)
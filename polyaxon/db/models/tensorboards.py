@@ -2,6 +2,8 @@ from django.contrib.postgres.fields import JSONField
 from django.db import models
 from django.utils.functional import cached_property
 
+import stats
+
 from constants.k8s_jobs import JOB_NAME_FORMAT, TENSORBOARD_JOB_NAME
 from db.models.abstract_jobs import AbstractJobStatus, JobMixin
 from db.models.outputs import OutputsRefsSpec
@@ -40,6 +42,12 @@ class TensorboardJob(PluginJobBase, JobMixin):
         null=True,
         editable=True,
         on_delete=models.SET_NULL)
+    last_status = models.CharField(
+        max_length=64,
+        blank=True,
+        null=True,
+        db_index=True,
+        help_text='The value of the last status, kept in sync by the statuses signals.')
 
     class Meta:
         app_label = 'db'
@@ -62,6 +70,7 @@ class TensorboardJob(PluginJobBase, JobMixin):
     def specification(self):
         return TensorboardSpecification(values=self.config)
 
+    @stats.timed('db.tensorboardjob.set_status')
     def set_status(self,  # pylint:disable=arguments-differ
                    status,
                    created_at=None,
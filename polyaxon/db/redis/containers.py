@@ -39,6 +39,38 @@ class RedisJobContainers(BaseRedisDb):
             return job_uuid, experiment_uuid
         return None, None
 
+    @classmethod
+    def get_jobs(cls, container_ids):
+        """Return a mapping of container id to (job_uuid, experiment_uuid) in 2 round trips."""
+        if not container_ids:
+            return {}
+
+        red = cls._get_redis()
+        job_uuids = red.hmget(cls.KEY_CONTAINERS_TO_JOBS, container_ids)
+        job_uuids = [job_uuid.decode('utf-8') if job_uuid else None for job_uuid in job_uuids]
+        known_job_uuids = [job_uuid for job_uuid in job_uuids if job_uuid]
+        experiment_uuids = {}
+        if known_job_uuids:
+            values = red.hmget(cls.KEY_JOBS_TO_EXPERIMENTS, known_job_uuids)
+            experiment_uuids = {
+                job_uuid: experiment_uuid.decode('utf-8') if experiment_uuid else None
+                for job_uuid, experiment_uuid in zip(known_job_uuids, values)
+            }
+        return {
+            container_id: (job_uuid, experiment_uuids.get(job_uuid))
+            for container_id, job_uuid in zip(container_ids, job_uuids) if job_uuid
+        }
+
+    @classmethod
+    def remove_containers(cls, container_ids):
+        if not container_ids:
+            return
+
+        pipe = cls._get_redis().pipeline(transaction=False)
+        pipe.srem(cls.KEY_CONTAINERS, *container_ids)
+        pipe.hdel(cls.KEY_CONTAINERS_TO_JOBS, *container_ids)
+        pipe.execute()
+
     @classmethod
     def remove_container(cls, container_id, red=None):
         red = red or cls._get_redis()
@@ -47,16 +79,28 @@ class RedisJobContainers(BaseRedisDb):
 
     @classmethod
     def remove_job(cls, job_uuid):
-        red = cls._get_redis()
-        key_jobs_to_containers = cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid)
-        containers = red.smembers(key_jobs_to_containers)
-        for container_id in containers:
-            container_id = container_id.decode('utf-8')
-            red.srem(key_jobs_to_containers, container_id)
-            cls.remove_container(container_id=container_id, red=red)
+        cls.remove_jobs([job_uuid])
+
+    @classmethod
+    def remove_jobs(cls, job_uuids):
+        """Remove the jobs and their containers in one transaction."""
+        if not job_uuids:
+            return
+
+        keys_jobs_to_containers = [cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid)
+                                   for job_uuid in job_uuids]
+
+        def remove(pipe):
+            container_ids = pipe.sunion(keys_jobs_to_containers)
+            pipe.multi()
+            if container_ids:
+                pipe.srem(cls.KEY_CONTAINERS, *container_ids)
+                pipe.hdel(cls.KEY_CONTAINERS_TO_JOBS, *container_ids)
+            pipe.delete(*keys_jobs_to_containers)
+            # Remove the experiment too
+            pipe.hdel(cls.KEY_JOBS_TO_EXPERIMENTS, *job_uuids)
 
-        # Remove the experiment too
-        red.hdel(cls.KEY_CONTAINERS_TO_JOBS, job_uuid)
+        cls._get_redis().transaction(remove, *keys_jobs_to_containers)
 
     @classmethod
     def monitor(cls, container_id, job_uuid):
@@ -69,9 +113,11 @@ class RedisJobContainers(BaseRedisDb):
             except ExperimentJob.DoesNotExist:
                 return
 
-            red.sadd(cls.KEY_CONTAINERS, container_id)
-            red.hset(cls.KEY_CONTAINERS_TO_JOBS, container_id, job_uuid)
+            pipe = red.pipeline()
+            pipe.sadd(cls.KEY_CONTAINERS, container_id)
+            pipe.hset(cls.KEY_CONTAINERS_TO_JOBS, container_id, job_uuid)
             # Add container for job
-            red.sadd(cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid), container_id)
+            pipe.sadd(cls.KEY_JOBS_TO_CONTAINERS.format(job_uuid), container_id)
             # Add job to experiment
-            red.hset(cls.KEY_JOBS_TO_EXPERIMENTS, job_uuid, job.experiment.uuid.hex)
+            pipe.hset(cls.KEY_JOBS_TO_EXPERIMENTS, job_uuid, job.experiment.uuid.hex)
+            pipe.execute()
@@ -11,6 +11,7 @@ class RedisHeartBeat(BaseRedisDb):
     KEY_EXPERIMENT = 'heartbeat.experiment:{}'
     KEY_JOB = 'heartbeat.job:{}'
     KEY_BUILD = 'heartbeat.build:{}'
+    SWEEP_CHUNK_SIZE = 1000
 
     # A Run should report under this value, otherwise it could be considered zombie
     REDIS_POOL = RedisPools.HEARTBEAT
@@ -97,3 +98,27 @@ class RedisHeartBeat(BaseRedisDb):
     def build_is_alive(cls, build_id):
         heart_beat = RedisHeartBeat(build=build_id)
         return heart_beat.is_alive()
+
+    @classmethod
+    def _get_dead(cls, key_format, ids):
+        """Check the heartbeats of all ids with one round trip of chunked MGETs."""
+        if not ids:
+            return []
+
+        pipe = cls._get_redis().pipeline(transaction=False)
+        for i in range(0, len(ids), cls.SWEEP_CHUNK_SIZE):
+            pipe.mget([key_format.format(key) for key in ids[i:i + cls.SWEEP_CHUNK_SIZE]])
+        values = [value for chunk in pipe.execute() for value in chunk]
+        return [key for key, value in zip(ids, values) if not value]
+
+    @classmethod
+    def get_dead_experiments(cls, experiment_ids):
+        return cls._get_dead(key_format=cls.KEY_EXPERIMENT, ids=experiment_ids)
+
+    @classmethod
+    def get_dead_jobs(cls, job_ids):
+        return cls._get_dead(key_format=cls.KEY_JOB, ids=job_ids)
+
+    @classmethod
+    def get_dead_builds(cls, build_ids):
+        return cls._get_dead(key_format=cls.KEY_BUILD, ids=build_ids)
@@ -0,0 +1,29 @@
+import conf
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisImages(BaseRedisDb):
+    """
+    RedisImages provides a db to cache the images known to exist in the registry.
+
+    Only the positive results are cached, an image can be pushed at any time.
+    """
+    KEY_IMAGE = 'images.exists:{}'
+
+    REDIS_POOL = RedisPools.IMAGES
+
+    @classmethod
+    def exists(cls, tagged_image):
+        return bool(cls._get_redis().get(cls.KEY_IMAGE.format(tagged_image)))
+
+    @classmethod
+    def set_exists(cls, tagged_image):
+        cls._get_redis().setex(name=cls.KEY_IMAGE.format(tagged_image),
+                               value=1,
+                               time=conf.get('TTL_IMAGE_EXISTS'))
+
+    @classmethod
+    def clear(cls, tagged_image):
+        cls._get_redis().delete(cls.KEY_IMAGE.format(tagged_image))
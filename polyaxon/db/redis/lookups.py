@@ -0,0 +1,88 @@
+import pickle
+
+import conf
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisLookups(BaseRedisDb):
+    """
+    RedisLookups provides a short lived cache of the objects resolved by the api's endpoints,
+    i.e. the tokens by key, the projects by owner and name, and the experiments' ids by project.
+
+    Every cached lookup is referenced by the id of the object owning it,
+    e.g. the user of a token, to invalidate all its lookups when the object changes.
+    The requests and misses are counted by kind to monitor the hit rates.
+    """
+    TOKENS = 'tokens'
+    PROJECTS = 'projects'
+    EXPERIMENTS = 'experiments'
+    KINDS = (TOKENS, PROJECTS, EXPERIMENTS)
+
+    KEY_LOOKUP = 'lookups.{}:{}'
+    KEY_REFS = 'lookups.refs.{}:{}'
+    KEY_REQUESTS = 'lookups.requests:{}'
+    KEY_MISSES = 'lookups.misses:{}'
+
+    REDIS_POOL = RedisPools.LOOKUPS
+
+    @classmethod
+    def get(cls, kind, lookup):
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        pipe.get(cls.KEY_LOOKUP.format(kind, lookup))
+        pipe.incr(cls.KEY_REQUESTS.format(kind))
+        value, _ = pipe.execute()
+        if value is None:
+            red.incr(cls.KEY_MISSES.format(kind))
+            return None
+        return pickle.loads(value)
+
+    @classmethod
+    def set(cls, kind, lookup, ref, value):
+        key = cls.KEY_LOOKUP.format(kind, lookup)
+        refs_key = cls.KEY_REFS.format(kind, ref)
+        ttl = conf.get('TTL_LOOKUPS')
+        pipe = cls._get_redis().pipeline()
+        pipe.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ex=ttl)
+        pipe.sadd(refs_key, key)
+        pipe.expire(refs_key, ttl)
+        pipe.execute()
+
+    @classmethod
+    def invalidate(cls, kind, ref):
+        cls.invalidate_many(kind=kind, refs=[ref])
+
+    @classmethod
+    def invalidate_many(cls, kind, refs):
+        if not refs:
+            return
+
+        refs_keys = [cls.KEY_REFS.format(kind, ref) for ref in refs]
+        red = cls._get_redis()
+        pipe = red.pipeline(transaction=False)
+        for refs_key in refs_keys:
+            pipe.smembers(refs_key)
+        keys = set().union(*pipe.execute())
+        red.delete(*refs_keys, *keys)
+
+    @classmethod
+    def get_hit_rates(cls):
+        """Returns the number of requests, misses and the hit rate of every kind of lookup."""
+        pipe = cls._get_redis().pipeline(transaction=False)
+        for kind in cls.KINDS:
+            pipe.get(cls.KEY_REQUESTS.format(kind))
+            pipe.get(cls.KEY_MISSES.format(kind))
+        values = iter(pipe.execute())
+
+        hit_rates = {}
+        for kind in cls.KINDS:
+            requests = int(next(values) or 0)
+            misses = int(next(values) or 0)
+            hit_rates[kind] = {
+                'requests': requests,
+                'misses': misses,
+                'hit_rate': (requests - misses) / requests if requests else None,
+            }
+        return hit_rates
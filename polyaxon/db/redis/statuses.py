@@ -0,0 +1,84 @@
+import conf
+
+from db.redis.base import BaseRedisDb
+from polyaxon.settings import RedisPools
+
+
+class RedisExperimentJobStatuses(BaseRedisDb):
+    """
+    RedisExperimentJobStatuses provides a db to store the experiments' job statuses vectors.
+
+    Every job status write updates the job's `role:status` field of its experiment's hash,
+    the vector is only used once it was loaded from the db, i.e. once it has the loaded field.
+    The loading never overwrites the fields, so it can not revert a concurrent job status write.
+    """
+    KEY_JOB_STATUSES = 'experiment.job_statuses:{}'
+    FIELD_LOADED = '_loaded'
+
+    REDIS_POOL = RedisPools.STATUSES
+
+    @staticmethod
+    def _encode(role, status):
+        return '{}:{}'.format(role, status or '')
+
+    @staticmethod
+    def _decode(value):
+        role, status = value.decode('utf-8').split(':', 1)
+        return role, status or None
+
+    @classmethod
+    def _get_job_statuses(cls, value):
+        if not value or cls.FIELD_LOADED.encode('utf-8') not in value:
+            return None
+        return [cls._decode(v) for k, v in value.items()
+                if k.decode('utf-8') != cls.FIELD_LOADED]
+
+    @classmethod
+    def set_job_status(cls, experiment_id, job_id, role, status):
+        key = cls.KEY_JOB_STATUSES.format(experiment_id)
+        pipe = cls._get_redis().pipeline()
+        pipe.hset(key, job_id, cls._encode(role=role, status=status))
+        pipe.expire(key, conf.get('TTL_EXPERIMENT_JOB_STATUSES'))
+        pipe.execute()
+
+    @classmethod
+    def load(cls, experiments_jobs):
+        """Loads the vectors of the experiments.
+
+        Args:
+            experiments_jobs: `dict` {experiment_id: [(job_id, role, status)]}.
+        """
+        if not experiments_jobs:
+            return
+
+        ttl = conf.get('TTL_EXPERIMENT_JOB_STATUSES')
+        pipe = cls._get_redis().pipeline()
+        for experiment_id, jobs in experiments_jobs.items():
+            key = cls.KEY_JOB_STATUSES.format(experiment_id)
+            for job_id, role, status in jobs:
+                pipe.hsetnx(key, job_id, cls._encode(role=role, status=status))
+            pipe.hset(key, cls.FIELD_LOADED, 1)
+            pipe.expire(key, ttl)
+        pipe.execute()
+
+    @classmethod
+    def get_job_statuses(cls, experiment_id):
+        """Returns the [(role, status)] of the experiment's jobs, None if not loaded."""
+        value = cls._get_redis().hgetall(cls.KEY_JOB_STATUSES.format(experiment_id))
+        return cls._get_job_statuses(value)
+
+    @classmethod
+    def get_experiments_job_statuses(cls, experiment_ids):
+        """Returns the job statuses of the experiments with one round trip."""
+        if not experiment_ids:
+            return {}
+
+        pipe = cls._get_redis().pipeline(transaction=False)
+        for experiment_id in experiment_ids:
+            pipe.hgetall(cls.KEY_JOB_STATUSES.format(experiment_id))
+        return {experiment_id: cls._get_job_statuses(value)
+                for experiment_id, value in zip(experiment_ids, pipe.execute())}
+
+    @classmethod
+    def clear(cls, experiment_id):
+        cls._get_redis().delete(cls.KEY_JOB_STATUSES.format(experiment_id))
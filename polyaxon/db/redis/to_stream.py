@@ -63,6 +63,44 @@ class RedisToStream(BaseRedisDb):
     def is_monitored_experiment_logs(cls, experiment_uuid):
         return cls._is_monitored(cls.KEY_EXPERIMENT_LOGS, experiment_uuid)
 
+    @classmethod
+    def _is_monitored_job_or_experiment(cls, job_key, experiment_key, job_uuid, experiment_uuid):
+        pipe = cls._get_redis().pipeline(transaction=False)
+        pipe.sismember(job_key, job_uuid)
+        pipe.sismember(experiment_key, experiment_uuid or '')
+        return any(pipe.execute())
+
+    @classmethod
+    def is_monitored_job_or_experiment_resources(cls, job_uuid, experiment_uuid):
+        return cls._is_monitored_job_or_experiment(job_key=cls.KEY_JOB_RESOURCES,
+                                                   experiment_key=cls.KEY_EXPERIMENT_RESOURCES,
+                                                   job_uuid=job_uuid,
+                                                   experiment_uuid=experiment_uuid)
+
+    @classmethod
+    def is_monitored_job_or_experiment_logs(cls, job_uuid, experiment_uuid):
+        return cls._is_monitored_job_or_experiment(job_key=cls.KEY_JOB_LOGS,
+                                                   experiment_key=cls.KEY_EXPERIMENT_LOGS,
+                                                   job_uuid=job_uuid,
+                                                   experiment_uuid=experiment_uuid)
+
+    @classmethod
+    def get_monitored_jobs_resources(cls, jobs):
+        """Return the job uuids, from a list of (job_uuid, experiment_uuid),
+        that are monitored directly or through their experiment, in one round trip.
+        """
+        if not jobs:
+            return set([])
+
+        pipe = cls._get_redis().pipeline(transaction=False)
+        for job_uuid, experiment_uuid in jobs:
+            pipe.sismember(cls.KEY_JOB_RESOURCES, job_uuid)
+            pipe.sismember(cls.KEY_EXPERIMENT_RESOURCES, experiment_uuid or '')
+        results = pipe.execute()
+        return set([
+            job_uuid for i, (job_uuid, _) in enumerate(jobs) if results[2 * i] or results[2 * i + 1]
+        ])
+
     @classmethod
     def _remove_object(cls, key, object_id):
         red = cls._get_redis()
@@ -84,29 +122,42 @@ class RedisToStream(BaseRedisDb):
     def remove_experiment_logs(cls, experiment_uuid):
         cls._remove_object(cls.KEY_EXPERIMENT_LOGS, experiment_uuid)
 
+    @staticmethod
+    def _load_resources(resources, job_name):
+        resources = json.loads(resources.decode('utf-8'))
+        resources['job_name'] = job_name
+        return resources
+
     @classmethod
     def get_latest_job_resources(cls, job, job_name, as_json=False):
         red = cls._get_redis()
         resources = red.hget(cls.KEY_JOB_LATEST_STATS, job)
         if resources:
-            resources = resources.decode('utf-8')
-            resources = json.loads(resources)
-            resources['job_name'] = job_name
+            resources = cls._load_resources(resources=resources, job_name=job_name)
             return resources if as_json else json.dumps(resources)
         return None
 
     @classmethod
     def get_latest_experiment_resources(cls, jobs, as_json=False):
+        """Return the latest resources of the experiment's jobs in one round trip."""
         stats = []
-        for job in jobs:
-            job_resources = cls.get_latest_job_resources(job=job['uuid'],
-                                                         job_name=job['name'],
-                                                         as_json=True)
-            if job_resources:
-                stats.append(job_resources)
+        if jobs:
+            red = cls._get_redis()
+            values = red.hmget(cls.KEY_JOB_LATEST_STATS, [job['uuid'] for job in jobs])
+            stats = [cls._load_resources(resources=resources, job_name=job['name'])
+                     for job, resources in zip(jobs, values) if resources]
         return stats if as_json else json.dumps(stats)
 
     @classmethod
     def set_latest_job_resources(cls, job, payload):
         red = cls._get_redis()
         red.hset(cls.KEY_JOB_LATEST_STATS, job, json.dumps(payload))
+
+    @classmethod
+    def set_latest_jobs_resources(cls, payloads):
+        """Set the latest resources of many jobs, `payloads` maps job uuids to payloads."""
+        if not payloads:
+            return
+        red = cls._get_redis()
+        red.hmset(cls.KEY_JOB_LATEST_STATS,
+                  {job: json.dumps(payload) for job, payload in payloads.items()})
@@ -0,0 +1,94 @@
+import logging
+
+import requests
+
+from requests import RequestException
+
+import conf
+
+from db.redis.images import RedisImages
+
+_logger = logging.getLogger('polyaxon.dockerizer.images')
+
+MANIFEST_MEDIA_TYPES = (
+    'application/vnd.docker.distribution.manifest.v2+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.docker.distribution.manifest.v1+prettyjws',
+)
+
+
+def get_registry_url(registry_host):
+    """Return the registry's api url.
+
+    The internal registry is reached through its service,
+    the images' host is the node port used by the docker daemons.
+    """
+    host_name = conf.get('REGISTRY_HOST_NAME')
+    port = conf.get('REGISTRY_PORT')
+    if registry_host == conf.get('REGISTRY_HOST') and host_name and port:
+        registry_host = '{}:{}'.format(host_name, port)
+    return 'http://{}'.format(registry_host)
+
+
+def get_manifest_url(image_name, image_tag):
+    registry_host, repository = image_name.split('/', 1)
+    return '{}/v2/{}/manifests/{}'.format(get_registry_url(registry_host), repository, image_tag)
+
+
+def manifest_exists(image_name, image_tag):
+    """Check if the image's manifest exists in the registry, without pulling it.
+
+    Returns None if the registry could not tell.
+    """
+    if '/' not in image_name:
+        return None
+
+    url = get_manifest_url(image_name=image_name, image_tag=image_tag)
+    user = conf.get('REGISTRY_USER')
+    password = conf.get('REGISTRY_PASSWORD')
+    try:
+        response = requests.head(url,
+                                 headers={'Accept': ', '.join(MANIFEST_MEDIA_TYPES)},
+                                 auth=(user, password) if user and password else None,
+                                 timeout=conf.get('REGISTRY_TIMEOUT'))
+    except RequestException as e:
+        _logger.info('Could not check the manifest `%s`: %s', url, e)
+        return None
+
+    if response.status_code == requests.codes.ok:
+        return True
+    if response.status_code == requests.codes.not_found:
+        return False
+    _logger.info('Could not check the manifest `%s`, status code %s',
+                 url, response.status_code)
+    return None
+
+
+def docker_image_exists(tagged_image, docker=None):
+    if docker is None:
+        from docker import APIClient
+
+        docker = APIClient(version='auto')
+    return bool(docker.images(tagged_image))
+
+
+def image_exists(image_name, image_tag, docker=None):
+    """Check if the image exists, the positive results are cached.
+
+    The registry is asked first,
+    the docker daemon is only asked if the registry could not tell.
+    """
+    tagged_image = '{}:{}'.format(image_name, image_tag)
+    if RedisImages.exists(tagged_image):
+        return True
+
+    exists = manifest_exists(image_name=image_name, image_tag=image_tag)
+    if exists is None:
+        exists = docker_image_exists(tagged_image=tagged_image, docker=docker)
+    if exists:
+        RedisImages.set_exists(tagged_image)
+    return exists
+
+
+def set_image_exists(image_name, image_tag):
+    RedisImages.set_exists('{}:{}'.format(image_name, image_tag))
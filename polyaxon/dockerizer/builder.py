@@ -1,3 +1,4 @@
+import hashlib
 import jinja2
 import json
 import logging
@@ -16,8 +17,13 @@ import conf
 
 from constants.jobs import JobLifeCycle
 from db.redis.heartbeat import RedisHeartBeat
-from docker_images.image_info import get_image_name, get_tagged_image
-from dockerizer.dockerfile import POLYAXON_DOCKER_TEMPLATE
+from docker_images.image_info import get_image_info, get_image_name, get_tagged_image
+from docker_images.registry import image_exists, set_image_exists
+from dockerizer.dockerfile import (
+    POLYAXON_CODE_DOCKER_TEMPLATE,
+    POLYAXON_DEPENDENCIES_DOCKER_TEMPLATE,
+    POLYAXON_DOCKER_TEMPLATE
+)
 from libs.http import download, untar_file
 from libs.paths.utils import delete_path
 from polyaxon.celery_api import celery_app
@@ -28,6 +34,7 @@ _logger = logging.getLogger('polyaxon.dockerizer')
 
 class DockerBuilder(object):
     LATEST_IMAGE_TAG = 'latest'
+    DEPENDENCIES_IMAGE_TAG_PREFIX = 'deps-'
     WORKDIR = '/code'
     HEART_BEAT_INTERVAL = 60
 
@@ -64,7 +71,9 @@ class DockerBuilder(object):
         return get_tagged_image(self.build_job)
 
     def check_image(self):
-        return self.docker.images(self.get_tagged_image())
+        return image_exists(image_name=self.image_name,
+                            image_tag=self.image_tag,
+                            docker=self.docker)
 
     def clean(self):
         # Clean dockerfile
@@ -178,10 +187,8 @@ class DockerBuilder(object):
             return setup_file
         return None
 
-    def render(self):
-        docker_template = jinja2.Template(POLYAXON_DOCKER_TEMPLATE)
-        return docker_template.render(
-            from_image=self.from_image,
+    def _get_render_context(self):
+        return dict(
             polyaxon_requirements_path=self.polyaxon_requirements_path,
             polyaxon_setup_path=self.polyaxon_setup_path,
             build_steps=self.build_steps,
@@ -192,12 +199,40 @@ class DockerBuilder(object):
             copy_code=self.copy_code
         )
 
-    def build(self, nocache=False, memory_limit=None):
-        _logger.debug('Starting build for `%s`', self.repo_path)
-        # Checkout to the correct commit
-        # if self.image_tag != self.LATEST_IMAGE_TAG:
-        #     git.checkout_commit(repo_path=self.repo_path, commit=self.image_tag)
-
+    def render(self):
+        docker_template = jinja2.Template(POLYAXON_DOCKER_TEMPLATE)
+        return docker_template.render(from_image=self.from_image, **self._get_render_context())
+
+    def render_dependencies(self):
+        docker_template = jinja2.Template(POLYAXON_DEPENDENCIES_DOCKER_TEMPLATE)
+        return docker_template.render(from_image=self.from_image, **self._get_render_context())
+
+    def render_code(self, dependencies_image):
+        docker_template = jinja2.Template(POLYAXON_CODE_DOCKER_TEMPLATE)
+        return docker_template.render(from_image=dependencies_image,
+                                      **self._get_render_context())
+
+    def get_dependencies_image_tag(self):
+        """Return a tag derived from the dependencies' dockerfile and copied files."""
+        dependencies_hash = hashlib.sha256(self.render_dependencies().encode('utf-8'))
+        for path in [self.polyaxon_requirements_path, self.polyaxon_setup_path]:
+            if not path:
+                continue
+            dependencies_hash.update(path.encode('utf-8'))
+            with open(os.path.join(self.build_path, path), 'rb') as dependencies_file:
+                for chunk in iter(lambda: dependencies_file.read(64 * 1024), b''):
+                    dependencies_hash.update(chunk)
+        return '{}{}'.format(self.DEPENDENCIES_IMAGE_TAG_PREFIX, dependencies_hash.hexdigest())
+
+    def set_dockerfile(self, dockerfile, dependencies_image_tag=None):
+        celery_app.send_task(
+            SchedulerCeleryTasks.BUILD_JOBS_SET_DOCKERFILE,
+            kwargs={'build_job_uuid': self.job_uuid,
+                    'dockerfile': dockerfile,
+                    'image_tag': self.image_tag,
+                    'dependencies_image_tag': dependencies_image_tag})
+
+    def _build(self, dockerfile, image_tag, nocache=False, memory_limit=None):
         limits = {
             # Disable memory swap for building
             'memswap': -1
@@ -206,16 +241,12 @@ class DockerBuilder(object):
             limits['memory'] = memory_limit
 
         # Create DockerFile
-        with open(self.dockerfile_path, 'w') as dockerfile:
-            rendered_dockerfile = self.render()
-            celery_app.send_task(
-                SchedulerCeleryTasks.BUILD_JOBS_SET_DOCKERFILE,
-                kwargs={'build_job_uuid': self.job_uuid, 'dockerfile': rendered_dockerfile})
-            dockerfile.write(rendered_dockerfile)
+        with open(self.dockerfile_path, 'w') as dockerfile_file:
+            dockerfile_file.write(dockerfile)
 
         stream = self.docker.build(
             path=self.build_path,
-            tag=self.get_tagged_image(),
+            tag='{}:{}'.format(self.image_name, image_tag),
             forcerm=True,
             rm=True,
             pull=True,
@@ -223,8 +254,52 @@ class DockerBuilder(object):
             container_limits=limits)
         return self._handle_log_stream(stream=stream)
 
-    def push(self):
-        stream = self.docker.push(self.image_name, tag=self.image_tag, stream=True)
+    def build(self, nocache=False, memory_limit=None):
+        _logger.debug('Starting build for `%s`', self.repo_path)
+        # Checkout to the correct commit
+        # if self.image_tag != self.LATEST_IMAGE_TAG:
+        #     git.checkout_commit(repo_path=self.repo_path, commit=self.image_tag)
+
+        rendered_dockerfile = self.render()
+        self.set_dockerfile(dockerfile=rendered_dockerfile)
+        return self._build(dockerfile=rendered_dockerfile,
+                           image_tag=self.image_tag,
+                           nocache=nocache,
+                           memory_limit=memory_limit)
+
+    def build_with_dependencies_image(self, nocache=False, memory_limit=None):
+        """Build the image from a dependencies image, built and pushed once per dependencies.
+
+        The image of a new commit with the same dependencies only adds the code's layer.
+        """
+        _logger.debug('Starting build with dependencies image for `%s`', self.repo_path)
+        dependencies_image_tag = self.get_dependencies_image_tag()
+        dependencies_image = '{}:{}'.format(self.image_name, dependencies_image_tag)
+        dependencies_dockerfile = self.render_dependencies()
+        code_dockerfile = self.render_code(dependencies_image=dependencies_image)
+        self.set_dockerfile(dockerfile=dependencies_dockerfile + code_dockerfile,
+                            dependencies_image_tag=dependencies_image_tag)
+
+        if nocache or not image_exists(image_name=self.image_name,
+                                       image_tag=dependencies_image_tag,
+                                       docker=self.docker):
+            _logger.info('Building dependencies image `%s`', dependencies_image)
+            if not self._build(dockerfile=dependencies_dockerfile,
+                               image_tag=dependencies_image_tag,
+                               nocache=nocache,
+                               memory_limit=memory_limit):
+                return False
+            if not self.push(image_tag=dependencies_image_tag):
+                return False
+            set_image_exists(image_name=self.image_name, image_tag=dependencies_image_tag)
+
+        return self._build(dockerfile=code_dockerfile,
+                           image_tag=self.image_tag,
+                           nocache=nocache,
+                           memory_limit=memory_limit)
+
+    def push(self, image_tag=None):
+        stream = self.docker.push(self.image_name, tag=image_tag or self.image_tag, stream=True)
         return self._handle_log_stream(stream=stream)
 
 
@@ -304,6 +379,12 @@ def download_code(build_job, build_path, filename):
 
 def build(build_job):
     """Build necessary code for a job to run"""
+    image_name, image_tag = get_image_info(build_job=build_job)
+    if image_exists(image_name=image_name, image_tag=image_tag):
+        # Image already built, no need to download the code
+        _logger.info('Image `%s:%s` already exists', image_name, image_tag)
+        return True
+
     build_path = '/tmp/build'
     filename = '_code'
     status = download_code(
@@ -323,12 +404,12 @@ def build(build_job):
         env_vars=build_job.env_vars)
     docker_builder.login_internal_registry()
     docker_builder.login_private_registries()
-    if docker_builder.check_image():
-        # Image already built
-        docker_builder.clean()
-        return True
     nocache = True if build_job.specification.build.nocache is True else False
-    if not docker_builder.build(nocache=nocache):
+    if conf.get('DOCKERIZER_DEPENDENCIES_IMAGES'):
+        status = docker_builder.build_with_dependencies_image(nocache=nocache)
+    else:
+        status = docker_builder.build(nocache=nocache)
+    if not status:
         docker_builder.clean()
         return False
     if not docker_builder.push():
@@ -337,6 +418,7 @@ def build(build_job):
                     status=JobLifeCycle.FAILED,
                     message='The docker image could not be pushed.')
         return False
+    set_image_exists(image_name=image_name, image_tag=image_tag)
     docker_builder.clean()
     return True
 
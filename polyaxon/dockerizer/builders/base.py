@@ -12,6 +12,7 @@ from hestia.list_utils import to_list
 
 from django.conf import settings
 
+from docker_images.registry import image_exists
 from dockerizer.dockerfile import POLYAXON_DOCKER_TEMPLATE
 from libs.paths.utils import copy_to_tmp_dir, delete_path, delete_tmp_dir
 from libs.repos import git
@@ -67,7 +68,9 @@ class BaseDockerBuilder(object):
                                dir_name=os.path.join(self.uuid, self.image_tag, self.folder_name))
 
     def check_image(self):
-        return self.docker.images(self.get_tagged_image())
+        return image_exists(image_name=self.image_name,
+                            image_tag=self.image_tag,
+                            docker=self.docker)
 
     def clean(self):
         # Clean dockerfile
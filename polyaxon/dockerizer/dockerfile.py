@@ -1,4 +1,5 @@
-POLYAXON_DOCKER_TEMPLATE = """
+# The base image with the dependencies, the build steps can only be cached by their inputs
+POLYAXON_DEPENDENCIES_DOCKER_TEMPLATE = """
 FROM {{ from_image }}
 
 ENV LC_ALL en_US.UTF-8
@@ -33,8 +34,19 @@ COPY {{ polyaxon_setup_path }} {{ workdir }}
 RUN {{ step }}
 {% endfor -%}
 {% endif -%}
+"""
 
+_COPY_CODE_TEMPLATE = """
 {% if copy_code -%}
 COPY {{ folder_name }} {{ workdir }}
 {% endif -%}
 """
+
+POLYAXON_DOCKER_TEMPLATE = POLYAXON_DEPENDENCIES_DOCKER_TEMPLATE + _COPY_CODE_TEMPLATE
+
+# The image of a commit when its dependencies image exists, it only adds the code
+POLYAXON_CODE_DOCKER_TEMPLATE = """
+FROM {{ from_image }}
+
+WORKDIR {{ workdir }}
+""" + _COPY_CODE_TEMPLATE
@@ -2,7 +2,7 @@ from hestia.service_interface import Service
 
 
 class EventService(Service):
-    __all__ = ('record',)
+    __all__ = ('record', 'record_batch')
 
     event_manager = None
 
@@ -35,6 +35,28 @@ class EventService(Service):
         self.record_event(event)
         return event
 
+    def record_batch(self, events):
+        """ Validate and record a batch of serialized events.
+
+        >>> record_batch([event.serialize(), ...])
+        """
+        if not self.is_setup:
+            return []
+        events = [
+            self.get_event(event_type=event['type'], event_data=event)
+            for event in events if self.can_handle(event_type=event['type'])
+        ]
+        self.record_events(events)
+        return events
+
+    def record_events(self, events):
+        """ Record a batch of events, services can override this to write the events at once.
+
+        >>> record_events([Event(), ...])
+        """
+        for event in events:
+            self.record_event(event)
+
     def record_event(self, event):
         """ Record an event.
 
@@ -1,4 +1,4 @@
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 import auditor
 
@@ -22,3 +22,37 @@ def events_log(event):
 @celery_app.task(name=EventsCeleryTasks.EVENTS_TRACK, ignore_result=True)
 def events_track(event):
     auditor.track(event)
+
+
+@celery_app.task(name=EventsCeleryTasks.EVENTS_RECORD,
+                 autoretry_for=(IntegrityError,),
+                 max_retries=3,
+                 ignore_result=True)
+def events_record(event):
+    # Log first, so that a retry does not track or notify twice
+    auditor.log(event)
+    auditor.track(event)
+    auditor.notify(event)
+
+
+@celery_app.task(name=EventsCeleryTasks.EVENTS_RECORD_BATCH, ignore_result=True)
+def events_record_batch(events):
+    # The batch is not retried as a whole, its events would be tracked and notified twice:
+    # if it cannot be logged, each event is logged in its own savepoint
+    # and the failing ones are sent to be recorded, and retried, on their own.
+    try:
+        with transaction.atomic():
+            auditor.log_batch(events)
+    except IntegrityError:
+        logged_events = []
+        for event in events:
+            try:
+                with transaction.atomic():
+                    auditor.log(event)
+            except IntegrityError:
+                celery_app.send_task(EventsCeleryTasks.EVENTS_RECORD, kwargs={'event': event})
+            else:
+                logged_events.append(event)
+        events = logged_events
+    auditor.track_batch(events)
+    auditor.notify_batch(events)
@@ -11,3 +11,4 @@ class HPSearchConfig(AppConfig):
         import signals.experiment_groups  # noqa
         import signals.statuses  # noqA
         import signals.deletion  # noqa
+        import signals.lookups  # noqa
@@ -6,8 +6,12 @@ class BOIterationManager(BaseIterationManager):
     def get_metric_name(self):
         return self.experiment_group.hptuning_config.bo.metric.name
 
-    def create_iteration(self, num_suggestions):
-        """Create an iteration for the experiment group."""
+    def create_iteration(self, num_suggestions, kernel_params=None, encoded_observations=None):
+        """Create an iteration for the experiment group.
+
+        The fitted `kernel_params` of the suggestions are kept to warm start the next iteration,
+        and the `encoded_observations` so that the next iteration only encodes its new experiments.
+        """
         from db.models.experiment_groups import ExperimentGroupIteration
 
         iteration_config = self.experiment_group.iteration_config
@@ -22,6 +26,9 @@ class BOIterationManager(BaseIterationManager):
             old_experiment_ids = iteration_config.combined_experiment_ids
             old_experiments_configs = iteration_config.combined_experiments_configs
             old_experiments_metrics = iteration_config.combined_experiments_metrics
+            kernel_params = kernel_params or iteration_config.kernel_params
+            encoded_observations = (encoded_observations or
+                                    iteration_config.encoded_observations)
 
         # Create a new iteration config
         iteration_config = BOIterationConfig(
@@ -32,6 +39,8 @@ class BOIterationManager(BaseIterationManager):
             old_experiments_metrics=old_experiments_metrics,
             experiment_ids=[],
             experiments_configs=[],
+            kernel_params=kernel_params,
+            encoded_observations=encoded_observations,
         )
         return ExperimentGroupIteration.objects.create(
             experiment_group=self.experiment_group,
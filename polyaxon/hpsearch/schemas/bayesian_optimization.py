@@ -17,6 +17,10 @@ class BOIterationSchema(BaseIterationSchema):
     experiments_metrics = fields.List(
         fields.List(fields.Raw(), validate=validate.Length(equal=2)),
         allow_none=True)
+    kernel_params = fields.Dict(allow_none=True)
+    encoded_observations = fields.List(
+        fields.List(fields.Raw(), validate=validate.Length(equal=2)),
+        allow_none=True)
 
     @post_load
     def make(self, data):
@@ -29,6 +33,7 @@ class BOIterationSchema(BaseIterationSchema):
 
 class BOIterationConfig(BaseIterationConfig):
     SCHEMA = BOIterationSchema
+    REDUCED_ATTRIBUTES = ['kernel_params', 'encoded_observations']
 
     def __init__(self,
                  iteration,
@@ -38,7 +43,9 @@ class BOIterationConfig(BaseIterationConfig):
                  old_experiments_configs=None,
                  experiment_ids=None,
                  experiments_metrics=None,
-                 experiments_configs=None):
+                 experiments_configs=None,
+                 kernel_params=None,
+                 encoded_observations=None):
         super().__init__(iteration=iteration,
                          num_suggestions=num_suggestions,
                          experiment_ids=experiment_ids)
@@ -47,6 +54,8 @@ class BOIterationConfig(BaseIterationConfig):
         self.old_experiments_configs = old_experiments_configs
         self.experiments_configs = experiments_configs
         self.experiments_metrics = experiments_metrics
+        self.kernel_params = kernel_params
+        self.encoded_observations = encoded_observations
 
     @property
     def combined_experiment_ids(self):
@@ -16,7 +16,7 @@ from schemas.hptuning import (
 
 class UtilityFunction(object):
 
-    def __init__(self, config, seed=None):
+    def __init__(self, config, seed=None, kernel_params=None):
         if not isinstance(config, UtilityFunctionConfig):
             raise ValueError('Received a non valid configuration.')
 
@@ -26,25 +26,45 @@ class UtilityFunction(object):
         self.acquisition_function = config.acquisition_function
         self.random_generator = get_random_generator(seed=seed)
         self.gaussian_process = self.get_gaussian_process(config=config.gaussian_process,
-                                                          random_generator=self.random_generator)
+                                                          random_generator=self.random_generator,
+                                                          kernel_params=kernel_params)
 
     @staticmethod
-    def get_gaussian_process(config, random_generator):
+    def get_gaussian_process(config, random_generator, kernel_params=None):
+        """Build the gaussian process, warm started from the `kernel_params` of a previous fit.
+
+        When the kernel is warm started, the hyperparameters optimizer starts from the previous
+        fitted values and the random restarts are skipped.
+        """
         if not isinstance(config, GaussianProcessConfig):
             raise ValueError('Received a non valid configuration.')
 
+        length_scale = config.length_scale
+        n_restarts_optimizer = config.n_restarts_optimizer
+        if kernel_params and kernel_params.get('length_scale') is not None:
+            length_scale = kernel_params['length_scale']
+            n_restarts_optimizer = 0
+
         if GaussianProcessesKernels.is_rbf(config.kernel):
-            kernel = RBF(length_scale=config.length_scale)
+            kernel = RBF(length_scale=length_scale)
         else:
-            kernel = Matern(length_scale=config.length_scale,
+            kernel = Matern(length_scale=length_scale,
                             nu=config.nu)
 
         return GaussianProcessRegressor(
             kernel=kernel,
-            n_restarts_optimizer=config.n_restarts_optimizer,
+            n_restarts_optimizer=n_restarts_optimizer,
             random_state=random_generator
         )
 
+    @property
+    def kernel_params(self):
+        """The fitted hyperparameters of the kernel, None if the process was not fitted yet."""
+        kernel = getattr(self.gaussian_process, 'kernel_', None)
+        if kernel is None:
+            return None
+        return {'length_scale': np.asarray(kernel.length_scale).tolist()}
+
     def _compute_ucb(self, x):
         mean, std = self.gaussian_process.predict(x, return_std=True)
         return mean + self.kappa * std
@@ -67,37 +87,63 @@ class UtilityFunction(object):
         if AcquisitionFunctions.is_poi(self.acquisition_function):
             return self._compute_poi(x=x, y_max=y_max)
 
+    def _compute_gradients(self, x, y_max, step=1e-8):
+        """Return the acquisition values and their forward differences gradients at the points x.
+
+        All the shifted points are evaluated with a single prediction.
+        """
+        n_points, dim = x.shape
+        shifts = np.concatenate([np.zeros((1, dim)), np.eye(dim) * step])
+        x_shifted = (x[:, np.newaxis, :] + shifts[np.newaxis, :, :]).reshape(-1, dim)
+        ys = self.compute(x_shifted, y_max=y_max).reshape(n_points, dim + 1)
+        return ys[:, 0], (ys[:, 1:] - ys[:, :1]) / step
+
     def max_compute(self, y_max, bounds, n_warmup=100000, n_iter=250):
         """A function to find the maximum of the acquisition function
 
         It uses a combination of random sampling (cheap) and the 'L-BFGS-B' optimization method.
 
         First by sampling `n_warmup` (1e5) points at random,
-        and then running L-BFGS-B from `n_iter` (250) random starting points.
+        and then running L-BFGS-B from `n_iter` (250) starting points,
+        the best warmup points completed with random points.
+
+        Every start is optimized on its own, each step evaluates the acquisition function
+        and its finite differences gradient with a single prediction.
 
         Params:
             y_max: The current maximum known value of the target function.
             bounds: The variables bounds to limit the search of the acq max.
             n_warmup: The number of times to randomly sample the acquisition function
-            n_iter: The number of times to run scipy.minimize
+            n_iter: The number of starting points of scipy.minimize
 
         Returns
             x_max: The arg max of the acquisition function.
         """
+        dim = bounds.shape[0]
         # Warm up with random points
         x_tries = self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
-                                                size=(n_warmup, bounds.shape[0]))
+                                                size=(n_warmup, dim))
         ys = self.compute(x_tries, y_max=y_max)
         x_max = x_tries[ys.argmax()]
         max_acq = ys.max()
 
         # Explore the parameter space more throughly
-        x_seeds = self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
-                                                size=(n_iter, bounds.shape[0]))
+        x_seeds = x_tries[np.argsort(-ys)[:n_iter]]
+        if len(x_seeds) < n_iter:
+            x_seeds = np.concatenate([
+                x_seeds,
+                self.random_generator.uniform(bounds[:, 0], bounds[:, 1],
+                                              size=(n_iter - len(x_seeds), dim))])
+
+        def minus_acquisition(x):
+            values, gradients = self._compute_gradients(x.reshape(1, -1), y_max=y_max)
+            return -values[0], -gradients[0]
+
         for x_try in x_seeds:
             # Find the minimum of minus the acquisition function
-            res = minimize(lambda x: -self.compute(x.reshape(1, -1), y_max=y_max),
-                           x_try.reshape(1, -1),
+            res = minimize(minus_acquisition,
+                           x_try,
+                           jac=True,
                            bounds=bounds,
                            method="L-BFGS-B")
 
@@ -106,9 +152,9 @@ class UtilityFunction(object):
                 continue
 
             # Store it if better than previous minimum(maximum).
-            if max_acq is None or -res.fun[0] >= max_acq:
+            if max_acq is None or -res.fun >= max_acq:
                 x_max = res.x
-                max_acq = -res.fun[0]
+                max_acq = -res.fun
 
         # Clip output to make sure it lies within the bounds. Due to floating
         # point technicalities this is not always the case.
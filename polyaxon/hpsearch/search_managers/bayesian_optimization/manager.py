@@ -13,6 +13,10 @@ class BOSearchManager(BaseSearchAlgorithmManager):
         super().__init__(hptuning_config=hptuning_config)
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.n_iterations = self.hptuning_config.bo.n_iterations
+        # The fitted kernel hyperparameters of the last suggestions, to warm start the next fit
+        self.kernel_params = None
+        # The encoded configs of the observed experiments, to only encode the new ones next time
+        self.encoded_observations = None
 
     def get_suggestions(self, iteration_config=None):
         if not iteration_config:
@@ -22,14 +26,25 @@ class BOSearchManager(BaseSearchAlgorithmManager):
         # Use the iteration_config to construct observed point and metrics
         experiments_configs = dict(iteration_config.combined_experiments_configs)
         experiments_metrics = dict(iteration_config.combined_experiments_metrics)
+        experiment_ids = []
         configs = []
         metrics = []
         for key in experiments_metrics.keys():
+            experiment_ids.append(key)
             configs.append(experiments_configs[key])
             metrics.append(experiments_metrics[key])
-        optimizer = BOOptimizer(hptuning_config=self.hptuning_config)
-        optimizer.add_observations(configs=configs, metrics=metrics)
+        optimizer = BOOptimizer(hptuning_config=self.hptuning_config,
+                                kernel_params=iteration_config.kernel_params)
+        optimizer.add_observations(
+            configs=configs,
+            metrics=metrics,
+            experiment_ids=experiment_ids,
+            encoded_observations=dict(iteration_config.encoded_observations or []))
         suggestion = optimizer.get_suggestion()
+        self.kernel_params = optimizer.kernel_params
+        self.encoded_observations = [
+            [experiment_id, x_config]
+            for experiment_id, x_config in optimizer.encoded_observations.items()]
         return [suggestion] if suggestion else None
 
     def should_reschedule(self, iteration):
@@ -4,12 +4,13 @@ from hpsearch.search_managers.bayesian_optimization.space import SearchSpace
 
 class BOOptimizer(object):
 
-    def __init__(self, hptuning_config):
+    def __init__(self, hptuning_config, kernel_params=None):
         self.hptuning_config = hptuning_config
         self.n_initial_trials = self.hptuning_config.bo.n_initial_trials
         self.space = SearchSpace(hptuning_config=hptuning_config)
-        self.utility_function = UtilityFunction(
-            config=hptuning_config.bo.utility_function, seed=hptuning_config.seed)
+        self.utility_function = UtilityFunction(config=hptuning_config.bo.utility_function,
+                                                seed=hptuning_config.seed,
+                                                kernel_params=kernel_params)
         self.n_warmup = hptuning_config.bo.utility_function.n_warmup or 5
         self.n_iter = hptuning_config.bo.utility_function.n_iter or 10
 
@@ -24,9 +25,20 @@ class BOOptimizer(object):
                                                  n_warmup=self.n_warmup,
                                                  n_iter=self.n_iter)
 
-    def add_observations(self, configs, metrics):
+    @property
+    def kernel_params(self):
+        return self.utility_function.kernel_params
+
+    @property
+    def encoded_observations(self):
+        return self.space.encoded_observations
+
+    def add_observations(self, configs, metrics, experiment_ids=None, encoded_observations=None):
         # Turn configs and metrics into data points
-        self.space.add_observations(configs=configs, metrics=metrics)
+        self.space.add_observations(configs=configs,
+                                    metrics=metrics,
+                                    experiment_ids=experiment_ids,
+                                    encoded_observations=encoded_observations)
 
     def get_suggestion(self):
         x = self._maximize()
@@ -16,6 +16,8 @@ class SearchSpace(object):
         self._categorical_features = {}
         self._x = []
         self._y = []
+        # The encoded configs of the observed experiments by experiment id
+        self._encoded_observations = {}
 
         self.set_bounds()
 
@@ -44,6 +46,10 @@ class SearchSpace(object):
     def y(self):
         return self._y
 
+    @property
+    def encoded_observations(self):
+        return self._encoded_observations
+
     @property
     def dim(self):
         return self._dim
@@ -104,23 +110,33 @@ class SearchSpace(object):
 
         return np.array(y_values)
 
-    def parse_x(self, configs):
+    def encode_config(self, config):
+        x_config = []
+        for feature in self._features:
+            if feature in self._categorical_features:
+                x_config += [1 if v == config[feature] else 0
+                             for v in self._categorical_features[feature]['values']]
+            elif feature in self._features:
+                x_config.append(config[feature])
+        return x_config
+
+    def parse_x(self, configs, experiment_ids=None):
+        """Encode the configs, the experiments already in the encoded observations are reused."""
         if not configs:
             return configs
+        if experiment_ids is None:
+            return np.array([self.encode_config(config) for config in configs])
+
         x = []
-        for config in configs:
-            x_config = []
-            for feature in self._features:
-                if feature in self._categorical_features:
-                    x_config += [1 if v == config[feature] else 0
-                                 for v in self._categorical_features[feature]['values']]
-                elif feature in self._features:
-                    x_config.append(config[feature])
-            x.append(x_config)
+        for experiment_id, config in zip(experiment_ids, configs):
+            if experiment_id not in self._encoded_observations:
+                self._encoded_observations[experiment_id] = self.encode_config(config)
+            x.append(self._encoded_observations[experiment_id])
         return np.array(x)
 
-    def add_observations(self, configs, metrics):
-        self._x = self.parse_x(configs=configs)
+    def add_observations(self, configs, metrics, experiment_ids=None, encoded_observations=None):
+        self._encoded_observations = dict(encoded_observations or {})
+        self._x = self.parse_x(configs=configs, experiment_ids=experiment_ids)
         self._y = self.parse_y(metrics=metrics)
 
     def _get_discrete_suggestion(self, feature, suggestion, counter):
@@ -1,14 +1,61 @@
-import itertools
+from functools import reduce
+from operator import mul
 
 from hpsearch.search_managers.base import BaseSearchAlgorithmManager
 from schemas.hptuning import SearchAlgorithms
 
 
+class GridSpace(object):
+    """Index addressable product of the matrix values.
+
+    The combinations follow the `itertools.product` order,
+    the k-th combination is computed on demand without materializing the previous ones.
+    """
+
+    def __init__(self, matrix):
+        self.keys = list(matrix.keys())
+        self.values = [v.to_numpy() for v in matrix.values()]
+        self.lengths = [len(v) for v in self.values]
+        self.size = reduce(mul, self.lengths, 1)
+
+    def get_suggestion(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError('Grid index `{}` is out of range.'.format(index))
+        suggestion = {}
+        # The last key varies the fastest
+        for key, values, length in reversed(list(zip(self.keys, self.values, self.lengths))):
+            index, position = divmod(index, length)
+            suggestion[key] = values[position]
+        return {key: suggestion[key] for key in self.keys}
+
+    def get_suggestions(self, start, stop):
+        for index in range(start, min(stop, self.size)):
+            yield self.get_suggestion(index)
+
+
 class GridSearchManager(BaseSearchAlgorithmManager):
     """Grid search algorithm manager for hyperparameter optimization."""
 
     NAME = SearchAlgorithms.GRID
 
+    def get_grid(self):
+        return GridSpace(matrix=self.hptuning_config.matrix)
+
+    def get_num_grid_suggestions(self, grid=None):
+        """Return the number of suggestions, the grid's size bounded by `n_experiments`."""
+        grid = grid or self.get_grid()
+        if self.hptuning_config.grid_search:
+            n_suggestions = self.hptuning_config.grid_search.n_experiments
+            if n_suggestions:
+                return min(grid.size, n_suggestions)
+        return grid.size
+
+    def get_suggestions_slice(self, start, stop):
+        """Return the suggestions of the grid between the indices `start` and `stop`."""
+        grid = self.get_grid()
+        stop = min(stop, self.get_num_grid_suggestions(grid=grid))
+        return list(grid.get_suggestions(start=start, stop=stop))
+
     def get_suggestions(self, iteration_config=None):
         """Return a list of suggestions based on grid search.
 
@@ -16,16 +63,6 @@ class GridSearchManager(BaseSearchAlgorithmManager):
             matrix: `dict` representing the {hyperparam: hyperparam matrix config}.
             n_suggestions: number of suggestions to make.
         """
-        matrix = self.hptuning_config.matrix
-
-        suggestions = []
-        keys = list(matrix.keys())
-        values = [v.to_numpy() for v in matrix.values()]
-        for v in itertools.product(*values):
-            suggestions.append(dict(zip(keys, v)))
-
-        if self.hptuning_config.grid_search:
-            n_suggestions = self.hptuning_config.grid_search.n_experiments
-            if n_suggestions:
-                return suggestions[:n_suggestions]
-        return suggestions
+        grid = self.get_grid()
+        return list(grid.get_suggestions(start=0,
+                                         stop=self.get_num_grid_suggestions(grid=grid)))
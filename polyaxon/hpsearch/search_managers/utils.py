@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 import uuid
 
@@ -38,10 +37,25 @@ def get_random_generator(seed=None):
     return np.random.RandomState(seed) if seed else np.random
 
 
+def _sample_rows(matrix, n_rows, rand_generator):
+    """Sample `n_rows` values of every hyperparam at once, and return the rows of values."""
+    columns = [np.atleast_1d(v.sample(size=n_rows, rand_generator=rand_generator))
+               for v in matrix.values()]
+    return zip(*columns)
+
+
+def _sample_grid_indices(matrix, n_suggestions, rand_generator):
+    """Sample the suggestions without replacement over the indices of the discrete space."""
+    from hpsearch.search_managers.grid import GridSpace
+
+    grid = GridSpace(matrix=matrix)
+    indices = rand_generator.choice(grid.size, size=n_suggestions, replace=False)
+    return [grid.get_suggestion(int(index)) for index in indices]
+
+
 def get_random_suggestions(matrix, n_suggestions, suggestion_params=None, seed=None):
     if not n_suggestions:
         raise ValueError('This search algorithm requires `n_experiments`.')
-    suggestions = []
     suggestion_params = suggestion_params or {}
     rand_generator = get_random_generator(seed=seed)
     # Validate number of suggestions and total space
@@ -54,11 +68,31 @@ def get_random_suggestions(matrix, n_suggestions, suggestion_params=None, seed=N
         space = reduce(mul, [v.length for v in matrix.values()])
         n_suggestions = n_suggestions if n_suggestions <= space else space
 
-    while n_suggestions > 0:
-        params = copy.deepcopy(suggestion_params)
-        params.update({k: v.sample(rand_generator=rand_generator) for k, v in matrix.items()})
-        suggestion = Suggestion(params=params)
-        if suggestion not in suggestions:
-            suggestions.append(suggestion)
-            n_suggestions -= 1
-    return [suggestion.params for suggestion in suggestions]
+        # Rejecting the duplicates of a near exhaustive request would spin for a long time,
+        # the values without probabilities can be sampled without replacement instead
+        if n_suggestions * 2 >= space and not any(v.pvalues for v in matrix.values()):
+            return [dict(suggestion_params, **suggestion)
+                    for suggestion in _sample_grid_indices(matrix=matrix,
+                                                           n_suggestions=n_suggestions,
+                                                           rand_generator=rand_generator)]
+
+    # Sample the hyperparams by batches and dedupe the rows with a hash set
+    keys = list(matrix.keys())
+    seen = set()
+    suggestions = []
+    while len(suggestions) < n_suggestions:
+        n_rows = n_suggestions - len(suggestions)
+        n_sampled = 0
+        for row in _sample_rows(matrix=matrix, n_rows=n_rows, rand_generator=rand_generator):
+            n_sampled += 1
+            if row in seen:
+                continue
+            seen.add(row)
+            params = dict(suggestion_params)
+            params.update(zip(keys, row))
+            suggestions.append(params)
+            if len(suggestions) == n_suggestions:
+                break
+        if not n_sampled:
+            break
+    return suggestions
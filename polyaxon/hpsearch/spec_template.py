@@ -0,0 +1,118 @@
+import ast
+import re
+
+from marshmallow.exceptions import ValidationError as MarshmallowValidationError
+
+from schemas.exceptions import PolyaxonConfigurationError, PolyaxonfileError
+
+# Only the plain `{{ name }}` references can be rendered without the parser,
+# the statements, the filters and the expressions are evaluated by jinja.
+_JINJA_STATEMENTS = re.compile(r'{%|{#')
+_JINJA_EXPRESSIONS = re.compile(r'{{(.*?)}}', re.S)
+_JINJA_NAME = re.compile(r'^\s*[A-Za-z_]\w*\s*$')
+
+
+class ExperimentSpecTemplate(object):
+    """Renders the experiments' configs of a group without re-parsing its polyaxonfile.
+
+    The group's experiment spec is parsed once with a placeholder for every hyperparam,
+    the config of each suggestion is rendered by replacing the placeholders.
+    The suggestions with values that the parser would evaluate, e.g. `'1e-3'`,
+    or that are not scalars are parsed by the specification.
+    """
+
+    PLACEHOLDER_PREFIX = '__polyaxon_hp_'
+    PLACEHOLDER = PLACEHOLDER_PREFIX + '{}__'
+
+    def __init__(self, specification, keys):
+        self.specification = specification
+        self.placeholders = {key: self.PLACEHOLDER.format(key) for key in keys}
+        self.spec = specification.get_experiment_spec(matrix_declaration=self.placeholders)
+        self.template = self.spec.parsed_data
+
+    @staticmethod
+    def is_supported(content):
+        if not content or _JINJA_STATEMENTS.search(content):
+            return False
+        return all(_JINJA_NAME.match(expression)
+                   for expression in _JINJA_EXPRESSIONS.findall(content))
+
+    @staticmethod
+    def is_plain_value(value):
+        """Whether the parser renders and declares the value as is."""
+        if value is None or isinstance(value, (bool, int, float)):
+            return True
+        if not isinstance(value, str) or _JINJA_STATEMENTS.search(value) or '{{' in value:
+            return False
+        try:
+            ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return True
+        return False
+
+    @classmethod
+    def is_plain_suggestion(cls, suggestion):
+        return all(cls.is_plain_value(value) for value in suggestion.values())
+
+    @classmethod
+    def get_template(cls, experiment_group, suggestion):
+        """Returns a template for the group's experiments if their configs can be rendered.
+
+        The template is only used if it renders the same config as the parser,
+        and if the tags and persistence do not depend on the hyperparams.
+        The experiments declaring outputs are not supported,
+        their references are created by the experiments' signals.
+        """
+        if not cls.is_supported(experiment_group.content):
+            return None
+        if not cls.is_plain_suggestion(suggestion):
+            return None
+
+        specification = experiment_group.specification
+        try:
+            template = cls(specification=specification, keys=suggestion.keys())
+            config = specification.get_experiment_spec(matrix_declaration=suggestion).parsed_data
+        except (MarshmallowValidationError, PolyaxonfileError, PolyaxonConfigurationError):
+            return None
+
+        if template.spec.outputs or template.has_templated_environment():
+            return None
+        if template.render(suggestion) != config:
+            return None
+        return template
+
+    def has_placeholder(self, value):
+        return self.PLACEHOLDER_PREFIX in repr(value)
+
+    def has_templated_environment(self):
+        persistence = self.spec.persistence.to_dict() if self.spec.persistence else None
+        return self.has_placeholder(self.spec.tags) or self.has_placeholder(persistence)
+
+    def _render_value(self, value, suggestion):
+        if isinstance(value, dict):
+            return {k: self._render_value(v, suggestion) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._render_value(v, suggestion) for v in value]
+        if not isinstance(value, str) or self.PLACEHOLDER_PREFIX not in value:
+            return value
+
+        for key, placeholder in self.placeholders.items():
+            value = value.replace(placeholder, str(suggestion[key]))
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+
+    def render(self, suggestion):
+        if not self.is_plain_suggestion(suggestion):
+            return self.specification.get_experiment_spec(
+                matrix_declaration=suggestion).parsed_data
+
+        config = {key: self._render_value(value, suggestion)
+                  for key, value in self.template.items()
+                  if key != 'declarations'}
+        if 'declarations' in self.template:
+            declarations = dict(self.template['declarations'] or {})
+            declarations.update(suggestion)
+            config['declarations'] = declarations
+        return config
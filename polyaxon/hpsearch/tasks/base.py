@@ -1,16 +1,30 @@
 from hestia.np_utils import sanitize_np_types
 
-from db.models.experiments import Experiment
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+import auditor
+import stats
+
+from constants.experiments import ExperimentLifeCycle
+from db.models.experiments import Experiment, ExperimentStatus
 from db.redis.group_check import GroupChecks
+from event_manager.events.experiment_group import EXPERIMENT_GROUP_EXPERIMENTS_CREATED
+from hpsearch.spec_template import ExperimentSpecTemplate
 from hpsearch.tasks.logger import logger
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import SchedulerCeleryTasks
+from signals.persistence import set_persistence
+from signals.tags import set_tags
+
+BULK_CREATE_CHUNK_SIZE = 500
 
 
 def get_suggestions(experiment_group):
     # Parse polyaxonfile content and create the experiments
     specification = experiment_group.specification
-    suggestions = experiment_group.get_suggestions()
+    with stats.timer('hpsearch.suggestions.{}'.format(specification.search_algorithm)):
+        suggestions = experiment_group.get_suggestions()
 
     if not suggestions:
         logger.error('Search algorithm `%s` could not make any suggestions.',
@@ -18,11 +32,34 @@ def get_suggestions(experiment_group):
                      extra={'stack': True})
         return
 
+    return sanitize_suggestions(suggestions)
+
+
+def sanitize_suggestions(suggestions):
     # We sanitize numpy types to be able to jsonify and split the scheduling of different tasks
     return [{k: sanitize_np_types(v) for k, v in suggestion.items()} for suggestion in suggestions]
 
 
 def create_group_experiments(experiment_group, suggestions):
+    if not suggestions:
+        return []
+
+    template = ExperimentSpecTemplate.get_template(experiment_group=experiment_group,
+                                                   suggestion=suggestions[0])
+    if template is None:
+        return create_group_experiments_one_by_one(experiment_group=experiment_group,
+                                                   suggestions=suggestions)
+
+    experiments = []
+    for i in range(0, len(suggestions), BULK_CREATE_CHUNK_SIZE):
+        experiments += bulk_create_group_experiments(
+            experiment_group=experiment_group,
+            template=template,
+            suggestions=suggestions[i: i + BULK_CREATE_CHUNK_SIZE])
+    return experiments
+
+
+def create_group_experiments_one_by_one(experiment_group, suggestions):
     # Parse polyaxonfile content and create the experiments
     specification = experiment_group.specification
 
@@ -40,6 +77,50 @@ def create_group_experiments(experiment_group, suggestions):
     return experiments
 
 
+def bulk_create_group_experiments(experiment_group, template, suggestions):
+    """Creates the experiments and their initial statuses without going through the signals.
+
+    The experiments' ids, and hence their unique names, are allocated by one insert,
+    the whole chunk is recorded by a single event.
+    """
+    configs = [template.render(suggestion) for suggestion in suggestions]
+
+    # The tags and the persistence are shared by the group's experiments
+    prototype = Experiment(project_id=experiment_group.project_id,
+                           user_id=experiment_group.user_id,
+                           config=configs[0])
+    set_tags(instance=prototype)
+    set_persistence(instance=prototype)
+
+    with transaction.atomic():
+        experiments = Experiment.objects.bulk_create([
+            Experiment(project_id=experiment_group.project_id,
+                       user_id=experiment_group.user_id,
+                       experiment_group=experiment_group,
+                       config=config,
+                       declarations=config.get('declarations'),
+                       tags=prototype.tags,
+                       persistence=prototype.persistence,
+                       code_reference_id=experiment_group.code_reference_id,
+                       last_status=ExperimentLifeCycle.CREATED)
+            for config in configs
+        ])
+        statuses = ExperimentStatus.objects.bulk_create([
+            ExperimentStatus(experiment=experiment, status=ExperimentLifeCycle.CREATED)
+            for experiment in experiments
+        ])
+        Experiment.objects.filter(id__in=[experiment.id for experiment in experiments]).update(
+            status_id=Subquery(ExperimentStatus.objects.filter(
+                experiment_id=OuterRef('id')).values('id')[:1]))
+
+    for experiment, status in zip(experiments, statuses):
+        experiment.status = status
+    auditor.record(event_type=EXPERIMENT_GROUP_EXPERIMENTS_CREATED,
+                   instance=experiment_group,
+                   num_experiments=len(experiments))
+    return experiments
+
+
 def start_group_experiments(experiment_group):
     # Check for early stopping before starting new experiments from this group
     if experiment_group.should_stop_early():
@@ -17,7 +17,10 @@ def create(experiment_group):
                                     message='Experiment group could not create new suggestions.')
         return
 
-    experiment_group.iteration_manager.create_iteration(num_suggestions=len(suggestions))
+    experiment_group.iteration_manager.create_iteration(
+        num_suggestions=len(suggestions),
+        kernel_params=experiment_group.search_manager.kernel_params,
+        encoded_observations=experiment_group.search_manager.encoded_observations)
 
     def send_chunk():
         celery_app.send_task(
@@ -9,33 +9,26 @@ from polyaxon.settings import HPCeleryTasks, Intervals
 
 
 def create(experiment_group):
-    suggestions = base.get_suggestions(experiment_group=experiment_group)
-    if not suggestions:
+    # The chunks only carry the indices of their suggestions in the grid
+    num_suggestions = experiment_group.search_manager.get_num_grid_suggestions()
+    if not num_suggestions:
         logger.error('Experiment group `%s` could not create any suggestion.',
                      experiment_group.id)
         experiment_group.set_status(ExperimentGroupLifeCycle.FAILED,
                                     message='Experiment group could not create new suggestions.')
         return
 
-    experiment_group.iteration_manager.create_iteration(num_suggestions=len(suggestions))
+    experiment_group.iteration_manager.create_iteration(num_suggestions=num_suggestions)
 
-    def send_chunk():
+    chunk_size = conf.get('GROUP_CHUNKS')
+    for start in range(0, num_suggestions, chunk_size):
         celery_app.send_task(
             HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS,
             kwargs={'experiment_group_id': experiment_group.id,
-                    'suggestions': chunk_suggestions},
+                    'start': start,
+                    'stop': min(start + chunk_size, num_suggestions)},
             countdown=1)
 
-    chunk_suggestions = []
-    for suggestion in suggestions:
-        chunk_suggestions.append(suggestion)
-        if len(chunk_suggestions) == conf.get('GROUP_CHUNKS'):
-            send_chunk()
-            chunk_suggestions = []
-
-    if chunk_suggestions:
-        send_chunk()
-
     celery_app.send_task(
         HPCeleryTasks.HP_GRID_SEARCH_START,
         kwargs={'experiment_group_id': experiment_group.id, 'auto_retry': True},
@@ -43,11 +36,16 @@ def create(experiment_group):
 
 
 @celery_app.task(name=HPCeleryTasks.HP_GRID_SEARCH_CREATE_EXPERIMENTS, ignore_result=True)
-def hp_grid_search_create_experiments(experiment_group_id, suggestions):
+def hp_grid_search_create_experiments(experiment_group_id, start=None, stop=None, suggestions=None):
     experiment_group = get_running_experiment_group(experiment_group_id=experiment_group_id)
     if not experiment_group:
         return
 
+    if suggestions is None:
+        # Generate this chunk's slice of the grid
+        suggestions = base.sanitize_suggestions(
+            experiment_group.search_manager.get_suggestions_slice(start=start, stop=stop))
+
     experiments = base.create_group_experiments(experiment_group=experiment_group,
                                                 suggestions=suggestions)
     experiment_group.iteration_manager.add_iteration_experiments(
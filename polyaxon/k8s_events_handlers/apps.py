@@ -8,3 +8,4 @@ class K8SEventsHandlersConfig(AppConfig):
     def ready(self):
         import signals.statuses  # noqa
         import signals.deletion  # noqa
+        import signals.lookups  # noqa
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import IntegrityError
 
 import conf
@@ -62,6 +64,59 @@ def k8s_events_handle_experiment_job_statuses(self, payload):
         self.retry(countdown=Intervals.EXPERIMENTS_SCHEDULER)
 
 
+@celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOBS_STATUSES,
+                 ignore_result=True)
+def k8s_events_handle_experiment_jobs_statuses(payloads):
+    """Experiment jobs statuses coalesced by the statuses monitor, the jobs are fetched at once.
+
+    The jobs not ready to handle their statuses, or raising an error while setting them,
+    are handed to the single status handler which retries them.
+    The statuses of the jobs or experiments that do not exist anymore are dropped.
+    """
+    payloads = {uuid.UUID(payload['details']['labels']['job_uuid']).hex: payload
+                for payload in payloads}
+    logger.debug('handling events statuses for %s jobs', len(payloads))
+
+    def retry(payload, countdown):
+        celery_app.send_task(K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES,
+                             kwargs={'payload': payload},
+                             countdown=countdown)
+
+    jobs = ExperimentJob.objects.filter(uuid__in=list(payloads.keys())).select_related('experiment')
+    missing_job_uuids = set(payloads.keys())
+    for job in jobs:
+        payload = payloads[job.uuid.hex]
+        missing_job_uuids.discard(job.uuid.hex)
+        try:
+            job.experiment
+        except Experiment.DoesNotExist:
+            logger.debug('Experiment for job `%s` does not exist anymore', job.uuid.hex)
+            continue
+
+        if job.last_status is None:
+            retry(payload=payload, countdown=1)
+            continue
+
+        try:
+            set_node_scheduling(job, payload['details']['node_name'])
+            job.set_status(status=payload['status'],
+                           message=payload['message'],
+                           created_at=payload.get('created_at'),
+                           traceback=payload.get('traceback'),
+                           details=payload['details'])
+        except IntegrityError:
+            # Due to concurrency this could happen, we just retry it
+            retry(payload=payload, countdown=Intervals.EXPERIMENTS_SCHEDULER)
+        except Exception:  # pylint:disable=broad-except
+            # The other jobs' statuses are still handled
+            logger.warning('Could not handle job status %s for %s, handing it to the job handler',
+                           payload['status'], job.uuid.hex, exc_info=True)
+            retry(payload=payload, countdown=Intervals.EXPERIMENTS_SCHEDULER)
+
+    if missing_job_uuids:
+        logger.info('Jobs `%s` do not exist', ', '.join(sorted(missing_job_uuids)))
+
+
 @celery_app.task(name=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES,
                  bind=True,
                  max_retries=3,
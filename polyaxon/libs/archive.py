@@ -1,10 +1,14 @@
+import fcntl
 import os
 import tarfile
+import tempfile
+
+from contextlib import contextmanager
 
 import conf
 import stores
 
-from libs.paths.utils import check_archive_path
+from libs.paths.utils import check_archive_path, delete_path
 
 
 def create_tarfile(files, tar_path):
@@ -22,12 +26,82 @@ def get_files_in_path(path):
     return result_files
 
 
+@contextmanager
+def archive_lock(archive_root, key):
+    """Exclusive lock, across processes, for building the archives of the same key."""
+    lock_path = os.path.join(archive_root, '.lock-{}'.format(key))
+    with open(lock_path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def touch_archive(archive_path):
+    """Marks the archive as recently used, returns False if it does not exist."""
+    try:
+        os.utime(archive_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def evict_archives(archive_root, max_size, keep=None):
+    """Deletes the least recently used archives until the root fits in `max_size` bytes."""
+    archives = []
+    for archive_name in os.listdir(archive_root):
+        # Skip the locks and the archives being written
+        if archive_name.startswith('.'):
+            continue
+        archive_path = os.path.join(archive_root, archive_name)
+        try:
+            stat = os.stat(archive_path)
+        except FileNotFoundError:
+            continue
+        archives.append((stat.st_mtime, stat.st_size, archive_path))
+
+    total_size = sum(size for _, size, _ in archives)
+    for _, size, archive_path in sorted(archives):
+        if total_size <= max_size:
+            break
+        if archive_path == keep:
+            continue
+        delete_path(archive_path)
+        total_size -= size
+
+
 def archive_repo(repo_git, repo_name, commit=None):
+    """Archives a commit of the repo, the archives are cached by the resolved commit sha.
+
+    Concurrent requests for the same commit wait for the first one to build the archive,
+    the archive is written to a temporary file and moved in place once complete.
+    """
     archive_root = conf.get('REPOS_ARCHIVE_ROOT')
     check_archive_path(archive_root)
-    archive_name = '{}-{}.tar.gz'.format(repo_name, commit or 'master')
-    with open(os.path.join(archive_root, archive_name), 'wb') as fp:
-        repo_git.archive(fp, format='tgz', treeish=commit)
+    commit_sha = repo_git.commit(commit).hexsha
+    archive_name = '{}-{}.tar.gz'.format(repo_name, commit_sha)
+    archive_path = os.path.join(archive_root, archive_name)
+    if touch_archive(archive_path):
+        return archive_root, archive_name
+
+    with archive_lock(archive_root, key=commit_sha[:2]):
+        # The archive might have been built while waiting for the lock
+        if touch_archive(archive_path):
+            return archive_root, archive_name
+
+        fd, tmp_path = tempfile.mkstemp(dir=archive_root, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                repo_git.archive(fp, format='tgz', treeish=commit_sha)
+            os.chmod(tmp_path, conf.get('FILE_UPLOAD_PERMISSIONS'))
+            os.replace(tmp_path, archive_path)
+        finally:
+            delete_path(tmp_path)
+
+        evict_archives(archive_root=archive_root,
+                       max_size=conf.get('REPOS_ARCHIVE_MAX_SIZE'),
+                       keep=archive_path)
 
     return archive_root, archive_name
 
@@ -0,0 +1,228 @@
+import functools
+import logging
+import threading
+
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import transaction
+
+import conf
+
+from db.models.bookmarks import Bookmark
+from db.models.build_jobs import BuildJob, BuildJobStatus
+from db.models.experiment_groups import (
+    ExperimentGroup,
+    ExperimentGroupChartView,
+    ExperimentGroupStatus
+)
+from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
+from db.models.experiments import (
+    Experiment,
+    ExperimentChartView,
+    ExperimentMetric,
+    ExperimentStatus
+)
+from db.models.jobs import Job, JobStatus
+from db.models.notebooks import NotebookJob, NotebookJobStatus
+from db.models.tensorboards import TensorboardJob, TensorboardJobStatus
+from polyaxon.celery_api import celery_app
+from polyaxon.settings import SchedulerCeleryTasks
+from schemas.environments import PersistenceConfig
+
+_logger = logging.getLogger('polyaxon.libs.deletion')
+
+_state = threading.local()
+
+
+def is_bulk_deletion():
+    return getattr(_state, 'bulk_deletion', False)
+
+
+@contextmanager
+def bulk_deletion():
+    """Marks the rows deleted in the block as part of a subtree deleted at once.
+
+    The per row handlers skip the stores' cleaning, the auditing and the bookmarks' removal,
+    the deletion of the subtree handles them once.
+    """
+    previous = is_bulk_deletion()
+    _state.bulk_deletion = True
+    try:
+        yield
+    finally:
+        _state.bulk_deletion = previous
+
+
+def ignore_bulk_deletion(f):
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        if is_bulk_deletion():
+            return None
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+def get_outputs_persistence(persistence):
+    return PersistenceConfig.from_dict(persistence).outputs if persistence else None
+
+
+class SubtreeDeletion(object):
+    """Deletes a project, an experiment group or an experiment with its subtree.
+
+    The subtree is walked bottom-up in batches of rows, each batch in its own transaction:
+        * the leaf tables, e.g. metrics and statuses, are deleted with plain queries,
+          without loading the rows.
+        * the experiments, groups and jobs are deleted with the orm to stop the running ones,
+          the collected rows are bounded by the batch's size.
+        * the root is deleted last with its usual handlers, which clean its stores' subpath
+          and record the subtree's only audit event.
+
+    Since the root is only deleted once its subtree is gone,
+    an interrupted deletion resumes where it stopped the next time it is triggered.
+    """
+
+    def __init__(self, root, batch_size=None):
+        self.root = root
+        self.batch_size = batch_size or conf.get('DELETION_BATCH_SIZE')
+        self.summary = Counter()
+        self._outputs_persistences = {get_outputs_persistence(root.persistence)}
+
+    def _iter_batches(self, queryset):
+        """Yields the ids of the queryset's rows, each batch must be deleted before the next."""
+        while True:
+            ids = list(queryset.order_by().values_list('pk', flat=True)[:self.batch_size])
+            if not ids:
+                return
+            yield ids
+
+    def _raw_delete(self, queryset):
+        """Deletes the rows without loading them, no signal is sent and nothing is cascaded."""
+        model = queryset.model
+        for ids in self._iter_batches(queryset):
+            model._base_manager.filter(pk__in=ids)._raw_delete(queryset.db)
+            self.summary[model._meta.label] += len(ids)
+
+    def _clean_outputs(self, queryset):
+        """Schedules the outputs deletion of the root's subpath in the persistences not seen yet.
+
+        The rows of the subtree can have their outputs in another persistence than the root's.
+        """
+        persistences = {get_outputs_persistence(persistence)
+                        for persistence in queryset.values_list('persistence', flat=True)}
+        for persistence in persistences - self._outputs_persistences:
+            celery_app.send_task(
+                SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
+                kwargs={
+                    'persistence': persistence,
+                    'subpath': self.root.subpath,
+                })
+        self._outputs_persistences |= persistences
+
+    def _delete_rows(self, model, ids, content_type=None):
+        with bulk_deletion():
+            _, deleted = model.all.filter(id__in=ids).delete()
+        self.summary.update(deleted)
+        if content_type:
+            Bookmark.objects.filter(content_type__model=content_type, object_id__in=ids).delete()
+
+    def _delete_experiments_leaves(self, experiment_ids):
+        self._raw_delete(ExperimentMetric.objects.filter(experiment_id__in=experiment_ids))
+        self._raw_delete(ExperimentChartView.objects.filter(experiment_id__in=experiment_ids))
+        ExperimentJob.objects.filter(experiment_id__in=experiment_ids).update(status=None)
+        self._raw_delete(ExperimentJobStatus.objects.filter(job__experiment_id__in=experiment_ids))
+        Experiment.all.filter(id__in=experiment_ids).update(status=None)
+        self._raw_delete(ExperimentStatus.objects.filter(experiment_id__in=experiment_ids))
+
+    def _delete_experiments(self, queryset):
+        for ids in self._iter_batches(queryset):
+            with transaction.atomic():
+                self._clean_outputs(Experiment.all.filter(id__in=ids))
+                self._delete_experiments_leaves(ids)
+                self._delete_rows(Experiment, ids, content_type='experiment')
+
+    def _delete_experiment_groups_leaves(self, group_ids):
+        self._delete_experiments(Experiment.all.filter(experiment_group_id__in=group_ids))
+        with transaction.atomic():
+            self._raw_delete(
+                ExperimentGroupChartView.objects.filter(experiment_group_id__in=group_ids))
+            ExperimentGroup.all.filter(id__in=group_ids).update(status=None)
+            self._raw_delete(
+                ExperimentGroupStatus.objects.filter(experiment_group_id__in=group_ids))
+
+    def _delete_experiment_groups(self, queryset):
+        for ids in self._iter_batches(queryset):
+            self._delete_experiment_groups_leaves(ids)
+            with transaction.atomic():
+                self._clean_outputs(ExperimentGroup.all.filter(id__in=ids))
+                self._delete_rows(ExperimentGroup, ids, content_type='experimentgroup')
+
+    def _delete_jobs(self,
+                     model,
+                     status_model,
+                     queryset,
+                     content_type=None,
+                     clean_outputs=False):
+        for ids in self._iter_batches(queryset):
+            with transaction.atomic():
+                if clean_outputs:
+                    self._clean_outputs(model.all.filter(id__in=ids))
+                model.all.filter(id__in=ids).update(status=None)
+                self._raw_delete(status_model.objects.filter(job_id__in=ids))
+                self._delete_rows(model, ids, content_type=content_type)
+
+    def _delete_root(self):
+        unique_name = self.root.unique_name
+        with transaction.atomic():
+            _, deleted = self.root.delete()
+        self.summary.update(deleted)
+        _logger.info('Deleted %s with %s', unique_name, dict(self.summary))
+
+    def delete_experiment(self):
+        self._delete_experiments_leaves([self.root.id])
+        self._delete_root()
+
+    def delete_experiment_group(self):
+        self._delete_experiment_groups_leaves([self.root.id])
+        self._delete_root()
+
+    def delete_project(self):
+        project_id = self.root.id
+        self._delete_experiment_groups(ExperimentGroup.all.filter(project_id=project_id))
+        self._delete_experiments(Experiment.all.filter(project_id=project_id))
+        self._delete_jobs(model=Job,
+                          status_model=JobStatus,
+                          queryset=Job.all.filter(project_id=project_id),
+                          content_type='job',
+                          clean_outputs=True)
+        self._delete_jobs(model=TensorboardJob,
+                          status_model=TensorboardJobStatus,
+                          queryset=TensorboardJob.all.filter(project_id=project_id))
+        self._delete_jobs(model=NotebookJob,
+                          status_model=NotebookJobStatus,
+                          queryset=NotebookJob.all.filter(project_id=project_id))
+        # The build jobs are deleted last, the other jobs reference them
+        self._delete_jobs(model=BuildJob,
+                          status_model=BuildJobStatus,
+                          queryset=BuildJob.all.filter(project_id=project_id),
+                          content_type='buildjob')
+        self._delete_root()
+
+
+def delete_project(project, batch_size=None):
+    deletion = SubtreeDeletion(root=project, batch_size=batch_size)
+    deletion.delete_project()
+    return deletion.summary
+
+
+def delete_experiment_group(experiment_group, batch_size=None):
+    deletion = SubtreeDeletion(root=experiment_group, batch_size=batch_size)
+    deletion.delete_experiment_group()
+    return deletion.summary
+
+
+def delete_experiment(experiment, batch_size=None):
+    deletion = SubtreeDeletion(root=experiment, batch_size=batch_size)
+    deletion.delete_experiment()
+    return deletion.summary
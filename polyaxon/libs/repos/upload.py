@@ -0,0 +1,170 @@
+import os
+import shutil
+import tarfile
+import tempfile
+
+from libs.paths.utils import delete_path
+
+GIT_DIR = '.git'
+CHUNK_SIZE = 1024 * 1024
+
+
+def get_member_name(member):
+    """Returns the member's path relative to the repo, None if it must not be extracted."""
+    name = os.path.normpath(member.name)
+    if name == '.' or os.path.isabs(name) or name.split(os.sep)[0] in ('..', GIT_DIR):
+        return None
+    return name
+
+
+def remove_path(path):
+    if os.path.islink(path) or not os.path.isdir(path):
+        os.remove(path)
+    else:
+        shutil.rmtree(path)
+
+
+def make_parents(repo_path, name):
+    """Creates the member's parent dirs, replacing the files that are in the way."""
+    parent = repo_path
+    for part in name.split(os.sep)[:-1]:
+        parent = os.path.join(parent, part)
+        if os.path.islink(parent) or (os.path.lexists(parent) and not os.path.isdir(parent)):
+            os.remove(parent)
+        if not os.path.exists(parent):
+            os.mkdir(parent)
+
+
+def find_divergence(fileobj, path):
+    """Compares the member's content with the file in chunks.
+
+    Returns None if they are identical, else the offset and the member's chunk
+    where they start to differ.
+    """
+    offset = 0
+    with open(path, 'rb') as current:
+        while True:
+            chunk = fileobj.read(CHUNK_SIZE)
+            if chunk != current.read(len(chunk)):
+                return offset, chunk
+            if not chunk:
+                return None
+            offset += len(chunk)
+
+
+def write_member(fileobj, member, path, offset=0, chunk=b''):
+    """Writes the member to a temporary file moved in place once complete.
+
+    The first `offset` bytes, identical to the current file's, are copied from it.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.upload-')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            if offset:
+                with open(path, 'rb') as current:
+                    while offset > 0:
+                        data = current.read(min(CHUNK_SIZE, offset))
+                        tmp.write(data)
+                        offset -= len(data)
+            tmp.write(chunk)
+            shutil.copyfileobj(fileobj, tmp, CHUNK_SIZE)
+        os.chmod(tmp_path, member.mode & 0o777)
+        os.utime(tmp_path, (member.mtime, member.mtime))
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        os.replace(tmp_path, path)
+    finally:
+        delete_path(tmp_path)
+
+
+def sync_file(tar, member, path):
+    """Writes the file member if it differs from the working tree one, returns if it changed."""
+    if not os.path.isfile(path) or os.path.islink(path):
+        write_member(tar.extractfile(member), member, path)
+        return True
+
+    stat = os.stat(path)
+    same_mode = (stat.st_mode & 0o777) == (member.mode & 0o777)
+    if stat.st_size != member.size:
+        write_member(tar.extractfile(member), member, path)
+        return True
+    if same_mode and int(stat.st_mtime) == int(member.mtime):
+        return False
+
+    fileobj = tar.extractfile(member)
+    divergence = find_divergence(fileobj, path)
+    if divergence:
+        offset, chunk = divergence
+        write_member(fileobj, member, path, offset=offset, chunk=chunk)
+        return True
+
+    # Same content, keep the member's mtime to skip the comparison on the next upload
+    if not same_mode:
+        os.chmod(path, member.mode & 0o777)
+    os.utime(path, (member.mtime, member.mtime))
+    return not same_mode
+
+
+def sync_member(tar, member, repo_path, name):
+    """Syncs a member of the tar with the working tree, returns if it changed."""
+    path = os.path.join(repo_path, name)
+    if member.isdir():
+        # Git does not track the dirs, only their files are reported
+        if not os.path.isdir(path) or os.path.islink(path):
+            if os.path.lexists(path):
+                os.remove(path)
+            os.mkdir(path)
+        return False
+
+    make_parents(repo_path, name)
+    if member.isfile():
+        return sync_file(tar, member, path)
+
+    if member.issym() and os.path.islink(path) and os.readlink(path) == member.linkname:
+        return False
+    if os.path.lexists(path):
+        remove_path(path)
+    tar.extract(member, repo_path)
+    return True
+
+
+def sync_repo_files(repo_path, tar_file_name):
+    """Updates the repo's working tree to the content of the tar.
+
+    The tar is streamed, only the files which differ in size, mode or content are written,
+    and the files missing from the tar are deleted. The git dir is never touched.
+
+    Returns a summary with the number of files added, modified and deleted.
+    """
+    summary = {'added': 0, 'modified': 0, 'deleted': 0}
+    uploaded = set()
+    with tarfile.open(tar_file_name, mode='r|*') as tar:
+        for member in tar:
+            name = get_member_name(member)
+            if not name:
+                continue
+            uploaded.add(name)
+            existed = os.path.lexists(os.path.join(repo_path, name))
+            if sync_member(tar=tar, member=member, repo_path=repo_path, name=name):
+                summary['modified' if existed else 'added'] += 1
+
+    directories = []
+    for root, dirs, files in os.walk(repo_path):
+        rel_root = os.path.relpath(root, repo_path)
+        if rel_root == '.':
+            dirs[:] = [d for d in dirs if d != GIT_DIR]
+        else:
+            directories.append((root, os.path.normpath(rel_root)))
+        # The symlinks to dirs are listed, but not followed, as dirs
+        links = [d for d in dirs if os.path.islink(os.path.join(root, d))]
+        for file_name in files + links:
+            name = os.path.normpath(os.path.join(rel_root, file_name))
+            if name not in uploaded:
+                os.remove(os.path.join(root, file_name))
+                summary['deleted'] += 1
+
+    for root, name in reversed(directories):
+        if name not in uploaded and not os.listdir(root):
+            os.rmdir(root)
+
+    return summary
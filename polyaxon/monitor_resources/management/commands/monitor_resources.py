@@ -7,11 +7,12 @@ from hestia.bool_utils import to_bool
 from django.db import InterfaceError, OperationalError, ProgrammingError
 
 import conf
+import stats
 
 from db.models.clusters import Cluster
 from db.models.nodes import ClusterNode
 from libs.base_monitor import BaseMonitorCommand
-from monitor_resources import monitor
+from monitor_resources import monitor, samplers
 
 
 class Command(BaseMonitorCommand):
@@ -46,10 +47,22 @@ class Command(BaseMonitorCommand):
             "log sleep interval: `{}` and persist: `{}`".format(log_sleep_interval, persist),
             ending='\n')
         containers = {}
+        concurrent = conf.get('MONITOR_RESOURCES_CONCURRENT')
+        sampler_kwargs = {}
+        if conf.get('MONITOR_RESOURCES_SAMPLER') == samplers.SAMPLER_CGROUP:
+            sampler_kwargs = {'cgroup_root': conf.get('MONITOR_RESOURCES_CGROUP_ROOT'),
+                              'proc_root': conf.get('MONITOR_RESOURCES_PROC_ROOT')}
+        sampler = samplers.get_sampler(conf.get('MONITOR_RESOURCES_SAMPLER'),
+                                       concurrent=concurrent,
+                                       **sampler_kwargs)
         while True:
             try:
-                if node:
-                    monitor.run(containers, node, persist)
+                with stats.timer('monitor_resources.pass'):
+                    if node and concurrent:
+                        monitor.run_concurrent(containers, sampler, node, persist)
+                    elif node:
+                        monitor.run(containers, node, persist, sampler)
+                stats.gauge('monitor_resources.containers', len(containers))
             except redis.exceptions.ConnectionError as e:
                 monitor.logger.warning("Redis connection is probably already closed %s\n", e)
             except Exception as e:
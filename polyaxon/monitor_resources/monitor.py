@@ -1,7 +1,5 @@
-import json
 import logging
 import re
-import requests
 
 import docker
 
@@ -14,6 +12,7 @@ from constants.containers import ContainerStatuses
 from db.models.nodes import ClusterNode, NodeGPU
 from db.redis.containers import RedisJobContainers
 from db.redis.to_stream import RedisToStream
+from monitor_resources.samplers import DockerSampler
 from schemas.containers import ContainerResourcesConfig
 
 logger = logging.getLogger('polyaxon.monitors.resources')
@@ -55,14 +54,17 @@ def get_container(containers, container_id):
     return container
 
 
-def get_container_resources(node, container, gpu_resources):
+def get_container_resources(node, container, gpu_resources, sampler=None, job=None):
+    """Return the resources of the container,
+    `job` is the (job_uuid, experiment_uuid) of the container if already known.
+    """
     # Check if the container is running
     if container.status != ContainerStatuses.RUNNING:
         logger.debug("`%s` container is not running", container.name)
         RedisJobContainers.remove_container(container.id)
         return
 
-    job_uuid, experiment_uuid = RedisJobContainers.get_job(container.id)
+    job_uuid, experiment_uuid = job or RedisJobContainers.get_job(container.id)
 
     if not job_uuid:
         logger.debug("`%s` container is not recognised", container.name)
@@ -72,17 +74,26 @@ def get_container_resources(node, container, gpu_resources):
         "Streaming resources for container %s in (job, experiment) (`%s`, `%s`) ",
         container.id, job_uuid, experiment_uuid)
 
+    sampler = sampler or DockerSampler()
     try:
-        stats = container.stats(decode=True, stream=False)
-    except json.decoder.JSONDecodeError:
-        logger.info("Error streaming states for `%s`", container.name)
+        stats = sampler.get_stats(container)
     except NotFound:
         logger.debug("`%s` was not found", container.name)
         RedisJobContainers.remove_container(container.id)
+        sampler.discard(container.id)
         return
-    except requests.ReadTimeout:
+    if not stats:
         return
 
+    return get_resources_from_stats(node=node,
+                                    container=container,
+                                    stats=stats,
+                                    job_uuid=job_uuid,
+                                    experiment_uuid=experiment_uuid,
+                                    gpu_resources=gpu_resources)
+
+
+def get_resources_from_stats(node, container, stats, job_uuid, experiment_uuid, gpu_resources):
     precpu_stats = stats['precpu_stats']
     cpu_stats = stats['cpu_stats']
 
@@ -94,8 +105,9 @@ def get_container_resources(node, container, gpu_resources):
     system_cpu_usage = float(cpu_stats['system_cpu_usage'])
     delta_system_cpu_usage = system_cpu_usage - pre_system_cpu_usage
 
-    percpu_usage = cpu_stats['cpu_usage']['percpu_usage']
-    num_cpu_cores = len(percpu_usage)
+    # The per cpu usage is not reported with cgroup v2
+    percpu_usage = cpu_stats['cpu_usage'].get('percpu_usage') or []
+    num_cpu_cores = len(percpu_usage) or cpu_stats['online_cpus']
     if num_cpu_cores >= node.cpu * 1.5:
         logger.warning('Docker reporting num cpus `%s` and kubernetes reporting `%s`',
                        num_cpu_cores, node.cpu)
@@ -104,7 +116,11 @@ def get_container_resources(node, container, gpu_resources):
     percpu_percentage = [0.] * num_cpu_cores
     if delta_total_usage > 0 and delta_system_cpu_usage > 0:
         cpu_percentage = (delta_total_usage / delta_system_cpu_usage) * num_cpu_cores * 100.0
-        percpu_percentage = [cpu_usage / total_usage * cpu_percentage for cpu_usage in percpu_usage]
+        if percpu_usage:
+            percpu_percentage = [cpu_usage / total_usage * cpu_percentage
+                                 for cpu_usage in percpu_usage]
+        else:
+            percpu_percentage = [cpu_percentage / num_cpu_cores] * num_cpu_cores
 
     memory_used = int(stats['memory_stats']['usage'])
     memory_limit = int(stats['memory_stats']['limit'])
@@ -144,18 +160,24 @@ def update_cluster_node(node_gpus):
         node_gpu.save()
 
 
-def run(containers, node, persist):
+def run(containers, node, persist, sampler=None):
     container_ids = RedisJobContainers.get_containers()
     gpu_resources = get_gpu_resources()
     if gpu_resources:
         gpu_resources = {gpu_resource['index']: gpu_resource for gpu_resource in gpu_resources}
     update_cluster_node(gpu_resources)
+    jobs = RedisJobContainers.get_jobs(container_ids)
+    payloads = {}
     for container_id in container_ids:
         container = get_container(containers, container_id)
         if not container:
             continue
         try:
-            payload = get_container_resources(node, containers[container_id], gpu_resources)
+            payload = get_container_resources(node=node,
+                                              container=containers[container_id],
+                                              gpu_resources=gpu_resources,
+                                              sampler=sampler,
+                                              job=jobs.get(container_id, (None, None)))
         except KeyError:
             payload = None
         if payload:
@@ -166,12 +188,76 @@ def run(containers, node, persist):
             #     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_RESOURCES,
             #     kwargs={'payload': payload, 'persist': persist})
 
-            job_uuid = payload['job_uuid']
-            # Check if we should stream the payload
-            # Check if we have this container already in place
-            experiment_uuid = RedisJobContainers.get_experiment_for_job(job_uuid)
-            set_last_resources_cond = (
-                RedisToStream.is_monitored_job_resources(job_uuid) or
-                RedisToStream.is_monitored_experiment_resources(experiment_uuid))
-            if set_last_resources_cond:
-                RedisToStream.set_latest_job_resources(job_uuid, payload)
+            job_uuid, experiment_uuid = jobs[container_id]
+            payloads[job_uuid] = (experiment_uuid, payload)
+
+    # Check if we should stream the payloads
+    monitored_jobs = RedisToStream.get_monitored_jobs_resources(
+        [(job_uuid, experiment_uuid) for job_uuid, (experiment_uuid, _) in payloads.items()])
+    RedisToStream.set_latest_jobs_resources({
+        job_uuid: payload for job_uuid, (_, payload) in payloads.items()
+        if job_uuid in monitored_jobs
+    })
+
+
+def run_concurrent(containers, sampler, node, persist):
+    """Collect the resources of all containers with a pass duration independent of their number.
+
+    The stats are read from a non blocking `sampler`, and the redis lookups and writes are batched.
+    """
+    container_ids = RedisJobContainers.get_containers()
+    gpu_resources = get_gpu_resources()
+    if gpu_resources:
+        gpu_resources = {gpu_resource['index']: gpu_resource for gpu_resource in gpu_resources}
+    update_cluster_node(gpu_resources)
+
+    # One call to check which containers are visible and running in this node
+    node_containers = {
+        container.id: container.status
+        for container in docker_client.containers.list(all=True, sparse=True)
+    }
+    for container_id in list(containers.keys()):
+        if node_containers.get(container_id) != ContainerStatuses.RUNNING:
+            containers.pop(container_id)
+            sampler.discard(container_id)
+
+    stopped_containers = []
+    for container_id in container_ids:
+        if container_id not in node_containers:
+            continue
+        if node_containers[container_id] != ContainerStatuses.RUNNING:
+            stopped_containers.append(container_id)
+            continue
+        if container_id not in containers:
+            # Loads the new container in `containers` if it is visible and running
+            get_container(containers, container_id)
+    RedisJobContainers.remove_containers(stopped_containers)
+
+    jobs = RedisJobContainers.get_jobs([c for c in container_ids if c in containers])
+    payloads = {}
+    for container_id, (job_uuid, experiment_uuid) in jobs.items():
+        try:
+            stats = sampler.get_stats(containers[container_id])
+        except NotFound:
+            sampler.discard(container_id)
+            continue
+        if not stats:
+            continue
+        try:
+            payload = get_resources_from_stats(node=node,
+                                               container=containers[container_id],
+                                               stats=stats,
+                                               job_uuid=job_uuid,
+                                               experiment_uuid=experiment_uuid,
+                                               gpu_resources=gpu_resources)
+        except KeyError:
+            payload = None
+        if payload:
+            payloads[job_uuid] = (experiment_uuid, payload.to_dict())
+
+    monitored_jobs = RedisToStream.get_monitored_jobs_resources(
+        [(job_uuid, experiment_uuid) for job_uuid, (experiment_uuid, _) in payloads.items()])
+    RedisToStream.set_latest_jobs_resources({
+        job_uuid: payload for job_uuid, (_, payload) in payloads.items()
+        if job_uuid in monitored_jobs
+    })
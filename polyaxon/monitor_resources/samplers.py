@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import requests
+import threading
+
+from docker.errors import NotFound
+
+logger = logging.getLogger('polyaxon.monitors.resources')
+
+
+class BaseSampler(object):
+    """A sampler returns the stats of a container in the docker stats api format.
+
+    Only the keys used by the monitor are required:
+    `cpu_stats`, `precpu_stats` and `memory_stats`.
+    """
+
+    def get_stats(self, container):
+        raise NotImplementedError
+
+    def discard(self, container_id):
+        """Drop any state kept for the container."""
+
+
+class DockerSampler(BaseSampler):
+    """Blocking call to the docker stats api, the daemon samples twice for the deltas."""
+
+    def get_stats(self, container):
+        try:
+            return container.stats(decode=True, stream=False)
+        except json.decoder.JSONDecodeError:
+            logger.info("Error streaming states for `%s`", container.name)
+        except requests.ReadTimeout:
+            pass
+        return None
+
+
+class DockerStreamSampler(BaseSampler):
+    """Keeps one long-lived streaming stats subscription per container.
+
+    Each subscription runs in a daemon thread and only keeps the latest sample,
+    so reading the resources of all containers does not block on the docker daemon.
+    """
+
+    def __init__(self):
+        self._latest_stats = {}
+        self._threads = {}
+        self._lock = threading.Lock()
+
+    def _is_subscribed(self, container_id, thread):
+        return self._threads.get(container_id) is thread
+
+    def _consume(self, container):
+        thread = threading.current_thread()
+        try:
+            for stats in container.stats(decode=True, stream=True):
+                with self._lock:
+                    if not self._is_subscribed(container.id, thread):
+                        # Discarded, a newer subscription may own the container's entries
+                        return
+                    self._latest_stats[container.id] = stats
+        except NotFound:
+            logger.debug("`%s` was not found", container.name)
+        except (json.decoder.JSONDecodeError, requests.RequestException) as e:
+            logger.info("Error streaming states for `%s`: %s", container.name, e)
+        finally:
+            self._discard(container.id, thread=thread)
+
+    def subscribe(self, container):
+        with self._lock:
+            if container.id in self._threads:
+                return
+            thread = threading.Thread(target=self._consume,
+                                      args=(container,),
+                                      name='stats-{}'.format(container.name))
+            thread.daemon = True
+            self._threads[container.id] = thread
+        thread.start()
+
+    def get_stats(self, container):
+        self.subscribe(container)
+        return self._latest_stats.get(container.id)
+
+    def _discard(self, container_id, thread=None):
+        """Drops the container's entries, only if owned by `thread` when given."""
+        with self._lock:
+            if thread is not None and not self._is_subscribed(container_id, thread):
+                return
+            self._latest_stats.pop(container_id, None)
+            self._threads.pop(container_id, None)
+
+    def discard(self, container_id):
+        """Drops the container's entries, its stream stops at its next sample."""
+        self._discard(container_id)
+
+
+class CgroupSampler(BaseSampler):
+    """Reads the cgroup v1/v2 accounting files of the containers directly.
+
+    The previous sample of every container is kept in memory to compute the cpu deltas,
+    the first sample of a container does not return any stats.
+    """
+
+    def __init__(self, cgroup_root='/sys/fs/cgroup', proc_root='/proc'):
+        self.cgroup_root = cgroup_root
+        self.proc_root = proc_root
+        self._cgroups = {}
+        self._previous_stats = {}
+        self._clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+    @staticmethod
+    def _read(path):
+        with open(path, 'r') as f:
+            return f.read().strip()
+
+    def _read_int(self, path):
+        return int(self._read(path))
+
+    def _get_cgroups(self, container):
+        """Maps the cgroup controllers of the container's process to their paths,
+        the cgroup v2 unified hierarchy uses the empty controller `''`.
+        """
+        if container.id in self._cgroups:
+            return self._cgroups[container.id]
+
+        pid = container.attrs['State']['Pid']
+        if not pid:
+            return None
+        cgroups = {}
+        for line in self._read(os.path.join(self.proc_root, str(pid), 'cgroup')).splitlines():
+            _, controllers, path = line.split(':', 2)
+            for controller in controllers.split(','):
+                cgroups[controller] = path.lstrip('/')
+        self._cgroups[container.id] = cgroups
+        return cgroups
+
+    def _get_v1_path(self, cgroups, controller, filename):
+        return os.path.join(self.cgroup_root, controller, cgroups[controller], filename)
+
+    def _get_v2_path(self, cgroups, filename):
+        return os.path.join(self.cgroup_root, cgroups[''], filename)
+
+    def get_system_cpu_usage(self):
+        """The host cpu time in nanoseconds, computed the same way as docker."""
+        fields = self._read(os.path.join(self.proc_root, 'stat')).splitlines()[0].split()
+        ticks = sum(int(field) for field in fields[1:8])
+        return ticks * 10 ** 9 // self._clock_ticks
+
+    def get_host_memory(self):
+        for line in self._read(os.path.join(self.proc_root, 'meminfo')).splitlines():
+            if line.startswith('MemTotal:'):
+                return int(line.split()[1]) * 1024
+        return 0
+
+    def get_cpu_usage(self, cgroups):
+        if 'cpuacct' in cgroups:
+            total_usage = self._read_int(self._get_v1_path(cgroups, 'cpuacct', 'cpuacct.usage'))
+            percpu_usage = [int(value) for value in self._read(
+                self._get_v1_path(cgroups, 'cpuacct', 'cpuacct.usage_percpu')).split()]
+            return {'total_usage': total_usage, 'percpu_usage': percpu_usage}
+
+        cpu_stat = dict(line.split() for line in self._read(
+            self._get_v2_path(cgroups, 'cpu.stat')).splitlines())
+        return {'total_usage': int(cpu_stat['usage_usec']) * 1000}
+
+    def get_memory_stats(self, cgroups):
+        if 'memory' in cgroups:
+            return {
+                'usage': self._read_int(
+                    self._get_v1_path(cgroups, 'memory', 'memory.usage_in_bytes')),
+                'limit': min(
+                    self._read_int(self._get_v1_path(cgroups, 'memory', 'memory.limit_in_bytes')),
+                    self.get_host_memory()),
+            }
+
+        limit = self._read(self._get_v2_path(cgroups, 'memory.max'))
+        return {
+            'usage': self._read_int(self._get_v2_path(cgroups, 'memory.current')),
+            'limit': self.get_host_memory() if limit == 'max' else int(limit),
+        }
+
+    def get_stats(self, container):
+        try:
+            cgroups = self._get_cgroups(container)
+            if not cgroups:
+                return None
+            cpu_stats = {
+                'cpu_usage': self.get_cpu_usage(cgroups),
+                'system_cpu_usage': self.get_system_cpu_usage(),
+                'online_cpus': os.cpu_count(),
+            }
+            memory_stats = self.get_memory_stats(cgroups)
+        except (IOError, KeyError, ValueError) as e:
+            # The container was probably stopped or restarted, the cgroups will be resolved again
+            logger.debug("Could not sample the cgroups of `%s`: %s", container.name, e)
+            self.discard(container.id)
+            return None
+
+        precpu_stats = self._previous_stats.get(container.id)
+        self._previous_stats[container.id] = cpu_stats
+        if not precpu_stats:
+            return None
+        return {
+            'precpu_stats': precpu_stats,
+            'cpu_stats': cpu_stats,
+            'memory_stats': memory_stats,
+        }
+
+    def discard(self, container_id):
+        self._cgroups.pop(container_id, None)
+        self._previous_stats.pop(container_id, None)
+
+
+SAMPLER_DOCKER = 'docker'
+SAMPLER_CGROUP = 'cgroup'
+
+
+def get_sampler(backend, concurrent=False, **kwargs):
+    if backend == SAMPLER_CGROUP:
+        return CgroupSampler(**kwargs)
+    if concurrent:
+        return DockerStreamSampler()
+    return DockerSampler()
@@ -0,0 +1,105 @@
+import logging
+import threading
+import uuid
+
+from collections import OrderedDict
+
+import stats
+
+from constants.jobs import JobLifeCycle
+from polyaxon.celery_api import celery_app
+from polyaxon.settings import K8SEventsCeleryTasks
+
+logger = logging.getLogger('polyaxon.monitors.statuses')
+
+# The experiment jobs' states are applied in bulk by a single task
+BULK_TASKS = {
+    K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES:
+        K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOBS_STATUSES,
+}
+
+
+class StatusesCoalescer(object):
+    """Buffers the pods' states per job and only sends the last one received in the window.
+
+    A burst of phase changes, e.g. a distributed experiment starting or a node draining,
+    results in a task per job, or a task for all the experiment jobs,
+    instead of a task per event.
+    A done state is never superseded by a later state that is not done.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        # Metrics of the events received, coalesced, and sent to the handlers
+        self.num_received = 0
+        self.num_coalesced = 0
+        self.num_sent = 0
+        # The events received and coalesced since the last flush
+        self._window_received = 0
+        self._window_coalesced = 0
+
+    @staticmethod
+    def get_key(task, pod_state):
+        return task, uuid.UUID(pod_state['details']['labels']['job_uuid']).hex
+
+    def add(self, task, pod_state):
+        key = self.get_key(task=task, pod_state=pod_state)
+        with self._lock:
+            previous_state = self._states.pop(key, None)
+            if (previous_state and JobLifeCycle.is_done(previous_state['status']) and
+                    not JobLifeCycle.is_done(pod_state['status'])):
+                pod_state = previous_state
+            self._states[key] = pod_state
+            self.num_received += 1
+            self._window_received += 1
+            if previous_state:
+                self.num_coalesced += 1
+                self._window_coalesced += 1
+
+    def flush(self):
+        with self._lock:
+            states, self._states = self._states, OrderedDict()
+            received, self._window_received = self._window_received, 0
+            coalesced, self._window_coalesced = self._window_coalesced, 0
+        if not states:
+            return
+
+        bulk_payloads = OrderedDict()
+        for (task, _), pod_state in states.items():
+            if task in BULK_TASKS:
+                bulk_payloads.setdefault(BULK_TASKS[task], []).append(pod_state)
+            else:
+                celery_app.send_task(task, kwargs={'payload': pod_state})
+        for task, payloads in bulk_payloads.items():
+            celery_app.send_task(task, kwargs={'payloads': payloads})
+
+        self.num_sent += len(states)
+        stats.incr('statuses.received', received)
+        stats.incr('statuses.coalesced', coalesced)
+        stats.incr('statuses.sent', len(states))
+        logger.info('Sent %s states, %s received and %s coalesced states in total.',
+                    len(states), self.num_received, self.num_coalesced)
+
+    def _run(self):
+        while not self._stopped.wait(self.window):
+            try:
+                self.flush()
+            except Exception as e:  # The flushing should survive a broker's hiccup
+                logger.exception('Could not flush the coalesced states %s', e)
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='statuses-coalescer')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
@@ -5,6 +5,7 @@ import ocular
 
 from constants.jobs import JobLifeCycle
 from db.redis.containers import RedisJobContainers
+from monitor_statuses.coalescer import StatusesCoalescer
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import K8SEventsCeleryTasks
 
@@ -51,7 +52,26 @@ def get_label_selector():
         conf.get('TYPE_LABELS_RUNNER'))
 
 
+def send_state(task, pod_state, coalescer=None):
+    if coalescer:
+        coalescer.add(task=task, pod_state=pod_state)
+    else:
+        celery_app.send_task(task, kwargs={'payload': pod_state})
+
+
 def run(k8s_manager):
+    window = conf.get('STATUSES_COALESCING_WINDOW')
+    coalescer = StatusesCoalescer(window=window) if window else None
+    if coalescer:
+        coalescer.start()
+    try:
+        watch(k8s_manager=k8s_manager, coalescer=coalescer)
+    finally:
+        if coalescer:
+            coalescer.stop()
+
+
+def watch(k8s_manager, coalescer=None):
     for (event_object, pod_state) in ocular.monitor(k8s_manager.k8s_api,
                                                     namespace=conf.get('K8S_NAMESPACE'),
                                                     container_names=(
@@ -96,30 +116,30 @@ def run(k8s_manager):
             update_job_containers(event_object, status, conf.get('CONTAINER_NAME_EXPERIMENT_JOB'))
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle experiment job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            send_state(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES,
+                       pod_state=pod_state,
+                       coalescer=coalescer)
 
         elif job_condition:
             update_job_containers(event_object, status, conf.get('CONTAINER_NAME_JOB'))
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle experiment job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            send_state(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES,
+                       pod_state=pod_state,
+                       coalescer=coalescer)
 
         elif plugin_job_condition:
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle plugin job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            send_state(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES,
+                       pod_state=pod_state,
+                       coalescer=coalescer)
 
         elif dockerizer_job_condition:
             logger.debug("Sending state to handler %s, %s", status, labels)
             # Handle dockerizer job statuses
-            celery_app.send_task(
-                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES,
-                kwargs={'payload': pod_state})
+            send_state(task=K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES,
+                       pod_state=pod_state,
+                       coalescer=coalescer)
         else:
             logger.info("Lost state %s, %s", status, pod_state)
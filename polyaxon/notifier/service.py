@@ -22,10 +22,9 @@ class NotifierService(EventService):
             return get_project_recipients(event.instance)
         return get_instance_and_project_recipients(event.instance)
 
-    def create_notification(self, event, recipients):
+    def get_notification_event(self, event):
         actor_id = event.data.get(event.actor_id)
-        actor_id = actor_id if actor_id != user_system.USER_SYSTEM_ID else None
-        notification_event = self.notification_event.objects.create(
+        return self.notification_event(
             event_type=event.event_type,
             actor_id=actor_id if actor_id != user_system.USER_SYSTEM_ID else None,
             context=event.data,
@@ -34,8 +33,17 @@ class NotifierService(EventService):
             content_type_id=event.instance_contenttype
         )
 
+    def create_notification(self, event, recipients):
+        self.create_notifications(events=[event], events_recipients=[recipients])
+
+    def create_notifications(self, events, events_recipients):
+        notification_events = self.notification_event.objects.bulk_create([
+            self.get_notification_event(event) for event in events
+        ])
+
         self.notification.objects.bulk_create([
             self.notification(event=notification_event, user_id=recipient.id)
+            for notification_event, recipients in zip(notification_events, events_recipients)
             for recipient in recipients
         ])
 
@@ -59,13 +67,7 @@ class NotifierService(EventService):
 
         return event
 
-    def record_event(self, event):
-        event = self.validate_event_instance(event=event)
-        if not event:  # No notification, reason is that the object is probably deleted from the db
-            return
-
-        recipients = self.get_recipients(event)
-        self.create_notification(event, recipients)
+    def execute_actions(self, event, recipients):
         for action in self.action_manager.values:
             config = None
             if action == EmailAction:
@@ -76,6 +78,26 @@ class NotifierService(EventService):
             except Exception as e:
                 action.logger.warning('Action execution failed %s', e, exc_info=True)
 
+    def record_event(self, event):
+        event = self.validate_event_instance(event=event)
+        if not event:  # No notification, reason is that the object is probably deleted from the db
+            return
+
+        recipients = self.get_recipients(event)
+        self.create_notification(event, recipients)
+        self.execute_actions(event, recipients)
+
+    def record_events(self, events):
+        # No notification for events with objects that were probably deleted from the db
+        events = [event for event in map(self.validate_event_instance, events) if event]
+        if not events:
+            return
+
+        events_recipients = [self.get_recipients(event) for event in events]
+        self.create_notifications(events, events_recipients)
+        for event, recipients in zip(events, events_recipients):
+            self.execute_actions(event, recipients)
+
     def setup(self):
         super().setup()
         # Load default event types and actions
@@ -12,9 +12,15 @@ STATES = states
 
 
 class CeleryTask(Task):
-    """Base custom celery task with basic logging."""
+    """Base custom celery task with basic logging and timing."""
     abstract = True
 
+    def __call__(self, *args, **kwargs):
+        import stats
+
+        with stats.timer('celery.tasks.{}'.format(self.name)):
+            return super().__call__(*args, **kwargs)
+
     def on_success(self, retval, task_id, args, kwargs):
         _logger.info("Async task succeeded", extra={'task name': self.name})
 
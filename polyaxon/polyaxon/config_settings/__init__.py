@@ -13,6 +13,7 @@ from .oauth import *
 from .ownership import *
 from .redis_settings import *
 from .secrets import *
+from .stats import *
 from .tracker import *
 from .versions import *
 
@@ -208,6 +208,7 @@ class K8SEventsCeleryTasks(object):
     K8S_EVENTS_HANDLE_NAMESPACE = 'k8s_events_handle_namespace'
     K8S_EVENTS_HANDLE_RESOURCES = 'k8s_events_handle_resources'
     K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES = 'k8s_events_handle_experiment_job_statuses'
+    K8S_EVENTS_HANDLE_EXPERIMENT_JOBS_STATUSES = 'k8s_events_handle_experiment_jobs_statuses'
     K8S_EVENTS_HANDLE_JOB_STATUSES = 'k8s_events_handle_job_statuses'
     K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES = 'k8s_events_handle_plugin_job_statuses'
     K8S_EVENTS_HANDLE_BUILD_JOB_STATUSES = 'k8s_events_handle_build_job_statuses'
@@ -222,6 +223,8 @@ class EventsCeleryTasks(object):
     EVENTS_NOTIFY = 'events_notify'
     EVENTS_TRACK = 'events_track'
     EVENTS_LOG = 'events_log'
+    EVENTS_RECORD = 'events_record'
+    EVENTS_RECORD_BATCH = 'events_record_batch'
 
 
 class LogsCeleryTasks(object):
@@ -613,6 +616,11 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.EVENTS_TRACK},
     EventsCeleryTasks.EVENTS_LOG:
         {'queue': CeleryQueues.EVENTS_LOG},
+    # The events are logged first, the log queue is consumed by all the events handlers
+    EventsCeleryTasks.EVENTS_RECORD:
+        {'queue': CeleryQueues.EVENTS_LOG},
+    EventsCeleryTasks.EVENTS_RECORD_BATCH:
+        {'queue': CeleryQueues.EVENTS_LOG},
 
     # K8S Events health
     K8SEventsCeleryTasks.K8S_EVENTS_HEALTH:
@@ -625,6 +633,8 @@ CELERY_TASK_ROUTES = {
         {'queue': CeleryQueues.K8S_EVENTS_RESOURCES},
     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES:
         {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
+    K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOBS_STATUSES:
+        {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES:
         {'queue': CeleryQueues.K8S_EVENTS_JOB_STATUSES},
     K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_PLUGIN_JOB_STATUSES:
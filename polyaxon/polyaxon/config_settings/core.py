@@ -12,6 +12,10 @@ K8S_TPU_RESOURCE_KEY = config.get_string('POLYAXON_K8S_TPU_RESOURCE_KEY',
 CONF_BACKEND = config.get_string('POLYAXON_CONF_BACKEND', is_optional=True)
 CLUSTER_ID = config.cluster_id
 REPOS_ARCHIVE_ROOT = '/tmp/archived_repos'
+# Size in bytes of the repos' archives cache
+REPOS_ARCHIVE_MAX_SIZE = config.get_int('POLYAXON_REPOS_ARCHIVE_MAX_SIZE',
+                                        is_optional=True,
+                                        default=5 * 1024 ** 3)
 OUTPUTS_ARCHIVE_ROOT = '/tmp/archived_outputs'
 OUTPUTS_DOWNLOAD_ROOT = '/tmp/download_outputs'
 LOGS_ARCHIVE_ROOT = '/tmp/archived_logs'
@@ -23,6 +27,26 @@ ADMIN_VIEW_ENABLED = config.get_boolean('POLYAXON_ADMIN_VIEW_ENABLED',
 TTL_HEARTBEAT = config.get_int('POLYAXON_TTL_HEARTBEAT',
                                is_optional=True,
                                default=60 * 30)
+# Experiments' job statuses vectors ttl, refreshed on every job status
+TTL_EXPERIMENT_JOB_STATUSES = config.get_int('POLYAXON_TTL_EXPERIMENT_JOB_STATUSES',
+                                             is_optional=True,
+                                             default=60 * 60 * 24)
+# The cache ttl of the images found in the registry
+TTL_IMAGE_EXISTS = config.get_int('POLYAXON_TTL_IMAGE_EXISTS',
+                                  is_optional=True,
+                                  default=60 * 60 * 24)
+# The cache ttl of the tokens, projects and experiments resolved by the api
+TTL_LOOKUPS = config.get_int('POLYAXON_TTL_LOOKUPS',
+                             is_optional=True,
+                             default=30)
+# Heartbeat check with one pipelined sweep instead of a task per run
+HEARTBEAT_SWEEP = config.get_boolean('POLYAXON_HEARTBEAT_SWEEP',
+                                     is_optional=True,
+                                     default=False)
+# Max number of rows deleted by a query when deleting the archived projects, groups and experiments
+DELETION_BATCH_SIZE = config.get_int('POLYAXON_DELETION_BATCH_SIZE',
+                                     is_optional=True,
+                                     default=1000)
 # Token time in days
 TTL_TOKEN = config.get_int('POLYAXON_TTL_TOKEN',
                            is_optional=True,
@@ -39,6 +63,18 @@ GROUP_CHECKS_INTERVAL = config.get_int('POLYAXON_GROUP_CHECKS_INTERVAL',
 
 # Auditor backend
 AUDITOR_BACKEND = config.get_string('POLYAXON_AUDITOR_BACKEND', is_optional=True)
+# Number of events to buffer per process before sending them as one batch, 0 disables buffering
+AUDITOR_BUFFER_SIZE = config.get_int('POLYAXON_AUDITOR_BUFFER_SIZE',
+                                     is_optional=True,
+                                     default=0)
+# Max number of seconds an event can stay in the buffer
+AUDITOR_BUFFER_TIMEOUT = config.get_int('POLYAXON_AUDITOR_BUFFER_TIMEOUT',
+                                        is_optional=True,
+                                        default=5)
+# Rate at which `*viewed` events are recorded, 0 skips them entirely
+AUDITOR_VIEWED_EVENTS_SAMPLE_RATE = config.get_float('POLYAXON_AUDITOR_VIEWED_EVENTS_SAMPLE_RATE',
+                                                     is_optional=True,
+                                                     default=1.)
 
 
 def get_allowed_hosts():
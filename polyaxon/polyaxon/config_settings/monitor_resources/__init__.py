@@ -1,3 +1,4 @@
+from polyaxon.config_settings.resources import *
 from polyaxon.config_settings.spawner import *
 
 from .apps import *
@@ -18,3 +18,16 @@ class RedisPools(object):
         config.get_string('POLYAXON_HEARTBEAT_URL'))
     GROUP_CHECKS = redis.ConnectionPool.from_url(
         config.get_string('POLYAXON_GROUP_CHECKS_URL'))
+    # Defaults to the heartbeat's db for the deployments not providing a dedicated db
+    STATUSES = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_STATUSES_URL',
+                          is_optional=True,
+                          default=config.get_string('POLYAXON_HEARTBEAT_URL')))
+    IMAGES = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_IMAGES_URL',
+                          is_optional=True,
+                          default=config.get_string('POLYAXON_HEARTBEAT_URL')))
+    LOOKUPS = redis.ConnectionPool.from_url(
+        config.get_string('POLYAXON_REDIS_LOOKUPS_URL',
+                          is_optional=True,
+                          default=config.get_string('POLYAXON_HEARTBEAT_URL')))
@@ -12,6 +12,12 @@ REGISTRY_PORT = config.get_string('POLYAXON_REGISTRY_PORT', is_optional=True)
 REGISTRY_NODE_PORT = config.get_string('POLYAXON_REGISTRY_NODE_PORT', is_optional=True)
 REGISTRY_HOST = '{}:{}'.format('127.0.0.1', REGISTRY_NODE_PORT)
 PRIVATE_REGISTRIES_PREFIX = 'POLYAXON_PRIVATE_REGISTRY_'
+# The timeout in seconds of the registry's manifests checks
+REGISTRY_TIMEOUT = config.get_int('POLYAXON_REGISTRY_TIMEOUT', is_optional=True, default=5)
+# Build the dependencies in a base image, reused by the builds with the same dependencies
+DOCKERIZER_DEPENDENCIES_IMAGES = config.get_boolean('POLYAXON_DOCKERIZER_DEPENDENCIES_IMAGES',
+                                                    is_optional=True,
+                                                    default=False)
 
 
 def get_external_registries():
@@ -0,0 +1,17 @@
+from polyaxon.config_manager import config
+
+# Collect the containers' resources concurrently from long-lived stats streams
+MONITOR_RESOURCES_CONCURRENT = config.get_boolean('POLYAXON_MONITOR_RESOURCES_CONCURRENT',
+                                                  is_optional=True,
+                                                  default=False)
+
+# The sampler used to read the containers' stats: `docker` or `cgroup`
+MONITOR_RESOURCES_SAMPLER = config.get_string('POLYAXON_MONITOR_RESOURCES_SAMPLER',
+                                              is_optional=True,
+                                              default='docker')
+MONITOR_RESOURCES_CGROUP_ROOT = config.get_string('POLYAXON_MONITOR_RESOURCES_CGROUP_ROOT',
+                                                  is_optional=True,
+                                                  default='/sys/fs/cgroup')
+MONITOR_RESOURCES_PROC_ROOT = config.get_string('POLYAXON_MONITOR_RESOURCES_PROC_ROOT',
+                                                is_optional=True,
+                                                default='/proc')
@@ -1,10 +1,25 @@
 from polyaxon.config_manager import config
 
 STATS_BACKEND_NOOP = 'noop'
+STATS_BACKEND_MEMORY = 'memory'
 STATS_BACKEND_DATADOG = 'datadog'
 STATS_BACKEND_STATSD = 'statsd'
 STATS_BACKEND = config.get_string(
     'POLYAXON_STATS_BACKEND',
     is_optional=True,
     default=STATS_BACKEND_NOOP,
-    options=(STATS_BACKEND_NOOP, STATS_BACKEND_DATADOG, STATS_BACKEND_STATSD))
+    options=(STATS_BACKEND_NOOP,
+             STATS_BACKEND_MEMORY,
+             STATS_BACKEND_DATADOG,
+             STATS_BACKEND_STATSD))
+STATS_DEFAULT_PREFIX = config.get_string('POLYAXON_STATS_DEFAULT_PREFIX',
+                                         is_optional=True,
+                                         default='polyaxon')
+# Number of metrics to buffer per process before emitting them, 0 emits every metric inline
+STATS_BUFFER_SIZE = config.get_int('POLYAXON_STATS_BUFFER_SIZE',
+                                   is_optional=True,
+                                   default=100)
+# Max number of seconds a metric can stay in the buffer
+STATS_FLUSH_INTERVAL = config.get_int('POLYAXON_STATS_FLUSH_INTERVAL',
+                                      is_optional=True,
+                                      default=5)
@@ -3,3 +3,7 @@ from polyaxon.config_manager import config
 TTL_WATCH_STATUSES = config.get_int('POLYAXON_TTL_WATCH_STATUSES',
                                     is_optional=True,
                                     default=60 * 20)
+# Window in seconds during which the pods' states are coalesced per job, 0 to disable
+STATUSES_COALESCING_WINDOW = config.get_int('POLYAXON_STATUSES_COALESCING_WINDOW',
+                                            is_optional=True,
+                                            default=2)
@@ -36,8 +36,8 @@ class PublisherService(Service):
                     'experiment_uuid': experiment_uuid,
                     'log_lines': log_lines})
         try:
-            should_stream = (RedisToStream.is_monitored_job_logs(job_uuid) or
-                             RedisToStream.is_monitored_experiment_logs(experiment_uuid))
+            should_stream = RedisToStream.is_monitored_job_or_experiment_logs(
+                job_uuid=job_uuid, experiment_uuid=experiment_uuid)
         except RedisError:
             should_stream = False
         if should_stream:
@@ -1,4 +1,6 @@
 from collections import namedtuple
+from functools import reduce
+from operator import or_
 
 from hestia.date_formatter import DateTimeFormatter, DateTimeFormatterException
 from hestia.list_utils import to_list
@@ -57,13 +59,13 @@ class BaseOperatorCondition(BaseCondition):
 class CallbackCondition(BaseCondition):
     """The `CallbackCondition` represents a filter based on a callback to apply."""
 
-    def __init__(self, callback):
+    def __init__(self, callback, negation=False):
         self.callback = callback
-        self.negation = False
+        self.negation = negation
 
     def __call__(self, op, negation=False):
-        self.negation = negation
-        return self
+        # A new condition, the built conditions are cached and must not share the negation
+        return CallbackCondition(callback=self.callback, negation=negation)
 
     def apply(self, queryset, name, params):
         return self.callback(queryset, params, self.negation)
@@ -78,7 +80,7 @@ class EqualityCondition(BaseOperatorCondition):
 
     @classmethod
     def _get_operator(cls, op, negation=False):
-        if op not in cls.VALUES and op not in cls.REPRESENTATIONS:
+        if op not in EqualityCondition.VALUES and op not in EqualityCondition.REPRESENTATIONS:
             return None
 
         if negation:
@@ -106,10 +108,10 @@ class ComparisonCondition(EqualityCondition):
 
     @classmethod
     def _get_operator(cls, op, negation=False):
-        if op not in cls.VALUES and op not in cls.REPRESENTATIONS:
+        if op not in ComparisonCondition.VALUES and op not in ComparisonCondition.REPRESENTATIONS:
             return None
 
-        _op = EqualityCondition._get_operator(op, negation)
+        _op = super()._get_operator(op, negation)
         if _op:
             return _op
 
@@ -163,10 +165,10 @@ class DateTimeCondition(ComparisonCondition):
 
     @classmethod
     def _get_operator(cls, op, negation=False):
-        if op not in cls.VALUES and op not in cls.REPRESENTATIONS:
+        if op not in DateTimeCondition.VALUES and op not in DateTimeCondition.REPRESENTATIONS:
             return None
 
-        _op = ComparisonCondition._get_operator(op, negation)
+        _op = super()._get_operator(op, negation)
         if _op:
             return _op
 
@@ -200,10 +202,10 @@ class ValueCondition(EqualityCondition):
 
     @classmethod
     def _get_operator(cls, op, negation=False):
-        if op not in cls.VALUES and op not in cls.REPRESENTATIONS:
+        if op not in ValueCondition.VALUES and op not in ValueCondition.REPRESENTATIONS:
             return None
 
-        _op = EqualityCondition._get_operator(op, negation)
+        _op = super()._get_operator(op, negation)
         if _op:
             return _op
 
@@ -265,3 +267,29 @@ class ArrayCondition(EqualityCondition):
     @classmethod
     def _nin_operator(cls, name, params):
         return ~cls._in_operator(name, params)
+
+
+class JSONKeyConditionMixin(object):
+    """The equality of a json field's key, e.g. `last_metric__loss`, as a containment.
+
+    `field @> {key: value}` is served by the field's GIN index,
+    unlike `field -> key = value` which requires an expression index per key.
+    """
+
+    @staticmethod
+    def _eq_operator(name, params):
+        field, key = name.rsplit('__', 1)
+        name = '{}__contains'.format(field)
+        return Q(**{name: {key: params}})
+
+
+class JSONComparisonCondition(JSONKeyConditionMixin, ComparisonCondition):
+    pass
+
+
+class JSONValueCondition(JSONKeyConditionMixin, ValueCondition):
+
+    @classmethod
+    def _in_operator(cls, name, params):
+        assert isinstance(params, (list, tuple))
+        return reduce(or_, [cls._eq_operator(name, param) for param in params])
@@ -1,7 +1,12 @@
+from functools import lru_cache
+
 from query.builder import QueryCondSpec
 from query.exceptions import QueryError
 from query.parser import parse_field, tokenize_query
 
+# The number of compiled query plans kept per process, for all the managers
+QUERY_PLANS_CACHE_SIZE = 1024
+
 
 class BaseQueryManager(object):
     NAME = None
@@ -49,17 +54,36 @@ class BaseQueryManager(object):
         return built_query
 
     @classmethod
-    def handle_query(cls, query_spec):
+    def compile(cls, query_spec):
+        """Returns the query's plan, a tuple of (key, proxied key, conditions specs)."""
         tokenized_query = cls.tokenize(query_spec=query_spec)
         parsed_query = cls.parse(tokenized_query=tokenized_query)
         built_query = cls.build(parsed_query=parsed_query)
-        return built_query
+        return tuple((key, cls.proxy_field(key), tuple(cond_specs))
+                     for key, cond_specs in built_query.items())
+
+    @classmethod
+    @lru_cache(maxsize=QUERY_PLANS_CACHE_SIZE)
+    def _get_cached_plan(cls, query_spec):
+        return cls.compile(query_spec=query_spec)
+
+    @classmethod
+    def get_plan(cls, query_spec):
+        """Returns the query's plan, cached by manager and query.
+
+        The plans are immutable, the invalid queries raise on every call and are not cached.
+        """
+        if not isinstance(query_spec, str):
+            return cls.compile(query_spec=query_spec)
+        return cls._get_cached_plan(query_spec)
+
+    @classmethod
+    def handle_query(cls, query_spec):
+        return {key: list(cond_specs) for key, _, cond_specs in cls.get_plan(query_spec)}
 
     @classmethod
     def apply(cls, query_spec, queryset):
-        built_query = cls.handle_query(query_spec=query_spec)
-        for key, cond_specs in built_query.items():
-            key = cls.proxy_field(key)
+        for _, key, cond_specs in cls.get_plan(query_spec=query_spec):
             for cond_spec in cond_specs:
                 queryset = cond_spec.cond.apply(
                     queryset=queryset, name=key, params=cond_spec.params)
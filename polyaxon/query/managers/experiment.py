@@ -4,8 +4,9 @@ from hestia.list_utils import to_list
 from query.builder import (
     ArrayCondition,
     CallbackCondition,
-    ComparisonCondition,
     DateTimeCondition,
+    JSONComparisonCondition,
+    JSONValueCondition,
     ValueCondition
 )
 from query.managers.base import BaseQueryManager
@@ -23,7 +24,7 @@ class ExperimentQueryManager(BaseQueryManager):
     NAME = 'experiment'
     FIELDS_PROXY = {
         'metric': 'last_metric',
-        'status': 'status__status',
+        'status': 'last_status',
         'group': 'experiment_group',
         'build': 'build_job',
         'commit': 'code_reference__commit',
@@ -82,11 +83,11 @@ class ExperimentQueryManager(BaseQueryManager):
         # Commit
         'commit': ValueCondition,
         # Declarations
-        'declarations': ValueCondition,
+        'declarations': JSONValueCondition,
         # Tags
         'tags': ArrayCondition,
         # Metrics
-        'metric': ComparisonCondition,
+        'metric': JSONComparisonCondition,
         # Independent
         'independent': CallbackCondition(_indepenent_condition),
     }
@@ -37,7 +37,7 @@ def _search_algorithm_condition(queryset, params, negation):
 class ExperimentGroupQueryManager(BaseQueryManager):
     NAME = 'experiment_group'
     FIELDS_PROXY = {
-        'status': 'status__status',
+        'status': 'last_status',
         'concurrency': 'hptuning__concurrency'
     }
     PARSERS_BY_FIELD = {
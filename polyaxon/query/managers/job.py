@@ -6,7 +6,7 @@ from query.parser import parse_datetime_operation, parse_value_operation
 class JobQueryManager(BaseQueryManager):
     NAME = 'job'
     FIELDS_PROXY = {
-        'status': 'status__status',
+        'status': 'last_status',
         'build': 'build_job',
         'commit': 'code_reference__commit',
     }
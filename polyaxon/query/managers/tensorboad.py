@@ -6,7 +6,7 @@ from query.parser import parse_datetime_operation, parse_value_operation
 class TensorboardQueryManager(BaseQueryManager):
     NAME = 'tensorboard'
     FIELDS_PROXY = {
-        'status': 'status__status',
+        'status': 'last_status',
         'group': 'experiment_group',
     }
     PARSERS_BY_FIELD = {
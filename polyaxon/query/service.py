@@ -10,7 +10,7 @@ from query.parser import parse_field
 
 
 class QueryService(Service):
-    __all__ = ('filter_queryset', 'parse_field',)
+    __all__ = ('filter_queryset', 'compile_query', 'parse_field',)
 
     MANAGER_MAPPING = {
         ExperimentQueryManager.NAME: ExperimentQueryManager,
@@ -21,10 +21,19 @@ class QueryService(Service):
     }
 
     @classmethod
-    def filter_queryset(cls, manager, query_spec, queryset):
+    def get_manager(cls, manager):
         if manager not in cls.MANAGER_MAPPING:
             raise QueryError('Manager `{}` was not configured'.format(manager))
-        return cls.MANAGER_MAPPING[manager].apply(query_spec=query_spec, queryset=queryset)
+        return cls.MANAGER_MAPPING[manager]
+
+    @classmethod
+    def filter_queryset(cls, manager, query_spec, queryset):
+        return cls.get_manager(manager).apply(query_spec=query_spec, queryset=queryset)
+
+    @classmethod
+    def compile_query(cls, manager, query_spec):
+        """Compiles and caches the query's plan, e.g. to precompile the saved searches."""
+        return cls.get_manager(manager).get_plan(query_spec=query_spec)
 
     @classmethod
     def parse_field(cls, field):
@@ -16,3 +16,4 @@ class SchedulerConfig(AppConfig):
         import signals.statuses  # noqa
         import signals.deletion  # noqa
         import signals.nodes  # noqa
+        import signals.lookups  # noqa
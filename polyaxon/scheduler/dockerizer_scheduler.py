@@ -10,7 +10,8 @@ import conf
 
 from constants.jobs import JobLifeCycle
 from db.models.build_jobs import BuildJob
-from docker_images.image_info import get_tagged_image
+from docker_images.image_info import get_image_info
+from docker_images.registry import image_exists
 from event_manager.events.build_job import BUILD_JOB_STARTED, BUILD_JOB_STARTED_TRIGGERED
 from scheduler.spawners.dockerizer_spawner import DockerizerSpawner
 from scheduler.spawners.utils import get_job_definition
@@ -20,10 +21,8 @@ _logger = logging.getLogger('polyaxon.scheduler.dockerizer')
 
 
 def check_image(build_job):
-    from docker import APIClient
-
-    docker = APIClient(version='auto')
-    return docker.images(get_tagged_image(build_job))
+    image_name, image_tag = get_image_info(build_job)
+    return image_exists(image_name=image_name, image_tag=image_tag)
 
 
 def create_build_job(user, project, config, code_reference, configmap_refs=None, secret_refs=None):
@@ -7,6 +7,7 @@ from kubernetes.client.rest import ApiException
 from django.conf import settings
 
 import conf
+import stats
 
 from constants.experiments import ExperimentLifeCycle
 from db.models.experiment_jobs import ExperimentJob
@@ -449,7 +450,8 @@ def start_experiment(experiment):
                                 use_sidecar=True,
                                 sidecar_config=config.get_requested_params(to_str=True),
                                 token_scope=token_scope)
-        response = spawner.start_experiment()
+        with stats.timer('scheduler.start_experiment'):
+            response = spawner.start_experiment()
         handle_experiment(experiment=experiment, spawner=spawner, response=response)
     except ApiException as e:
         _logger.error('Could not start the experiment, please check your polyaxon spec.',
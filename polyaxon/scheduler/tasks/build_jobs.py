@@ -192,7 +192,10 @@ def build_jobs_notify_done(build_job_id):
 
 
 @celery_app.task(name=SchedulerCeleryTasks.BUILD_JOBS_SET_DOCKERFILE, ignore_result=True)
-def build_jobs_set_dockerfile(build_job_uuid, dockerfile):
+def build_jobs_set_dockerfile(build_job_uuid,
+                              dockerfile,
+                              image_tag=None,
+                              dependencies_image_tag=None):
     build_job = get_valid_build_job(build_job_uuid=build_job_uuid)
     if not build_job:
         _logger.info('Something went wrong, '
@@ -200,7 +203,9 @@ def build_jobs_set_dockerfile(build_job_uuid, dockerfile):
         return
 
     build_job.dockerfile = dockerfile
-    build_job.save(update_fields=['dockerfile'])
+    build_job.image_tag = image_tag
+    build_job.dependencies_image_tag = dependencies_image_tag
+    build_job.save(update_fields=['dockerfile', 'image_tag', 'dependencies_image_tag'])
 
 
 @celery_app.task(name=SchedulerCeleryTasks.BUILD_JOBS_CHECK_HEARTBEAT, ignore_result=True)
@@ -113,7 +113,7 @@ def experiments_group_stop_experiments(experiment_group_id,
             experiment.set_status(status=ExperimentLifeCycle.STOPPED, message=message)
     else:
         experiments = experiment_group.all_experiments.exclude(
-            status__status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
+            last_status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
         for experiment in experiments:
             if experiment.is_running:
                 celery_app.send_task(
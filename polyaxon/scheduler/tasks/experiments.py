@@ -2,13 +2,16 @@ import logging
 
 from rest_framework.exceptions import ValidationError
 
+import auditor
 import publisher
 import stores
 
 from api.experiments.serializers import ExperimentMetricSerializer
 from constants.experiments import ExperimentLifeCycle
 from db.getters.experiments import get_valid_experiment
+from db.models.experiments import ExperimentMetric
 from db.redis.heartbeat import RedisHeartBeat
+from event_manager.events.experiment import EXPERIMENT_NEW_METRIC
 from logs_handlers import collectors
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import Intervals, SchedulerCeleryTasks
@@ -116,22 +119,46 @@ def experiments_check_heartbeat(experiment_id):
                           message='Experiment is in zombie state (no heartbeat was reported).')
 
 
+def bulk_create_metrics(experiment, metrics):
+    """Create the metrics in one statement and fold their values into `last_metric` once.
+
+    `bulk_create` does not send the `post_save` signal,
+    so we update the experiment and record the audit event here instead of per metric.
+    """
+    metrics = [ExperimentMetric(experiment=experiment, **metric) for metric in metrics]
+    if not metrics:
+        return []
+    metrics.sort(key=lambda metric: metric.created_at)
+    ExperimentMetric.objects.bulk_create(metrics)
+
+    last_metric = experiment.last_metric or {}
+    for metric in metrics:
+        last_metric.update(metric.values)
+    experiment.last_metric = last_metric
+    experiment.save(update_fields=['last_metric'])
+    auditor.record(event_type=EXPERIMENT_NEW_METRIC,
+                   instance=experiment)
+    return metrics
+
+
 @celery_app.task(name=SchedulerCeleryTasks.EXPERIMENTS_SET_METRICS, ignore_result=True)
 def experiments_set_metrics(experiment_id, data):
     experiment = get_valid_experiment(experiment_id=experiment_id)
     if not experiment:
         return
 
-    kwargs = {}
-    if isinstance(data, list):
-        kwargs['many'] = True
-    serializer = ExperimentMetricSerializer(data=data, **kwargs)
+    many = isinstance(data, list)
+    serializer = ExperimentMetricSerializer(data=data, many=many)
     try:
         serializer.is_valid(raise_exception=True)
     except ValidationError:
         _logger.error('Could not create metrics, a validation error was raised.')
+        return
 
-    serializer.save(experiment=experiment)
+    if many:
+        bulk_create_metrics(experiment=experiment, metrics=serializer.validated_data)
+    else:
+        serializer.save(experiment=experiment)
 
 
 @celery_app.task(name=SchedulerCeleryTasks.EXPERIMENTS_START, ignore_result=True)
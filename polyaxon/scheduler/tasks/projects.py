@@ -21,7 +21,7 @@ def projects_schedule_deletion(project_id):
     message = 'Project is scheduled for deletion.'
 
     groups = project.all_experiment_groups.exclude(
-        status__status__in=ExperimentGroupLifeCycle.DONE_STATUS).distinct()
+        last_status__in=ExperimentGroupLifeCycle.DONE_STATUS).distinct()
     for group in groups.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.EXPERIMENTS_GROUP_STOP_EXPERIMENTS,
@@ -34,7 +34,7 @@ def projects_schedule_deletion(project_id):
 
     experiments = project.all_experiments.exclude(
         experiment_group__isnull=True,
-        status__status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
+        last_status__in=ExperimentLifeCycle.DONE_STATUS).distinct()
     for experiment in experiments:
         if experiment.is_running:
             celery_app.send_task(
@@ -55,27 +55,27 @@ def projects_schedule_deletion(project_id):
             # Update experiment status to show that its stopped
             experiment.set_status(status=ExperimentLifeCycle.STOPPED, message=message)
 
-    jobs = project.all_jobs.exclude(status__status__in=JobLifeCycle.DONE_STATUS).distinct()
+    jobs = project.all_jobs.exclude(last_status__in=JobLifeCycle.DONE_STATUS).distinct()
     for job in jobs.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.JOBS_SCHEDULE_DELETION,
             kwargs={'job_id': job})
 
-    builds = project.all_build_jobs.exclude(status__status__in=JobLifeCycle.DONE_STATUS).distinct()
+    builds = project.all_build_jobs.exclude(last_status__in=JobLifeCycle.DONE_STATUS).distinct()
     for build in builds.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.BUILD_JOBS_SCHEDULE_DELETION,
             kwargs={'build_job_id': build})
 
     notebooks = project.all_notebook_jobs.exclude(
-        status__status__in=JobLifeCycle.DONE_STATUS).distinct()
+        last_status__in=JobLifeCycle.DONE_STATUS).distinct()
     for notebook in notebooks.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.PROJECTS_NOTEBOOK_SCHEDULE_DELETION,
             kwargs={'notebook_job_id': notebook})
 
     tensorboards = project.all_tensorboard_jobs.exclude(
-        status__status__in=JobLifeCycle.DONE_STATUS).distinct()
+        last_status__in=JobLifeCycle.DONE_STATUS).distinct()
     for tensorboard in tensorboards.values_list('id', flat=True):
         celery_app.send_task(
             SchedulerCeleryTasks.TENSORBOARDS_SCHEDULE_DELETION,
@@ -2,7 +2,7 @@ from hestia.auth import AuthenticationTypes
 from rest_framework.authentication import get_authorization_header
 from rest_framework.exceptions import AuthenticationFailed
 
-from db.models.tokens import Token
+from db.getters.tokens import get_cached_token
 from scopes.authentication.base import PolyaxonAuthentication
 
 
@@ -40,9 +40,8 @@ class TokenAuthentication(PolyaxonAuthentication):
         return self.authenticate_credentials(token)
 
     def authenticate_credentials(self, key):  # pylint:disable=arguments-differ
-        try:
-            token = Token.objects.select_related('user').get(key=key)
-        except Token.DoesNotExist:
+        token = get_cached_token(key=key)
+        if not token:
             raise AuthenticationFailed('Invalid token.')
 
         if token.is_expired:
@@ -13,10 +13,12 @@ from db.models.jobs import Job
 from db.models.notebooks import NotebookJob
 from db.models.projects import Project
 from db.models.tensorboards import TensorboardJob
+from db.redis.statuses import RedisExperimentJobStatuses
 from event_manager.events.build_job import BUILD_JOB_DELETED
 from event_manager.events.experiment import EXPERIMENT_DELETED
 from event_manager.events.experiment_group import EXPERIMENT_GROUP_DELETED
 from event_manager.events.job import JOB_DELETED
+from libs.deletion import ignore_bulk_deletion, is_bulk_deletion
 from libs.paths.projects import delete_project_repos
 from polyaxon.celery_api import celery_app
 from polyaxon.settings import SchedulerCeleryTasks
@@ -28,13 +30,14 @@ from signals.bookmarks import remove_bookmarks
 def build_job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
 
-    # Delete outputs and logs
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-        kwargs={
-            'persistence': job.persistence_logs,
-            'subpath': job.subpath,
-        })
+    # Delete outputs and logs, the bulk deletion cleans the whole subtree's stores
+    if not is_bulk_deletion():
+        celery_app.send_task(
+            SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
+            kwargs={
+                'persistence': job.persistence_logs,
+                'subpath': job.subpath,
+            })
 
     if not job.is_running:
         return
@@ -52,6 +55,7 @@ def build_job_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=BuildJob, dispatch_uid="build_job_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def build_job_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=BUILD_JOB_DELETED, instance=instance)
@@ -60,6 +64,7 @@ def build_job_post_delete(sender, **kwargs):
 
 @receiver(pre_delete, sender=ExperimentGroup, dispatch_uid="experiment_group_pre_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_group_pre_delete(sender, **kwargs):
     """Delete all group outputs."""
     instance = kwargs['instance']
@@ -84,6 +89,7 @@ def experiment_group_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=ExperimentGroup, dispatch_uid="experiment_group_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_group_post_delete(sender, **kwargs):
     """Delete all group outputs."""
     instance = kwargs['instance']
@@ -97,8 +103,8 @@ def experiment_group_post_delete(sender, **kwargs):
 def experiment_pre_delete(sender, **kwargs):
     instance = kwargs['instance']
 
-    # Delete outputs and logs
-    if instance.is_independent:
+    # Delete outputs and logs, the bulk deletion cleans the whole subtree's stores
+    if instance.is_independent and not is_bulk_deletion():
         celery_app.send_task(
             SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
             kwargs={
@@ -112,6 +118,9 @@ def experiment_pre_delete(sender, **kwargs):
                 'subpath': instance.subpath,
             })
 
+    # Delete the jobs' statuses vector
+    RedisExperimentJobStatuses.clear(instance.id)
+
     # Delete clones
     for experiment in instance.clones.filter(cloning_strategy=CloningStrategy.RESUME):
         experiment.delete()
@@ -119,6 +128,7 @@ def experiment_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=Experiment, dispatch_uid="experiment_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def experiment_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=EXPERIMENT_DELETED, instance=instance)
@@ -159,19 +169,20 @@ def stop_running_experiment(sender, **kwargs):
 def job_pre_delete(sender, **kwargs):
     job = kwargs['instance']
 
-    # Delete outputs and logs
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
-        kwargs={
-            'persistence': job.persistence_outputs,
-            'subpath': job.subpath,
-        })
-    celery_app.send_task(
-        SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
-        kwargs={
-            'persistence': job.persistence_logs,
-            'subpath': job.subpath,
-        })
+    # Delete outputs and logs, the bulk deletion cleans the whole subtree's stores
+    if not is_bulk_deletion():
+        celery_app.send_task(
+            SchedulerCeleryTasks.STORES_SCHEDULE_OUTPUTS_DELETION,
+            kwargs={
+                'persistence': job.persistence_outputs,
+                'subpath': job.subpath,
+            })
+        celery_app.send_task(
+            SchedulerCeleryTasks.STORES_SCHEDULE_LOGS_DELETION,
+            kwargs={
+                'persistence': job.persistence_logs,
+                'subpath': job.subpath,
+            })
 
     if not job.is_running:
         return
@@ -190,6 +201,7 @@ def job_pre_delete(sender, **kwargs):
 
 @receiver(post_delete, sender=Job, dispatch_uid="job_post_delete")
 @ignore_raw
+@ignore_bulk_deletion
 def job_post_delete(sender, **kwargs):
     instance = kwargs['instance']
     auditor.record(event_type=JOB_DELETED, instance=instance)
@@ -0,0 +1,48 @@
+from hestia.signal_decorators import ignore_raw
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from db.models.experiments import Experiment
+from db.models.projects import Project
+from db.models.tokens import Token
+from db.redis.lookups import RedisLookups
+
+
+@receiver(post_save, sender=Token, dispatch_uid="token_lookups_post_save")
+@receiver(post_delete, sender=Token, dispatch_uid="token_lookups_post_delete")
+@ignore_raw
+def token_invalidate_lookups(sender, **kwargs):
+    # A refresh changes the key, all the user's tokens are invalidated
+    RedisLookups.invalidate(kind=RedisLookups.TOKENS, ref=kwargs['instance'].user_id)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="user_lookups_post_save")
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="user_lookups_post_delete")
+@ignore_raw
+def user_invalidate_lookups(sender, **kwargs):
+    RedisLookups.invalidate(kind=RedisLookups.TOKENS, ref=kwargs['instance'].id)
+
+
+@receiver(post_save, sender=Project, dispatch_uid="project_lookups_post_save")
+@receiver(post_delete, sender=Project, dispatch_uid="project_lookups_post_delete")
+@ignore_raw
+def project_invalidate_lookups(sender, **kwargs):
+    # The lookups are referenced by id, a renamed project's old name is invalidated as well
+    RedisLookups.invalidate(kind=RedisLookups.PROJECTS, ref=kwargs['instance'].id)
+
+
+@receiver(post_save, sender=Experiment, dispatch_uid="experiment_lookups_post_save")
+@ignore_raw
+def experiment_save_invalidate_lookups(sender, **kwargs):
+    # Only the experiment's existence is cached, the saves of the other fields keep it
+    update_fields = kwargs['update_fields']
+    if update_fields is None or 'deleted' in update_fields:
+        RedisLookups.invalidate(kind=RedisLookups.EXPERIMENTS, ref=kwargs['instance'].id)
+
+
+@receiver(post_delete, sender=Experiment, dispatch_uid="experiment_lookups_post_delete")
+@ignore_raw
+def experiment_invalidate_lookups(sender, **kwargs):
+    RedisLookups.invalidate(kind=RedisLookups.EXPERIMENTS, ref=kwargs['instance'].id)
@@ -0,0 +1,34 @@
+from hestia.signal_decorators import ignore_raw
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+import query
+
+from constants import content_types
+from db.models.searches import Search
+from query.exceptions import QueryError
+
+QUERY_MANAGERS_BY_CONTENT_TYPE = {
+    content_types.EXPERIMENT_GROUP: 'experiment_group',
+    content_types.EXPERIMENT: 'experiment',
+    content_types.JOB: 'job',
+    content_types.BUILD_JOB: 'build',
+}
+
+
+@receiver(post_save, sender=Search, dispatch_uid="search_saved")
+@ignore_raw
+def search_saved(sender, **kwargs):
+    """Precompiles the saved search's query, the ui re-issues it on every refresh."""
+    instance = kwargs['instance']
+    manager = QUERY_MANAGERS_BY_CONTENT_TYPE.get(instance.content_type)
+    query_spec = instance.query.get('query') if isinstance(instance.query, dict) else None
+    if not manager or not query_spec:
+        return
+
+    try:
+        query.compile_query(manager=manager, query_spec=query_spec)
+    except QueryError:
+        # The invalid queries are reported when the search is applied
+        pass
@@ -18,6 +18,7 @@ from db.models.experiments import ExperimentStatus
 from db.models.jobs import JobStatus
 from db.models.notebooks import NotebookJobStatus
 from db.models.tensorboards import TensorboardJobStatus
+from db.redis.statuses import RedisExperimentJobStatuses
 from db.redis.tll import RedisTTL
 from event_manager.events.build_job import (
     BUILD_JOB_DONE,
@@ -79,9 +80,10 @@ def build_job_status_post_save(sender, **kwargs):
 
     # Update job last_status
     job.status = instance
+    job.last_status = instance.status
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
-    job.save(update_fields=['status', 'started_at', 'finished_at'])
+    job.save(update_fields=['status', 'last_status', 'started_at', 'finished_at'])
     auditor.record(event_type=BUILD_JOB_NEW_STATUS,
                    instance=job,
                    previous_status=previous_status)
@@ -136,9 +138,10 @@ def job_status_post_save(sender, **kwargs):
     previous_status = job.last_status
     # Update job last_status
     job.status = instance
+    job.last_status = instance.status
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
-    job.save(update_fields=['status'])
+    job.save(update_fields=['status', 'last_status'])
     auditor.record(event_type=JOB_NEW_STATUS,
                    instance=job,
                    previous_status=previous_status)
@@ -191,9 +194,10 @@ def notebook_job_status_post_save(sender, **kwargs):
     previous_status = job.last_status
     # Update job last_status
     job.status = instance
+    job.last_status = instance.status
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
-    job.save(update_fields=['status', 'started_at', 'finished_at'])
+    job.save(update_fields=['status', 'last_status', 'started_at', 'finished_at'])
     auditor.record(event_type=NOTEBOOK_NEW_STATUS,
                    instance=job,
                    previous_status=previous_status,
@@ -236,9 +240,10 @@ def tensorboard_job_status_post_save(sender, **kwargs):
     previous_status = job.last_status
     # Update job last_status
     job.status = instance
+    job.last_status = instance.status
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
-    job.save(update_fields=['status', 'started_at', 'finished_at'])
+    job.save(update_fields=['status', 'last_status', 'started_at', 'finished_at'])
     auditor.record(event_type=TENSORBOARD_NEW_STATUS,
                    instance=job,
                    previous_status=previous_status,
@@ -282,6 +287,7 @@ def experiment_group_status_post_save(sender, **kwargs):
 
     # update experiment last_status
     experiment_group.status = instance
+    experiment_group.last_status = instance.status
     if instance.status == ExperimentGroupLifeCycle.RUNNING:
         experiment_group.started_at = now()
 
@@ -291,7 +297,7 @@ def experiment_group_status_post_save(sender, **kwargs):
     set_finished_at(instance=experiment_group,
                     status=instance.status,
                     is_done=ExperimentGroupLifeCycle.is_done)
-    experiment_group.save(update_fields=['status', 'started_at', 'finished_at'])
+    experiment_group.save(update_fields=['status', 'last_status', 'started_at', 'finished_at'])
     auditor.record(event_type=EXPERIMENT_GROUP_NEW_STATUS,
                    instance=experiment_group,
                    previous_status=previous_status)
@@ -315,9 +321,14 @@ def experiment_job_status_post_save(sender, **kwargs):
     job = instance.job
 
     job.status = instance
+    job.last_status = instance.status
     set_job_started_at(instance=job, status=instance.status)
     set_job_finished_at(instance=job, status=instance.status)
-    job.save(update_fields=['status', 'started_at', 'finished_at'])
+    job.save(update_fields=['status', 'last_status', 'started_at', 'finished_at'])
+    RedisExperimentJobStatuses.set_job_status(experiment_id=job.experiment_id,
+                                              job_id=job.id,
+                                              role=job.role,
+                                              status=instance.status)
 
     # check if the new status is done to remove the containers from the monitors
     if job.is_done:
@@ -346,6 +357,7 @@ def experiment_status_post_save(sender, **kwargs):
 
     # update experiment last_status
     experiment.status = instance
+    experiment.last_status = instance.status
     set_started_at(instance=experiment,
                    status=instance.status,
                    starting_statuses=[ExperimentLifeCycle.STARTING, ExperimentLifeCycle.RUNNING],
@@ -353,7 +365,7 @@ def experiment_status_post_save(sender, **kwargs):
     set_finished_at(instance=experiment,
                     status=instance.status,
                     is_done=ExperimentLifeCycle.is_done)
-    experiment.save(update_fields=['status', 'started_at', 'finished_at'])
+    experiment.save(update_fields=['status', 'last_status', 'started_at', 'finished_at'])
     auditor.record(event_type=EXPERIMENT_NEW_STATUS,
                    instance=experiment,
                    previous_status=previous_status)
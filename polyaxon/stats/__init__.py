@@ -1,3 +1,5 @@
+import functools
+
 from django.conf import settings
 
 from hestia.service_interface import LazyServiceWrapper
@@ -8,6 +10,8 @@ from stats.base import BaseStatsBackend
 def get_stats_backend():
     if settings.STATS_BACKEND == settings.STATS_BACKEND_NOOP:
         return 'stats.noop.NoOpStatsBackend'
+    if settings.STATS_BACKEND == settings.STATS_BACKEND_MEMORY:
+        return 'stats.memory.MemoryStatsBackend'
     if settings.STATS_BACKEND == settings.STATS_BACKEND_DATADOG:
         return 'stats.datadog.DatadogStatsBackend'
     if settings.STATS_BACKEND == settings.STATS_BACKEND_STATSD:
@@ -21,3 +25,20 @@ backend = LazyServiceWrapper(
     options={}
 )
 backend.expose(locals())
+
+
+def timed(key, sample_rate=1, **kwargs):
+    """Decorator recording the duration of every call of the function.
+
+    The backend is resolved when the function is called, not when it is decorated.
+    """
+
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kw):
+            with backend.timer(key=key, sample_rate=sample_rate, **kwargs):
+                return f(*args, **kw)
+
+        return wrapper
+
+    return decorator
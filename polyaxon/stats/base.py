@@ -1,14 +1,52 @@
+import atexit
+import functools
+import logging
+import os
+import threading
+import time
+
+from collections import deque
+from contextlib import contextmanager
 from random import random
-from threading import local
+
+from hestia.service_interface import Service
 
 from django.conf import settings
 
+_logger = logging.getLogger('polyaxon.stats')
+
+
+class BaseStatsBackend(Service):
+    """Records the metrics without blocking the caller.
+
+    The metrics are appended to a per process buffer and emitted by a background thread
+    every `flush_interval` seconds, or as soon as `buffer_size` metrics are pending.
+    A `buffer_size` of 0 emits every metric inline.
+    """
+    __all__ = ('incr', 'timing', 'gauge', 'histogram', 'timer', 'flush')
+
+    INCR = 'incr'
+    TIMING = 'timing'
+    GAUGE = 'gauge'
+    HISTOGRAM = 'histogram'
+
+    # Max number of pending metrics, in number of buffers, the oldest are dropped past it
+    MAX_PENDING_BUFFERS = 10
 
-class BaseStatsBackend(local):
-    def __init__(self, prefix=None):  # pylint:disable=super-init-not-called
+    def __init__(self, prefix=None, buffer_size=None, flush_interval=None):
         if prefix is None:
-            prefix = settings.DEFAULT_STATS_PREFIX
+            prefix = settings.STATS_DEFAULT_PREFIX
+        if buffer_size is None:
+            buffer_size = settings.STATS_BUFFER_SIZE
+        if flush_interval is None:
+            flush_interval = settings.STATS_FLUSH_INTERVAL
         self.prefix = prefix
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer = deque(maxlen=max(buffer_size, 1) * self.MAX_PENDING_BUFFERS)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher_pid = None
 
     def _get_key(self, key):
         if self.prefix:
@@ -18,8 +56,103 @@ class BaseStatsBackend(local):
     def _should_sample(self, sample_rate):
         return sample_rate >= 1 or random() >= 1 - sample_rate
 
+    def _start_flusher(self):
+        """Starts the flusher thread of the current process, i.e. again in a forked worker."""
+        with self._lock:
+            pid = os.getpid()
+            if self._flusher_pid == pid:
+                return
+            flusher = threading.Thread(target=self._run_flusher, name='stats-flusher')
+            flusher.daemon = True
+            flusher.start()
+            if self._flusher_pid is None:
+                atexit.register(self.flush)
+            self._flusher_pid = pid
+
+    def _run_flusher(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _record(self, metric_type, key, value, sample_rate=1, **kwargs):
+        metric = (metric_type, self._get_key(key), value, sample_rate, kwargs)
+        if self.buffer_size <= 0:
+            self._emit([metric])
+            return
+
+        if self._flusher_pid != os.getpid():
+            self._start_flusher()
+        self._buffer.append(metric)
+        if len(self._buffer) >= self.buffer_size:
+            self._wakeup.set()
+
+    def _emit(self, metrics):
+        """Sends the metrics, the backends can override it to send them as one batch."""
+        for metric_type, key, value, sample_rate, kwargs in metrics:
+            getattr(self, '_{}'.format(metric_type))(key, value, sample_rate=sample_rate, **kwargs)
+
     def _incr(self, key, amount=1, sample_rate=1, **kwargs):
         raise NotImplementedError
 
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        raise NotImplementedError
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        raise NotImplementedError
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        raise NotImplementedError
+
+    def flush(self):
+        """Emits the pending metrics."""
+        metrics = []
+        while True:
+            try:
+                metrics.append(self._buffer.popleft())
+            except IndexError:
+                break
+        if not metrics:
+            return
+        try:
+            self._emit(metrics)
+        except Exception:  # pylint:disable=broad-except
+            _logger.warning('Could not emit %s metrics', len(metrics), exc_info=True)
+
     def incr(self, key, amount=1, sample_rate=1, **kwargs):
-        self._incr(key=self._get_key(key), amount=amount, sample_rate=sample_rate, **kwargs)
+        self._record(self.INCR, key=key, value=amount, sample_rate=sample_rate, **kwargs)
+
+    def timing(self, key, value, sample_rate=1, **kwargs):
+        """Records a duration in milliseconds."""
+        self._record(self.TIMING, key=key, value=value, sample_rate=sample_rate, **kwargs)
+
+    def gauge(self, key, value, sample_rate=1, **kwargs):
+        self._record(self.GAUGE, key=key, value=value, sample_rate=sample_rate, **kwargs)
+
+    def histogram(self, key, value, sample_rate=1, **kwargs):
+        self._record(self.HISTOGRAM, key=key, value=value, sample_rate=sample_rate, **kwargs)
+
+    @contextmanager
+    def timer(self, key, sample_rate=1, **kwargs):
+        """Records the duration of the block in milliseconds, even if it raises."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timing(key=key,
+                        value=(time.monotonic() - start) * 1000,
+                        sample_rate=sample_rate,
+                        **kwargs)
+
+    def timed(self, key, sample_rate=1, **kwargs):
+        """Decorator recording the duration of every call of the function."""
+
+        def decorator(f):
+            @functools.wraps(f)
+            def wrapper(*args, **kw):
+                with self.timer(key=key, sample_rate=sample_rate, **kwargs):
+                    return f(*args, **kw)
+
+            return wrapper
+
+        return decorator
@@ -9,11 +9,17 @@ from stats.base import BaseStatsBackend
 
 
 class DatadogStatsBackend(BaseStatsBackend):
-    def __init__(self, prefix=None, host=None, tags=None, **kwargs):
+    def __init__(self,
+                 prefix=None,
+                 host=None,
+                 tags=None,
+                 buffer_size=None,
+                 flush_interval=None,
+                 **kwargs):
         self.tags = tags
         self.host = host or get_hostname()
         initialize(**kwargs)
-        super().__init__(prefix=prefix)
+        super().__init__(prefix=prefix, buffer_size=buffer_size, flush_interval=flush_interval)
 
     def __del__(self):
         try:
@@ -28,8 +34,36 @@ class DatadogStatsBackend(BaseStatsBackend):
         instance.start()
         return instance
 
-    def _incr(self, key, amount=1, sample_rate=1, **kwargs):
-        tags = kwargs.get('tags', [])
+    def _get_tags(self, tags=None):
+        tags = list(tags or [])
         if self.tags:
             tags += self.tags
-        self.stats.increment(key, amount, sample_rate=sample_rate, tags=tags, host=self.host)
+        return tags
+
+    def _incr(self, key, amount=1, sample_rate=1, **kwargs):
+        self.stats.increment(key,
+                             amount,
+                             sample_rate=sample_rate,
+                             tags=self._get_tags(kwargs.get('tags')),
+                             host=self.host)
+
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        self.stats.timing(key,
+                          value,
+                          sample_rate=sample_rate,
+                          tags=self._get_tags(kwargs.get('tags')),
+                          host=self.host)
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        self.stats.gauge(key,
+                         value,
+                         sample_rate=sample_rate,
+                         tags=self._get_tags(kwargs.get('tags')),
+                         host=self.host)
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        self.stats.histogram(key,
+                             value,
+                             sample_rate=sample_rate,
+                             tags=self._get_tags(kwargs.get('tags')),
+                             host=self.host)
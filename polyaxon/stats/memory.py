@@ -0,0 +1,35 @@
+from collections import defaultdict
+
+from stats.base import BaseStatsBackend
+
+
+class MemoryStatsBackend(BaseStatsBackend):
+    """Keeps the metrics in memory, used by the tests to check the recorded metrics.
+
+    The metrics are recorded inline unless a `buffer_size` is explicitly given.
+    """
+
+    def __init__(self, prefix=None, buffer_size=0, flush_interval=None):
+        super().__init__(prefix=prefix, buffer_size=buffer_size, flush_interval=flush_interval)
+        self.counters = defaultdict(int)
+        self.timings = defaultdict(list)
+        self.gauges = {}
+        self.histograms = defaultdict(list)
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+        self.gauges.clear()
+        self.histograms.clear()
+
+    def _incr(self, key, amount=1, sample_rate=1, **kwargs):
+        self.counters[key] += amount
+
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        self.timings[key].append(value)
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        self.gauges[key] = value
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        self.histograms[key].append(value)
@@ -1,6 +1,37 @@
 from stats.base import BaseStatsBackend
 
 
-class NoOpStatasBackend(BaseStatsBackend):
-    def _incr(self, key, amount=1, sample_rate=1, **kwargs):
+class NullTimer(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+NULL_TIMER = NullTimer()
+
+
+class NoOpStatsBackend(BaseStatsBackend):
+    """Drops the metrics without buffering nor measuring them."""
+
+    def incr(self, key, amount=1, sample_rate=1, **kwargs):
+        pass
+
+    def timing(self, key, value, sample_rate=1, **kwargs):
+        pass
+
+    def gauge(self, key, value, sample_rate=1, **kwargs):
+        pass
+
+    def histogram(self, key, value, sample_rate=1, **kwargs):
+        pass
+
+    def timer(self, key, sample_rate=1, **kwargs):
+        return NULL_TIMER
+
+    def timed(self, key, sample_rate=1, **kwargs):
+        return lambda f: f
+
+    def flush(self):
         pass
@@ -5,9 +5,30 @@ from stats.base import BaseStatsBackend
 
 
 class StatsdStatsBackend(BaseStatsBackend):
-    def __init__(self, prefix=None, host='localhost', port=8125):
+    def __init__(self, prefix=None, host='localhost', port=8125, **kwargs):
         self.client = statsd.StatsClient(host=host, port=port)
-        super().__init__(prefix=prefix)
+        super().__init__(prefix=prefix, **kwargs)
+
+    def _emit(self, metrics):
+        # The pipeline packs the metrics in as few packets as possible
+        with self.client.pipeline() as pipe:
+            for metric_type, key, value, sample_rate, _ in metrics:
+                if metric_type == self.INCR:
+                    pipe.incr(key, value, sample_rate)
+                elif metric_type == self.GAUGE:
+                    pipe.gauge(key, value, sample_rate)
+                else:
+                    # Statsd has no histograms, its timers are aggregated the same way
+                    pipe.timing(key, value, sample_rate)
 
     def _incr(self, key, amount=1, sample_rate=1, **kwargs):
         self.client.incr(key, amount, sample_rate)
+
+    def _timing(self, key, value, sample_rate=1, **kwargs):
+        self.client.timing(key, value, sample_rate)
+
+    def _gauge(self, key, value, sample_rate=1, **kwargs):
+        self.client.gauge(key, value, sample_rate)
+
+    def _histogram(self, key, value, sample_rate=1, **kwargs):
+        self.client.timing(key, value, sample_rate)
@@ -1,5 +1,6 @@
 from sanic import Sanic
 
+from streams.log_streams import PodLogStreams
 from streams.resources.builds import build_logs_v2
 from streams.resources.experiment_jobs import experiment_job_logs_v2, experiment_job_resources
 from streams.resources.experiments import experiment_logs_v2, experiment_resources
@@ -47,12 +48,14 @@ async def notify_server_started(app, loop):  # pylint:disable=redefined-outer-na
     app.job_logs_ws_managers = {}
     app.job_logs_consumers = {}
     app.experiment_logs_consumers = {}
+    app.pod_log_streams = PodLogStreams()
 
 
 @app.listener('after_server_stop')
 async def notify_server_stopped(app, loop):  # pylint:disable=redefined-outer-name
     app.job_resources_ws_managers = {}
     app.experiment_resources_ws_manager = {}
+    app.pod_log_streams.stop()
 
     consumer_keys = list(app.job_logs_consumers.keys())
     for consumer_key in consumer_keys:
@@ -2,3 +2,12 @@ SOCKET_SLEEP = 2
 MAX_RETRIES = 7
 RESOURCES_CHECK = 7
 CHECK_DELAY = 5
+# Logs are sent in frames of at most LOGS_FRAME_MAX_SIZE bytes every LOGS_FRAME_MAX_DELAY seconds
+LOGS_FRAME_MAX_DELAY = 0.05
+LOGS_FRAME_MAX_SIZE = 64 * 1024
+# Max number of pending frames per socket before applying the slow consumer policy
+SOCKET_QUEUE_SIZE = 128
+# Number of recent log lines replayed to the late subscribers of a pod's logs stream
+LOGS_BUFFER_SIZE = 1000
+# Max number of threads running the blocking db and redis calls of the sockets
+EXECUTOR_MAX_WORKERS = 16
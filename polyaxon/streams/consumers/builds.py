@@ -81,6 +81,7 @@ async def build_logs(request,  # pylint:disable=too-many-branches
     if JobLifeCycle.is_done(status):
         await notify(ws_manager=consumer, message=get_status_message(status))
         RedisToStream.remove_job_logs(job_uuid=job_uuid)
+        consumer.remove_sockets(set(consumer.ws))
         return
 
     while True:
@@ -94,7 +95,7 @@ async def build_logs(request,  # pylint:disable=too-many-branches
             job.refresh_from_db()
             if job.is_done:
                 logger.info('removing all socket because the job `%s` is done', job_uuid)
-                consumer.ws = set([])
+                consumer.remove_sockets(set(consumer.ws))
             else:
                 num_message_retries -= CHECK_DELAY
 
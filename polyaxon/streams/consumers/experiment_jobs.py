@@ -62,7 +62,7 @@ async def experiment_job_logs(request, ws, username, project_name, experiment_id
             job.refresh_from_db()
             if job.is_done:
                 logger.info('removing all socket because the job `%s` is done', job_uuid)
-                consumer.ws = set([])
+                consumer.remove_sockets(set(consumer.ws))
             else:
                 num_message_retries -= CHECK_DELAY
 
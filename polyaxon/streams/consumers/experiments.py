@@ -82,6 +82,7 @@ async def experiment_logs(request,  # pylint:disable=too-many-branches
     if ExperimentLifeCycle.is_done(status):
         await notify(ws_manager=consumer, message=get_status_message(status))
         RedisToStream.remove_experiment_logs(experiment_uuid=experiment_uuid)
+        consumer.remove_sockets(set(consumer.ws))
         return
 
     while True:
@@ -96,7 +97,7 @@ async def experiment_logs(request,  # pylint:disable=too-many-branches
             if experiment.is_done:
                 logger.info(
                     'removing all socket because the experiment `%s` is done', experiment_uuid)
-                consumer.ws = set([])
+                consumer.remove_sockets(set(consumer.ws))
             else:
                 num_message_retries -= CHECK_DELAY
 
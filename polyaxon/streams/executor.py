@@ -0,0 +1,36 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from django.db import close_old_connections
+
+from streams.constants import EXECUTOR_MAX_WORKERS
+
+_executor = ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS)
+
+
+def _call(func, *args, **kwargs):
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_sync(func, *args, **kwargs):
+    """Run a blocking call, e.g. a db or a redis query, in a thread to not block the event loop."""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(_executor, partial(_call, func, *args, **kwargs))
+
+
+async def refresh_status(instance):
+    """Refresh the instance with its last status in a thread,
+    `last_status` and `is_done` can then be read without querying the db.
+    """
+
+    def refresh():
+        instance.refresh_from_db()
+        return instance.last_status
+
+    return await run_sync(refresh)
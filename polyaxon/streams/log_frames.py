@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+from streams.constants import LOGS_FRAME_MAX_DELAY, LOGS_FRAME_MAX_SIZE
+
+
+class LogFrames(object):
+    """Batches log lines into frames published to a socket manager, or only to one of its sockets.
+
+    A frame is published when it reaches `max_size` bytes or every `max_delay` seconds,
+    the lines of all the readers sharing the same instance are merged in the same frames.
+    """
+
+    def __init__(self,
+                 ws_manager,
+                 ws=None,
+                 max_delay=LOGS_FRAME_MAX_DELAY,
+                 max_size=LOGS_FRAME_MAX_SIZE):
+        self.ws_manager = ws_manager
+        self.ws = ws
+        self.max_delay = max_delay
+        self.max_size = max_size
+        self._lines = []
+        self._size = 0
+        self._flusher = None
+
+    def add(self, log_line):
+        self._lines.append(log_line)
+        self._size += len(log_line)
+        if self._size >= self.max_size:
+            self.flush()
+
+    def flush(self):
+        if not self._lines:
+            return
+        lines, self._lines, self._size = self._lines, [], 0
+        self.ws_manager.publish(json.dumps({'log_lines': '\n'.join(lines)}), ws=self.ws)
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.max_delay)
+            self.flush()
+
+    def start(self):
+        if self._flusher is None:
+            self._flusher = asyncio.ensure_future(self._flush_periodically())
+
+    def stop(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        self.flush()
+
+
+class LogLinesReader(object):
+    """Reads the lines of a stream, draining all the available content on every read."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._remainder = b''
+
+    async def read(self):
+        """Return the complete lines available, or None when the stream is closed."""
+        try:
+            chunk = await self.stream.readany()
+        except asyncio.TimeoutError:
+            chunk = None
+        if not chunk:
+            lines = [self._remainder] if self._remainder else None
+            self._remainder = b''
+            return lines
+        lines = (self._remainder + chunk).split(b'\n')
+        self._remainder = lines.pop()
+        return lines
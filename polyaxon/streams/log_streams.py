@@ -0,0 +1,144 @@
+import asyncio
+
+from collections import deque
+
+from logs_handlers.log_queries.base import process_log_line
+from streams.constants import LOGS_BUFFER_SIZE
+from streams.log_frames import LogLinesReader
+from streams.logger import logger
+
+
+class PodLogStream(object):
+    """A single upstream follow of a pod container's logs shared by many subscribers.
+
+    The lines are fanned out to the subscribers' log frames, formatted with each subscriber's
+    task type and index, the last `buffer_size` lines are replayed to the late subscribers.
+    """
+
+    def __init__(self,
+                 k8s_api,
+                 pod_id,
+                 container,
+                 namespace,
+                 buffer_size=LOGS_BUFFER_SIZE,
+                 on_close=None):
+        self.k8s_api = k8s_api
+        self.pod_id = pod_id
+        self.container = container
+        self.namespace = namespace
+        self.buffer = deque(maxlen=buffer_size)
+        # The subscribers' log frames by the (task_type, task_idx) of their lines
+        self.subscribers = {}
+        self.on_close = on_close
+        self._task = None
+
+    @property
+    def key(self):
+        return self.pod_id, self.container
+
+    @property
+    def is_done(self):
+        return self._task is not None and self._task.done()
+
+    async def _follow(self):
+        resp = await self.k8s_api.read_namespaced_pod_log(self.pod_id,
+                                                          self.namespace,
+                                                          container=self.container,
+                                                          follow=True,
+                                                          _preload_content=False,
+                                                          timestamps=True)
+        try:
+            reader = LogLinesReader(resp.content)
+            while True:
+                log_lines = await reader.read()
+                if log_lines is None:
+                    break
+                for log_line in log_lines:
+                    log_line = log_line.decode('utf-8')
+                    self.buffer.append(log_line)
+                    # A line is processed once per task format of the subscribers
+                    processed_lines = {}
+                    for log_frames, (task_type, task_idx) in self.subscribers.items():
+                        if (task_type, task_idx) not in processed_lines:
+                            processed_lines[task_type, task_idx] = process_log_line(
+                                log_line=log_line, task_type=task_type, task_idx=task_idx)
+                        log_frames.add(processed_lines[task_type, task_idx])
+        finally:
+            resp.close()
+
+    def _on_done(self, task):
+        if not task.cancelled() and task.exception():
+            logger.warning('Logs stream of pod `%s` failed: %s', self.pod_id, task.exception())
+        if self.on_close:
+            self.on_close(self)
+
+    def start(self):
+        if self._task is None:
+            logger.info('Following the logs of pod `%s`', self.pod_id)
+            self._task = asyncio.ensure_future(self._follow())
+            self._task.add_done_callback(self._on_done)
+
+    def stop(self):
+        if self._task is not None and not self._task.done():
+            logger.info('Stopping the logs of pod `%s`', self.pod_id)
+            self._task.cancel()
+
+    def subscribe(self, log_frames, task_type=None, task_idx=None):
+        for log_line in self.buffer:
+            log_frames.add(process_log_line(log_line=log_line,
+                                            task_type=task_type,
+                                            task_idx=task_idx))
+        self.subscribers[log_frames] = (task_type, task_idx)
+        self.start()
+
+    def unsubscribe(self, log_frames):
+        self.subscribers.pop(log_frames, None)
+        if not self.subscribers:
+            self.stop()
+
+    async def wait(self, timeout=None):
+        """Wait for the upstream to finish, at most `timeout` seconds."""
+        if self._task is not None:
+            await asyncio.wait([self._task], timeout=timeout)
+
+
+class PodLogStreams(object):
+    """Per process registry of the pods' logs streams keyed by (pod_id, container)."""
+
+    def __init__(self):
+        self.streams = {}
+
+    def _remove(self, stream):
+        if self.streams.get(stream.key) is stream:
+            self.streams.pop(stream.key)
+
+    def subscribe(self,
+                  k8s_api,
+                  log_frames,
+                  pod_id,
+                  container,
+                  namespace,
+                  task_type=None,
+                  task_idx=None):
+        stream = self.streams.get((pod_id, container))
+        if stream is None or stream.is_done:
+            stream = PodLogStream(k8s_api=k8s_api,
+                                  pod_id=pod_id,
+                                  container=container,
+                                  namespace=namespace,
+                                  on_close=self._remove)
+            self.streams[stream.key] = stream
+        stream.subscribe(log_frames, task_type=task_type, task_idx=task_idx)
+        return stream
+
+    def unsubscribe(self, stream, log_frames):
+        stream.unsubscribe(log_frames)
+        if not stream.subscribers:
+            # The stream is cancelled, a new subscriber must not attach to it
+            # before its task is done
+            self._remove(stream)
+
+    def stop(self):
+        for stream in list(self.streams.values()):
+            stream.stop()
+        self.streams = {}
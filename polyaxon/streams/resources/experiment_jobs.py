@@ -12,6 +12,7 @@ from event_manager.events.experiment_job import (
 )
 from streams.authentication import authorized
 from streams.constants import CHECK_DELAY, RESOURCES_CHECK, SOCKET_SLEEP
+from streams.executor import refresh_status, run_sync
 from streams.logger import logger
 from streams.resources.logs import log_job
 from streams.resources.utils import get_error_message
@@ -21,24 +22,26 @@ from streams.validation.experiment_job import validate_experiment_job
 
 @authorized()
 async def experiment_job_resources(request, ws, username, project_name, experiment_id, job_id):
-    job, _, message = validate_experiment_job(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id,
-                                              job_id=job_id)
+    job, _, message = await run_sync(validate_experiment_job,
+                                     request=request,
+                                     username=username,
+                                     project_name=project_name,
+                                     experiment_id=experiment_id,
+                                     job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
     job_uuid = job.uuid.hex
     job_name = '{}.{}'.format(job.role, job.id)
-    auditor.record(event_type=EXPERIMENT_JOB_RESOURCES_VIEWED,
+    await run_sync(auditor.record,
+                   event_type=EXPERIMENT_JOB_RESOURCES_VIEWED,
                    instance=job,
                    actor_id=request.app.user.id,
                    actor_name=request.app.user.username)
 
-    if not RedisToStream.is_monitored_job_resources(job_uuid=job_uuid):
+    if not await run_sync(RedisToStream.is_monitored_job_resources, job_uuid=job_uuid):
         logger.info('Job resources with uuid `%s` is now being monitored', job_name)
-        RedisToStream.monitor_job_resources(job_uuid=job_uuid)
+        await run_sync(RedisToStream.monitor_job_resources, job_uuid=job_uuid)
 
     if job_uuid in request.app.job_resources_ws_managers:
         ws_manager = request.app.job_resources_ws_managers[job_uuid]
@@ -46,11 +49,11 @@ async def experiment_job_resources(request, ws, username, project_name, experime
         ws_manager = SocketManager()
         request.app.job_resources_ws_managers[job_uuid] = ws_manager
 
-    def handle_job_disconnected_ws(ws):
+    async def handle_job_disconnected_ws(ws):
         ws_manager.remove_sockets(ws)
         if not ws_manager.ws:
             logger.info('Stopping resources monitor for job %s', job_name)
-            RedisToStream.remove_job_resources(job_uuid=job_uuid)
+            await run_sync(RedisToStream.remove_job_resources, job_uuid=job_uuid)
             request.app.job_resources_ws_managers.pop(job_uuid, None)
 
         logger.info('Quitting resources socket for job %s', job_name)
@@ -58,16 +61,18 @@ async def experiment_job_resources(request, ws, username, project_name, experime
     ws_manager.add_socket(ws)
     should_check = 0
     while True:
-        resources = RedisToStream.get_latest_job_resources(job=job_uuid, job_name=job_name)
+        resources = await run_sync(RedisToStream.get_latest_job_resources,
+                                   job=job_uuid,
+                                   job_name=job_name)
         should_check += 1
 
         # After trying a couple of time, we must check the status of the job
         if should_check > RESOURCES_CHECK:
-            job.refresh_from_db()
+            await refresh_status(job)
             if job.is_done:
                 logger.info('removing all socket because the job `%s` is done', job_name)
-                ws_manager.ws = set([])
-                handle_job_disconnected_ws(ws)
+                ws_manager.remove_sockets(set(ws_manager.ws))
+                await handle_job_disconnected_ws(ws)
                 return
             else:
                 should_check -= CHECK_DELAY
@@ -76,30 +81,32 @@ async def experiment_job_resources(request, ws, username, project_name, experime
             try:
                 await ws.send(resources)
             except ConnectionClosed:
-                handle_job_disconnected_ws(ws)
+                await handle_job_disconnected_ws(ws)
                 return
 
         # Just to check if connection closed
         if ws._connection_lost:  # pylint:disable=protected-access
-            handle_job_disconnected_ws(ws)
+            await handle_job_disconnected_ws(ws)
             return
         await asyncio.sleep(SOCKET_SLEEP)
 
 
 @authorized()
 async def experiment_job_logs_v2(request, ws, username, project_name, experiment_id, job_id):
-    job, _, message = validate_experiment_job(request=request,
-                                              username=username,
-                                              project_name=project_name,
-                                              experiment_id=experiment_id,
-                                              job_id=job_id)
+    job, _, message = await run_sync(validate_experiment_job,
+                                     request=request,
+                                     username=username,
+                                     project_name=project_name,
+                                     experiment_id=experiment_id,
+                                     job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
 
     pod_id = job.pod_id
 
-    auditor.record(event_type=EXPERIMENT_JOB_LOGS_VIEWED,
+    await run_sync(auditor.record,
+                   event_type=EXPERIMENT_JOB_LOGS_VIEWED,
                    instance=job,
                    actor_id=request.app.user.id,
                    actor_name=request.app.user.username)
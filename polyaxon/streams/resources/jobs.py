@@ -3,6 +3,7 @@ import conf
 
 from event_manager.events.job import JOB_LOGS_VIEWED
 from streams.authentication import authorized
+from streams.executor import run_sync
 from streams.resources.logs import log_job
 from streams.resources.utils import get_error_message
 from streams.validation.job import validate_job
@@ -10,17 +11,19 @@ from streams.validation.job import validate_job
 
 @authorized()
 async def job_logs_v2(request, ws, username, project_name, job_id):
-    job, message = validate_job(request=request,
-                                username=username,
-                                project_name=project_name,
-                                job_id=job_id)
+    job, message = await run_sync(validate_job,
+                                  request=request,
+                                  username=username,
+                                  project_name=project_name,
+                                  job_id=job_id)
     if job is None:
         await ws.send(get_error_message(message))
         return
 
     pod_id = job.pod_id
 
-    auditor.record(event_type=JOB_LOGS_VIEWED,
+    await run_sync(auditor.record,
+                   event_type=JOB_LOGS_VIEWED,
                    instance=job,
                    actor_id=request.app.user.id,
                    actor_name=request.app.user.username)
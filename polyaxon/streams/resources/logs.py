@@ -1,13 +1,13 @@
 import asyncio
-import json
 
 from kubernetes_asyncio import client, config
 
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
-from logs_handlers.log_queries.base import process_log_line
 from streams.constants import SOCKET_SLEEP
-from streams.resources.utils import get_status_message, notify, notify_ws, should_disconnect
+from streams.executor import refresh_status, run_sync
+from streams.log_frames import LogFrames
+from streams.resources.utils import get_status_message, notify_ws, should_disconnect
 from streams.socket_manager import SocketManager
 
 
@@ -24,7 +24,7 @@ async def log_job(request, ws, job, pod_id, namespace, container):
     # Stream phase changes
     status = None
     while status != JobLifeCycle.RUNNING and not JobLifeCycle.is_done(status):
-        job.refresh_from_db()
+        await refresh_status(job)
         if status != job.last_status:
             status = job.last_status
             await notify_ws(ws=ws, message=get_status_message(status))
@@ -34,16 +34,25 @@ async def log_job(request, ws, job, pod_id, namespace, container):
 
     if JobLifeCycle.is_done(status):
         await notify_ws(ws=ws, message=get_status_message(status))
+        ws_manager.remove_sockets(ws)
         return
 
     config.load_incluster_config()
     k8s_api = client.CoreV1Api()
-    await log_job_pod(k8s_api=k8s_api,
-                      ws=ws,
-                      ws_manager=ws_manager,
-                      pod_id=pod_id,
-                      container=container,
-                      namespace=namespace)
+    log_frames = LogFrames(ws_manager=ws_manager, ws=ws)
+    log_frames.start()
+    try:
+        await log_job_pod(request=request,
+                          k8s_api=k8s_api,
+                          ws=ws,
+                          ws_manager=ws_manager,
+                          log_frames=log_frames,
+                          pod_id=pod_id,
+                          container=container,
+                          namespace=namespace)
+    finally:
+        log_frames.stop()
+        ws_manager.remove_sockets(ws)
 
 
 async def log_experiment(request, ws, experiment, namespace, container):
@@ -59,7 +68,7 @@ async def log_experiment(request, ws, experiment, namespace, container):
     # Stream phase changes
     status = None
     while status != ExperimentLifeCycle.RUNNING and not ExperimentLifeCycle.is_done(status):
-        experiment.refresh_from_db()
+        await refresh_status(experiment)
         if status != experiment.last_status:
             status = experiment.last_status
             await notify_ws(ws=ws, message=get_status_message(status))
@@ -69,56 +78,55 @@ async def log_experiment(request, ws, experiment, namespace, container):
 
     if ExperimentLifeCycle.is_done(status):
         await notify_ws(ws=ws, message=get_status_message(status))
+        ws_manager.remove_sockets(ws)
         return
 
     config.load_incluster_config()
     k8s_api = client.CoreV1Api()
+    # The output of all the tasks is merged in the same frames
+    log_frames = LogFrames(ws_manager=ws_manager, ws=ws)
     log_requests = []
-    for job in experiment.jobs.all():
+    for job in await run_sync(list, experiment.jobs.all()):
         pod_id = job.pod_id
         log_requests.append(
-            log_job_pod(k8s_api=k8s_api,
+            log_job_pod(request=request,
+                        k8s_api=k8s_api,
                         ws=ws,
                         ws_manager=ws_manager,
+                        log_frames=log_frames,
                         pod_id=pod_id,
                         container=container,
                         namespace=namespace,
                         task_type=job.role,
                         task_idx=job.sequence))
-    await asyncio.wait(log_requests)
+    log_frames.start()
+    try:
+        await asyncio.wait(log_requests)
+    finally:
+        log_frames.stop()
+        ws_manager.remove_sockets(ws)
 
 
-async def log_job_pod(k8s_api,
+async def log_job_pod(request,
+                      k8s_api,
                       ws,
                       ws_manager,
+                      log_frames,
                       pod_id,
                       container,
                       namespace,
                       task_type=None,
                       task_idx=None):
-    resp = await k8s_api.read_namespaced_pod_log(pod_id,
-                                                 namespace,
-                                                 container=container,
-                                                 follow=True,
-                                                 _preload_content=False,
-                                                 timestamps=True)
-    should_quite = False
-    while True:
-        try:
-            log_line = await resp.content.readline()
-        except asyncio.TimeoutError:
-            log_line = None
-        if not log_line:
-            break
-        log_line = process_log_line(log_line=log_line.decode('utf-8'),
-                                    task_type=task_type,
-                                    task_idx=task_idx)
-        await notify(ws_manager, json.dumps({'log_lines': log_line}))
-
-        if should_disconnect(ws=ws, ws_manager=ws_manager):
-            should_quite = True
-
-        if should_quite:
-            return
-
-        await asyncio.sleep(0.1)
+    # All the sockets following this pod's container share the same upstream logs stream
+    stream = request.app.pod_log_streams.subscribe(k8s_api=k8s_api,
+                                                   log_frames=log_frames,
+                                                   pod_id=pod_id,
+                                                   container=container,
+                                                   namespace=namespace,
+                                                   task_type=task_type,
+                                                   task_idx=task_idx)
+    try:
+        while not stream.is_done and not should_disconnect(ws=ws, ws_manager=ws_manager):
+            await stream.wait(timeout=SOCKET_SLEEP)
+    finally:
+        request.app.pod_log_streams.unsubscribe(stream=stream, log_frames=log_frames)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from websockets import ConnectionClosed
@@ -19,12 +20,16 @@ def should_disconnect(ws, ws_manager):
 
 
 async def notify(ws_manager, message):
+    sockets = list(ws_manager.ws)
+    # Send to all sockets concurrently
+    results = await asyncio.gather(*[_ws.send(message) for _ws in sockets],
+                                   return_exceptions=True)
     disconnected_ws = set()
-    for _ws in ws_manager.ws:
-        try:
-            await _ws.send(message)
-        except ConnectionClosed:
+    for _ws, result in zip(sockets, results):
+        if isinstance(result, ConnectionClosed):
             disconnected_ws.add(_ws)
+        elif isinstance(result, Exception):
+            raise result
     ws_manager.remove_sockets(disconnected_ws)
 
 
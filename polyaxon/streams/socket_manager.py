@@ -1,11 +1,88 @@
+import asyncio
+
+from websockets import ConnectionClosed
+
+import stats
+
+from streams.constants import SOCKET_QUEUE_SIZE
+from streams.logger import logger
+
+
+class SlowConsumerPolicies(object):
+    DROP = 'drop'  # Drop the oldest pending frames of the socket
+    CLOSE = 'close'  # Close the socket
+
+    VALUES = {DROP, CLOSE}
+
+
 class SocketManager(object):
-    def __init__(self):
+    # Number of sockets served by all the managers of the process
+    sockets_count = 0
+
+    def __init__(self, queue_size=SOCKET_QUEUE_SIZE, policy=SlowConsumerPolicies.DROP):
         self.ws = set()
+        self.queue_size = queue_size
+        self.policy = policy
+        self._queues = {}
+        self._senders = {}
+
+    @staticmethod
+    def _count_sockets(delta):
+        if delta:
+            SocketManager.sockets_count += delta
+            stats.gauge('streams.sockets', SocketManager.sockets_count)
 
     def add_socket(self, ws):
-        self.ws.add(ws)
+        if ws not in self.ws:
+            self.ws.add(ws)
+            self._count_sockets(1)
 
     def remove_sockets(self, disconnected_ws):
         if not isinstance(disconnected_ws, set):
             disconnected_ws = {disconnected_ws, }
+        self._count_sockets(-len(self.ws & disconnected_ws))
         self.ws -= disconnected_ws
+        for _ws in disconnected_ws:
+            self._queues.pop(_ws, None)
+            sender = self._senders.pop(_ws, None)
+            if sender:
+                sender.cancel()
+
+    async def _send(self, ws, queue):
+        while ws in self.ws:
+            message = await queue.get()
+            try:
+                with stats.timer('streams.send'):
+                    await ws.send(message)
+            except ConnectionClosed:
+                self.remove_sockets(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint:disable=broad-except
+                # Nothing would drain the socket's queue anymore
+                logger.warning('Removing socket, could not send a frame: %s', e)
+                self.remove_sockets(ws)
+
+    def _get_queue(self, ws):
+        if ws not in self._queues:
+            self._queues[ws] = asyncio.Queue(maxsize=self.queue_size)
+            self._senders[ws] = asyncio.ensure_future(self._send(ws, self._queues[ws]))
+        return self._queues[ws]
+
+    def publish(self, message, ws=None):
+        """Queue the message to all sockets, or only to `ws`, without waiting for the sends.
+
+        Every socket is served by its own sender, a slow socket does not delay the others,
+        when its queue is full the `policy` drops its oldest frames or closes it.
+        """
+        sockets = self.ws if ws is None else self.ws & {ws, }
+        for _ws in list(sockets):
+            queue = self._get_queue(_ws)
+            if queue.full():
+                if self.policy == SlowConsumerPolicies.CLOSE:
+                    logger.info('Closing slow socket, %s frames pending', queue.qsize())
+                    self.remove_sockets(_ws)
+                    asyncio.ensure_future(_ws.close())
+                    continue
+                queue.get_nowait()
+            queue.put_nowait(message)
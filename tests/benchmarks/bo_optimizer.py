@@ -0,0 +1,96 @@
+"""Duration of the bayesian optimization suggestions across the number of observations.
+
+Compares a cold start with a start from the previous iteration's kernel params
+and encoded observations. It only prints the durations, run it from the repo root with:
+
+    PYTHONPATH=polyaxon python -m tests.benchmarks.bo_optimizer
+"""
+import numpy as np
+import time
+
+from hpsearch.search_managers.bayesian_optimization.optimizer import BOOptimizer
+from schemas.hptuning import HPTuningConfig
+
+N_OBSERVATIONS = [10, 100, 300]
+
+
+def get_hptuning_config():
+    return HPTuningConfig.from_dict({
+        'concurrency': 2,
+        'seed': 1,
+        'bo': {
+            'n_iterations': 5,
+            'n_initial_trials': 5,
+            'metric': {
+                'name': 'loss',
+                'optimization': 'minimize'
+            },
+            'utility_function': {
+                'acquisition_function': 'ucb',
+                'kappa': 1.2,
+                'n_warmup': 1000,
+                'n_iter': 10,
+                'gaussian_process': {
+                    'kernel': 'matern',
+                    'length_scale': 1.0,
+                    'nu': 1.9,
+                    'n_restarts_optimizer': 5
+                }
+            }
+        },
+        'matrix': {
+            'feature1': {'values': [1, 2, 3]},
+            'feature2': {'linspace': [1, 2, 5]},
+            'feature3': {'range': [1, 5, 1]}
+        }
+    })
+
+
+def get_observations(random_generator, n_observations):
+    configs = [{'feature1': int(random_generator.randint(1, 4)),
+                'feature2': float(random_generator.uniform(1, 2)),
+                'feature3': int(random_generator.randint(1, 5))}
+               for _ in range(n_observations)]
+    metrics = [c['feature1'] + c['feature2'] - c['feature3'] for c in configs]
+    return configs, metrics
+
+
+def run(hptuning_config, configs, metrics, kernel_params=None, encoded_observations=None):
+    """Return the encoding and the suggestion durations, and the optimizer's state."""
+    optimizer = BOOptimizer(hptuning_config=hptuning_config, kernel_params=kernel_params)
+    start = time.time()
+    optimizer.add_observations(configs=configs,
+                               metrics=metrics,
+                               experiment_ids=list(range(len(configs))),
+                               encoded_observations=encoded_observations)
+    encoding_duration = time.time() - start
+    start = time.time()
+    optimizer.get_suggestion()
+    suggestion_duration = time.time() - start
+    return (encoding_duration,
+            suggestion_duration,
+            optimizer.kernel_params,
+            optimizer.encoded_observations)
+
+
+def main():
+    hptuning_config = get_hptuning_config()
+    random_generator = np.random.RandomState(1)
+    for n_observations in N_OBSERVATIONS:
+        configs, metrics = get_observations(random_generator, n_observations)
+        # The previous iteration observed all the experiments but the last one
+        encoding, suggestion, kernel_params, encoded_observations = run(
+            hptuning_config=hptuning_config, configs=configs[:-1], metrics=metrics[:-1])
+        print('{} observations, cold start: encoding {:.4f}s, suggestion {:.3f}s'.format(
+            n_observations, encoding, suggestion))
+        encoding, suggestion, _, _ = run(hptuning_config=hptuning_config,
+                                         configs=configs,
+                                         metrics=metrics,
+                                         kernel_params=kernel_params,
+                                         encoded_observations=encoded_observations)
+        print('{} observations, warm start: encoding {:.4f}s, suggestion {:.3f}s'.format(
+            n_observations, encoding, suggestion))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""Duration of the query tokenizing, compiling and the cached plans.
+
+It only prints the durations, run it from the repo root with:
+
+    PYTHONPATH=polyaxon python -m tests.benchmarks.query_parser
+"""
+import time
+
+from query.managers.experiment import ExperimentQueryManager
+from query.parser import tokenize_query
+
+QUERY = ('metric.loss:<=0.8, metric.accuracy:>0.9, status:starting|running, '
+         'tags:~tag1|tag2, declarations.lr:0.1, started_at:2012-12-12..2042-12-12')
+NUM_RUNS = 1000
+
+
+def get_duration(func, num_runs=NUM_RUNS):
+    start = time.perf_counter()
+    for _ in range(num_runs):
+        func()
+    return time.perf_counter() - start
+
+
+def main():
+    tokenize_duration = get_duration(lambda: tokenize_query(QUERY))
+    compile_duration = get_duration(lambda: ExperimentQueryManager.compile(QUERY))
+    ExperimentQueryManager.get_plan(QUERY)
+    cached_duration = get_duration(lambda: ExperimentQueryManager.get_plan(QUERY))
+    for name, duration in [('tokenize_query', tokenize_duration),
+                           ('compile', compile_duration),
+                           ('cached get_plan', cached_duration)]:
+        print('{}: {:.2f}us per query'.format(name, duration / NUM_RUNS * 1e6))
+
+
+if __name__ == '__main__':
+    main()
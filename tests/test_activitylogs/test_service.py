@@ -6,8 +6,11 @@ import pytest
 import activitylogs
 
 from db.models.activitylogs import ActivityLog
-from event_manager.events.experiment import EXPERIMENT_DELETED_TRIGGERED
-from event_manager.events.user import USER_ACTIVATED
+from event_manager.events.experiment import (
+    EXPERIMENT_DELETED_TRIGGERED,
+    ExperimentDeletedTriggeredEvent
+)
+from event_manager.events.user import USER_ACTIVATED, UserActivatedEvent
 from factories.factory_experiments import ExperimentFactory
 from factories.factory_users import UserFactory
 from tests.utils import BaseTest
@@ -50,3 +53,28 @@ class ActivityLogsTest(BaseTest):
         assert activity.event_type == EXPERIMENT_DELETED_TRIGGERED
         assert activity.content_object == self.experiment
         assert activity.actor == self.admin
+
+    def test_record_batch_creates_activities(self):
+        assert ActivityLog.objects.count() == 0
+        events = [
+            UserActivatedEvent.from_instance(self.user,
+                                             ref_id=uuid.uuid4(),
+                                             actor_id=self.admin.id,
+                                             actor_name=self.admin.username),
+            ExperimentDeletedTriggeredEvent.from_instance(self.experiment,
+                                                          ref_id=uuid.uuid4(),
+                                                          actor_id=self.admin.id,
+                                                          actor_name=self.admin.username),
+        ]
+        activitylogs.record_batch([event.serialize(include_instance_info=True)
+                                   for event in events])
+
+        assert ActivityLog.objects.count() == 2
+        activity = ActivityLog.objects.first()
+        assert activity.event_type == USER_ACTIVATED
+        assert activity.content_object == self.user
+        assert activity.actor == self.admin
+        activity = ActivityLog.objects.last()
+        assert activity.event_type == EXPERIMENT_DELETED_TRIGGERED
+        assert activity.content_object == self.experiment
+        assert activity.actor == self.admin
@@ -0,0 +1,89 @@
+from unittest.mock import patch
+
+import pytest
+
+from django.test import override_settings
+
+from auditor.service import AuditorService, BufferedAuditorService
+from event_manager.events import experiment as experiment_events
+from factories.factory_experiments import ExperimentFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.auditor_mark
+class AuditorBufferedTest(BaseTest):
+    """Testing events buffering and sampling"""
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.experiment = ExperimentFactory()
+
+    @override_settings(AUDITOR_BUFFER_SIZE=3, AUDITOR_BUFFER_TIMEOUT=60)
+    @patch('events_handlers.tasks.record.events_record_batch.apply_async')
+    @patch('events_handlers.tasks.record.events_record.apply_async')
+    def test_buffered_events_are_sent_as_one_batch(self, record, record_batch):
+        service = BufferedAuditorService()
+        service.validate()
+        service.setup()
+
+        for _ in range(2):
+            service.record(event_type=experiment_events.EXPERIMENT_NEW_METRIC,
+                           instance=self.experiment)
+        assert record.call_count == 0
+        assert record_batch.call_count == 0
+
+        service.record(event_type=experiment_events.EXPERIMENT_NEW_METRIC,
+                       instance=self.experiment)
+        assert record.call_count == 0
+        assert record_batch.call_count == 1
+        assert len(record_batch.call_args[0][1]['events']) == 3
+
+        # Flushing manually
+        service.record(event_type=experiment_events.EXPERIMENT_NEW_METRIC,
+                       instance=self.experiment)
+        service.flush()
+        assert record_batch.call_count == 2
+        assert len(record_batch.call_args[0][1]['events']) == 1
+
+        # Nothing to flush
+        service.flush()
+        assert record_batch.call_count == 2
+
+    @patch('events_handlers.tasks.record.events_record.apply_async')
+    def test_one_task_per_event(self, record):
+        service = AuditorService()
+        service.validate()
+        service.setup()
+
+        service.record(event_type=experiment_events.EXPERIMENT_NEW_METRIC,
+                       instance=self.experiment)
+        assert record.call_count == 1
+
+    @patch('events_handlers.tasks.record.events_record.apply_async')
+    def test_viewed_events_sampling(self, record):
+        service = AuditorService()
+        service.validate()
+        service.setup()
+
+        with override_settings(AUDITOR_VIEWED_EVENTS_SAMPLE_RATE=0):
+            service.record(event_type=experiment_events.EXPERIMENT_VIEWED,
+                           instance=self.experiment,
+                           actor_id=self.experiment.user.id,
+                           actor_name=self.experiment.user.username)
+            service.record(event_type=experiment_events.EXPERIMENT_METRICS_VIEWED,
+                           instance=self.experiment,
+                           actor_id=self.experiment.user.id,
+                           actor_name=self.experiment.user.username)
+            assert record.call_count == 0
+
+            # Other events are not sampled
+            service.record(event_type=experiment_events.EXPERIMENT_NEW_METRIC,
+                           instance=self.experiment)
+            assert record.call_count == 1
+
+        service.record(event_type=experiment_events.EXPERIMENT_VIEWED,
+                       instance=self.experiment,
+                       actor_id=self.experiment.user.id,
+                       actor_name=self.experiment.user.username)
+        assert record.call_count == 2
@@ -210,6 +210,21 @@ class AuditorExperimentGroupTest(BaseTest):
         assert activitylogs_record.call_count == 0
         assert notifier_record.call_count == 0
 
+    @patch('notifier.service.NotifierService.record_event')
+    @patch('tracker.service.TrackerService.record_event')
+    @patch('activitylogs.service.ActivityLogService.record_event')
+    def test_experiment_group_experiments_created(self,
+                                                  activitylogs_record,
+                                                  tracker_record,
+                                                  notifier_record):
+        auditor.record(event_type=experiment_group_events.EXPERIMENT_GROUP_EXPERIMENTS_CREATED,
+                       instance=self.experiment_group,
+                       num_experiments=10)
+
+        assert tracker_record.call_count == 1
+        assert activitylogs_record.call_count == 0
+        assert notifier_record.call_count == 0
+
     @patch('notifier.service.NotifierService.record_event')
     @patch('tracker.service.TrackerService.record_event')
     @patch('activitylogs.service.ActivityLogService.record_event')
@@ -2,9 +2,13 @@ import pytest
 
 from mock import patch
 
+from django.test import override_settings
+
 from constants.experiments import ExperimentLifeCycle
 from constants.jobs import JobLifeCycle
 from crons.tasks.heartbeats import heartbeat_builds, heartbeat_experiments, heartbeat_jobs
+from db.models.experiments import Experiment
+from db.redis.heartbeat import RedisHeartBeat
 from factories.factory_build_jobs import BuildJobFactory, BuildJobStatusFactory
 from factories.factory_experiments import ExperimentFactory, ExperimentStatusFactory
 from factories.factory_jobs import JobFactory, JobStatusFactory
@@ -62,3 +66,90 @@ class TestHeartBeatCrons(BaseTest):
             heartbeat_builds()
 
         assert mock_fct.call_count == 1
+
+    @override_settings(HEARTBEAT_SWEEP=True)
+    def test_heartbeat_experiments_sweep(self):
+        experiment1 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment1, status=ExperimentLifeCycle.RUNNING)
+        experiment2 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment2, status=ExperimentLifeCycle.RUNNING)
+        experiment3 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment3, status=ExperimentLifeCycle.CREATED)
+        RedisHeartBeat(experiment=experiment1.id).clear()
+        RedisHeartBeat.experiment_ping(experiment2.id)
+
+        with patch('scheduler.tasks.experiments'
+                   '.experiments_check_heartbeat.apply_async') as mock_fct:
+            heartbeat_experiments()
+
+        assert mock_fct.call_count == 0
+        experiment1.refresh_from_db()
+        experiment2.refresh_from_db()
+        experiment3.refresh_from_db()
+        assert experiment1.last_status == ExperimentLifeCycle.FAILED
+        assert experiment2.last_status == ExperimentLifeCycle.RUNNING
+        assert experiment3.last_status == ExperimentLifeCycle.CREATED
+
+    @override_settings(HEARTBEAT_SWEEP=True)
+    def test_heartbeat_experiments_sweep_skips_deleted_and_stopped_experiments(self):
+        experiment1 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment1, status=ExperimentLifeCycle.RUNNING)
+        experiment2 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment2, status=ExperimentLifeCycle.RUNNING)
+        experiment3 = ExperimentFactory()
+        ExperimentStatusFactory(experiment=experiment3, status=ExperimentLifeCycle.RUNNING)
+        for experiment in (experiment1, experiment2, experiment3):
+            RedisHeartBeat(experiment=experiment.id).clear()
+        get_dead_experiments = RedisHeartBeat.get_dead_experiments
+
+        def get_dead(ids):
+            # The experiments are deleted or stopped while the heartbeats are checked
+            Experiment.objects.filter(id=experiment1.id).update(deleted=True)
+            ExperimentStatusFactory(experiment=experiment2, status=ExperimentLifeCycle.SUCCEEDED)
+            return get_dead_experiments(ids)
+
+        with patch.object(RedisHeartBeat, 'get_dead_experiments', side_effect=get_dead):
+            heartbeat_experiments()
+
+        experiment1 = Experiment.all.get(id=experiment1.id)
+        experiment2.refresh_from_db()
+        experiment3.refresh_from_db()
+        assert experiment1.last_status == ExperimentLifeCycle.RUNNING
+        assert experiment2.last_status == ExperimentLifeCycle.SUCCEEDED
+        assert experiment3.last_status == ExperimentLifeCycle.FAILED
+
+    @override_settings(HEARTBEAT_SWEEP=True)
+    def test_heartbeat_jobs_sweep(self):
+        job1 = JobFactory()
+        JobStatusFactory(job=job1, status=JobLifeCycle.RUNNING)
+        job2 = JobFactory()
+        JobStatusFactory(job=job2, status=JobLifeCycle.RUNNING)
+        RedisHeartBeat(job=job1.id).clear()
+        RedisHeartBeat.job_ping(job2.id)
+
+        with patch('scheduler.tasks.jobs.jobs_check_heartbeat.apply_async') as mock_fct:
+            heartbeat_jobs()
+
+        assert mock_fct.call_count == 0
+        job1.refresh_from_db()
+        job2.refresh_from_db()
+        assert job1.last_status == JobLifeCycle.FAILED
+        assert job2.last_status == JobLifeCycle.RUNNING
+
+    @override_settings(HEARTBEAT_SWEEP=True)
+    def test_heartbeat_builds_sweep(self):
+        build1 = BuildJobFactory()
+        BuildJobStatusFactory(job=build1, status=JobLifeCycle.RUNNING)
+        build2 = BuildJobFactory()
+        BuildJobStatusFactory(job=build2, status=JobLifeCycle.RUNNING)
+        RedisHeartBeat(build=build1.id).clear()
+        RedisHeartBeat.build_ping(build2.id)
+
+        with patch('scheduler.tasks.build_jobs.build_jobs_check_heartbeat.apply_async') as mock_fct:
+            heartbeat_builds()
+
+        assert mock_fct.call_count == 0
+        build1.refresh_from_db()
+        build2.refresh_from_db()
+        assert build1.last_status == JobLifeCycle.FAILED
+        assert build2.last_status == JobLifeCycle.RUNNING
@@ -107,3 +107,87 @@ class TestDockerize(BaseTest):
         assert 'RUN {}'.format(build_steps[0]) in dockerfile
         assert 'RUN {}'.format(build_steps[1]) in dockerfile
         builder.clean()
+
+    @patch('dockerizer.builder.APIClient')
+    def test_dependencies_image_tag(self, _):
+        repo_path = os.path.join(conf.get('REPOS_MOUNT_PATH'), 'repo')
+        os.mkdir(repo_path)
+        with open(os.path.join(repo_path, 'requirements.txt'), 'w') as requirements:
+            requirements.write('numpy')
+        build_steps = ['pip install -r requirements.txt']
+
+        def get_builder(**kwargs):
+            params = dict(build_job=BuildJobFactory(),
+                          repo_path=repo_path,
+                          from_image='busybox',
+                          build_steps=build_steps)
+            params.update(kwargs)
+            return DockerBuilder(**params)
+
+        builder = get_builder()
+        dependencies_image_tag = builder.get_dependencies_image_tag()
+        assert dependencies_image_tag.startswith(builder.DEPENDENCIES_IMAGE_TAG_PREFIX)
+
+        # The code changes of another commit do not change the tag
+        with open(os.path.join(repo_path, 'main.py'), 'w') as main:
+            main.write('print(1)')
+        assert get_builder().get_dependencies_image_tag() == dependencies_image_tag
+
+        # The dependencies inputs change the tag
+        assert get_builder(from_image='python').get_dependencies_image_tag() != (
+            dependencies_image_tag)
+        assert get_builder(build_steps=['pip install -r requirements.txt', 'ls']
+                           ).get_dependencies_image_tag() != dependencies_image_tag
+        assert get_builder(env_vars=[('BLA', 'BLA')]).get_dependencies_image_tag() != (
+            dependencies_image_tag)
+        with open(os.path.join(repo_path, 'requirements.txt'), 'w') as requirements:
+            requirements.write('numpy\nscipy')
+        assert get_builder().get_dependencies_image_tag() != dependencies_image_tag
+
+        # The code is only copied by the code's dockerfile
+        dependencies_image = '{}:{}'.format(builder.image_name, dependencies_image_tag)
+        dependencies_dockerfile = builder.render_dependencies()
+        code_dockerfile = builder.render_code(dependencies_image=dependencies_image)
+        assert 'RUN {}'.format(build_steps[0]) in dependencies_dockerfile
+        assert 'COPY {} {}'.format(builder.folder_name, builder.WORKDIR) not in (
+            dependencies_dockerfile)
+        assert 'FROM {}'.format(dependencies_image) in code_dockerfile
+        assert 'COPY {} {}'.format(builder.folder_name, builder.WORKDIR) in code_dockerfile
+        assert 'RUN' not in code_dockerfile
+
+    @patch('dockerizer.builder.APIClient')
+    def test_build_with_dependencies_image(self, _):
+        build_job = BuildJobFactory()
+        repo_path = os.path.join(conf.get('REPOS_MOUNT_PATH'), 'repo')
+        os.mkdir(repo_path)
+        Path(os.path.join(repo_path, 'requirements.txt')).touch()
+        builder = DockerBuilder(build_job=build_job,
+                                repo_path=repo_path,
+                                from_image='busybox',
+                                build_steps=['pip install -r requirements.txt'])
+        dependencies_image_tag = builder.get_dependencies_image_tag()
+
+        # The dependencies image is built and pushed once
+        with patch.object(builder, '_handle_log_stream', return_value=True):
+            with patch('dockerizer.builder.image_exists', return_value=False):
+                assert builder.build_with_dependencies_image() is True
+        assert builder.docker.build.call_count == 2
+        assert [call[1]['tag'] for call in builder.docker.build.call_args_list] == [
+            '{}:{}'.format(builder.image_name, dependencies_image_tag),
+            builder.get_tagged_image()]
+        assert builder.docker.push.call_count == 1
+        assert builder.docker.push.call_args[1]['tag'] == dependencies_image_tag
+
+        build_job.refresh_from_db()
+        assert build_job.image_tag == builder.image_tag
+        assert build_job.dependencies_image_tag == dependencies_image_tag
+
+        # Then only the code is built
+        builder.docker.reset_mock()
+        with patch.object(builder, '_handle_log_stream', return_value=True):
+            with patch('dockerizer.builder.image_exists', return_value=True):
+                assert builder.build_with_dependencies_image() is True
+        assert builder.docker.build.call_count == 1
+        assert builder.docker.build.call_args[1]['tag'] == builder.get_tagged_image()
+        assert builder.docker.push.call_count == 0
+        builder.clean()
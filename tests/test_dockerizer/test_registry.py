@@ -0,0 +1,121 @@
+import threading
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from django.test import override_settings
+
+from docker_images.image_info import get_image_info
+from docker_images.registry import get_manifest_url, image_exists, manifest_exists
+from dockerizer.builder import build
+from factories.factory_build_jobs import BuildJobFactory
+from scheduler.dockerizer_scheduler import check_image
+from tests.utils import BaseTest
+
+
+class FakeRegistryHandler(BaseHTTPRequestHandler):
+    """Answers the manifests' HEAD requests of the images pushed to the fake registry."""
+
+    def do_HEAD(self):  # noqa
+        self.server.requests.append(self.path)
+        if self.server.broken:
+            self.send_response(500)
+        elif self.path in self.server.manifests:
+            self.send_response(200)
+            self.send_header('Docker-Content-Digest', 'sha256:digest')
+        else:
+            self.send_response(404)
+        self.end_headers()
+
+    def log_message(self, *args):  # noqa
+        pass
+
+
+@pytest.mark.dockerizer_mark
+class TestRegistry(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.registry = HTTPServer(('127.0.0.1', 0), FakeRegistryHandler)
+        self.registry.requests = []
+        self.registry.manifests = set()
+        self.registry.broken = False
+        thread = threading.Thread(target=self.registry.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.registry.server_close)
+        self.addCleanup(self.registry.shutdown)
+
+        settings = override_settings(REGISTRY_HOST_NAME='127.0.0.1',
+                                     REGISTRY_PORT=str(self.registry.server_port),
+                                     REGISTRY_USER=None,
+                                     REGISTRY_PASSWORD=None)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.build_job = BuildJobFactory()
+        self.image_name, self.image_tag = get_image_info(self.build_job)
+
+    def push(self, image_name, image_tag):
+        self.registry.manifests.add('/v2/{}/manifests/{}'.format(image_name.split('/', 1)[1],
+                                                                 image_tag))
+
+    def test_get_manifest_url(self):
+        assert get_manifest_url(self.image_name, self.image_tag) == (
+            'http://127.0.0.1:{}/v2/{}/manifests/{}'.format(
+                self.registry.server_port, self.image_name.split('/', 1)[1], self.image_tag))
+        assert get_manifest_url('other.registry:5000/foo/bar', 'tag') == (
+            'http://other.registry:5000/v2/foo/bar/manifests/tag')
+
+    def test_manifest_exists(self):
+        assert manifest_exists(self.image_name, self.image_tag) is False
+        self.push(self.image_name, self.image_tag)
+        assert manifest_exists(self.image_name, self.image_tag) is True
+
+        self.registry.broken = True
+        assert manifest_exists(self.image_name, self.image_tag) is None
+
+        # Unreachable registry
+        self.registry.broken = False
+        with override_settings(REGISTRY_PORT='1'):
+            assert manifest_exists(self.image_name, self.image_tag) is None
+
+    def test_image_exists_caches_the_positive_results(self):
+        docker = MagicMock()
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is False
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is False
+        assert len(self.registry.requests) == 2
+
+        self.push(self.image_name, self.image_tag)
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is True
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is True
+        assert len(self.registry.requests) == 3
+        # The docker daemon is not asked when the registry answers
+        assert docker.images.call_count == 0
+
+    def test_image_exists_falls_back_to_the_docker_daemon(self):
+        self.registry.broken = True
+        docker = MagicMock()
+        docker.images.return_value = []
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is False
+        docker.images.return_value = [{'Id': 'sha256:digest'}]
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is True
+        assert docker.images.call_count == 2
+
+        # Cached
+        assert image_exists(self.image_name, self.image_tag, docker=docker) is True
+        assert docker.images.call_count == 2
+
+    def test_check_image_before_spawning_the_dockerizer(self):
+        assert check_image(self.build_job) is False
+        self.push(self.image_name, self.image_tag)
+        assert check_image(self.build_job) is True
+
+    def test_build_checks_the_image_before_downloading_the_code(self):
+        self.push(self.image_name, self.image_tag)
+        with patch('dockerizer.builder.download_code') as download_code_mock:
+            assert build(build_job=self.build_job) is True
+        assert download_code_mock.call_count == 0
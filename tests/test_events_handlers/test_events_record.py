@@ -2,7 +2,16 @@ from unittest.mock import patch
 
 import pytest
 
-from events_handlers.tasks.record import events_log, events_notify, events_track
+from django.db import IntegrityError
+
+from events_handlers.tasks.record import (
+    events_log,
+    events_notify,
+    events_record,
+    events_record_batch,
+    events_track
+)
+from polyaxon.settings import EventsCeleryTasks
 from tests.utils import BaseTest
 
 
@@ -25,3 +34,42 @@ class BaseTestEventsHandling(BaseTest):
             events_track(None)
 
         self.assertEqual(mock_fct.call_count, 1)
+
+    def test_events_record(self):
+        with patch('auditor.log') as log_fct:
+            with patch('auditor.track') as track_fct:
+                with patch('auditor.notify') as notify_fct:
+                    events_record(None)
+
+        self.assertEqual(log_fct.call_count, 1)
+        self.assertEqual(track_fct.call_count, 1)
+        self.assertEqual(notify_fct.call_count, 1)
+
+    def test_events_record_batch(self):
+        with patch('auditor.log_batch') as log_fct:
+            with patch('auditor.track_batch') as track_fct:
+                with patch('auditor.notify_batch') as notify_fct:
+                    events_record_batch([])
+
+        self.assertEqual(log_fct.call_count, 1)
+        self.assertEqual(track_fct.call_count, 1)
+        self.assertEqual(notify_fct.call_count, 1)
+
+    def test_events_record_batch_records_the_failing_events_on_their_own(self):
+        def log(event):
+            if event['id'] == 2:
+                raise IntegrityError
+
+        events = [{'id': 1}, {'id': 2}, {'id': 3}]
+        with patch('auditor.log_batch', side_effect=IntegrityError):
+            with patch('auditor.log', side_effect=log) as log_fct:
+                with patch('auditor.track_batch') as track_fct:
+                    with patch('auditor.notify_batch') as notify_fct:
+                        with patch('polyaxon.celery_api.celery_app.send_task') as send_task:
+                            events_record_batch(events)
+
+        self.assertEqual(log_fct.call_count, 3)
+        track_fct.assert_called_once_with([{'id': 1}, {'id': 3}])
+        notify_fct.assert_called_once_with([{'id': 1}, {'id': 3}])
+        send_task.assert_called_once_with(EventsCeleryTasks.EVENTS_RECORD,
+                                          kwargs={'event': {'id': 2}})
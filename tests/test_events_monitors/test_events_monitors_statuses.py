@@ -1,4 +1,6 @@
+import copy
 import datetime
+import uuid
 
 import pytest
 
@@ -7,10 +9,11 @@ from mock import patch
 from django.utils import timezone
 
 import conf
+import stats
 
 from constants.jobs import JobLifeCycle
 from db.models.build_jobs import BuildJobStatus
-from db.models.experiment_jobs import ExperimentJobStatus
+from db.models.experiment_jobs import ExperimentJob, ExperimentJobStatus
 from db.models.jobs import JobStatus
 from db.models.notebooks import NotebookJobStatus
 from db.models.tensorboards import TensorboardJobStatus
@@ -22,10 +25,14 @@ from factories.factory_projects import ProjectFactory
 from k8s_events_handlers.tasks.statuses import (
     k8s_events_handle_build_job_statuses,
     k8s_events_handle_experiment_job_statuses,
+    k8s_events_handle_experiment_jobs_statuses,
     k8s_events_handle_job_statuses,
     k8s_events_handle_plugin_job_statuses
 )
+from monitor_statuses.coalescer import StatusesCoalescer
 from monitor_statuses.jobs import get_job_state
+from polyaxon.settings import K8SEventsCeleryTasks
+from stats.memory import MemoryStatsBackend
 from tests.fixtures import (
     status_build_job_event,
     status_build_job_event_with_conditions,
@@ -108,6 +115,70 @@ class TestEventsExperimentJobsStatusesHandling(TestEventsBaseJobsStatusesHandlin
         job_uuid = job_state.details.labels.job_uuid.hex
         return ExperimentJobFactory(uuid=job_uuid)
 
+    def test_handle_k8s_events_experiment_jobs_statuses_in_bulk(self):
+        job_state = get_job_state(
+            event_type=self.EVENT_WITH_CONDITIONS['type'],
+            event=self.EVENT_WITH_CONDITIONS['object'],
+            created_at=timezone.now() + datetime.timedelta(days=1),
+            job_container_names=(self.CONTAINER_NAME,),
+            experiment_type_label=conf.get('TYPE_LABELS_RUNNER'))
+
+        jobs = [ExperimentJobFactory() for _ in range(3)]
+        payloads = []
+        for job in jobs:
+            payload = copy.deepcopy(job_state.to_dict())
+            payload['details']['labels']['job_uuid'] = job.uuid.hex
+            payloads.append(payload)
+        # The job of this payload does not exist
+        payloads.append(job_state.to_dict())
+
+        with patch('k8s_events_handlers.tasks.statuses.logger.info') as logger_info:
+            k8s_events_handle_experiment_jobs_statuses(payloads)
+        assert self.STATUS_MODEL.objects.count() == 6
+        # The missing job is logged
+        assert job_state.details.labels.job_uuid.hex in logger_info.call_args[0][1]
+        for job in jobs:
+            statuses = self.STATUS_MODEL.objects.filter(job=job).values_list('status', flat=True)
+            assert set(statuses) == {JobLifeCycle.CREATED, JobLifeCycle.FAILED}
+
+    def test_handle_k8s_events_experiment_jobs_statuses_continues_after_a_job_error(self):
+        job_state = get_job_state(
+            event_type=self.EVENT_WITH_CONDITIONS['type'],
+            event=self.EVENT_WITH_CONDITIONS['object'],
+            created_at=timezone.now() + datetime.timedelta(days=1),
+            job_container_names=(self.CONTAINER_NAME,),
+            experiment_type_label=conf.get('TYPE_LABELS_RUNNER'))
+
+        jobs = [ExperimentJobFactory() for _ in range(3)]
+        payloads = []
+        for job in jobs:
+            payload = copy.deepcopy(job_state.to_dict())
+            payload['details']['labels']['job_uuid'] = job.uuid.hex
+            payloads.append(payload)
+
+        set_status = ExperimentJob.set_status
+
+        def set_status_or_raise(job, *args, **kwargs):
+            if job.id == jobs[0].id:
+                raise ValueError('Unexpected error')
+            return set_status(job, *args, **kwargs)
+
+        with patch.object(ExperimentJob, 'set_status', autospec=True,
+                          side_effect=set_status_or_raise):
+            with patch('k8s_events_handlers.tasks.statuses.celery_app.send_task') as send_task:
+                k8s_events_handle_experiment_jobs_statuses(payloads)
+
+        # The failing job's status is handed to the single job handler
+        assert send_task.call_count == 1
+        assert send_task.call_args[0][0] == (
+            K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES)
+        assert send_task.call_args[1]['kwargs'] == {'payload': payloads[0]}
+        # The other jobs' statuses are set
+        assert self.STATUS_MODEL.objects.filter(job=jobs[0]).count() == 1
+        for job in jobs[1:]:
+            statuses = self.STATUS_MODEL.objects.filter(job=job).values_list('status', flat=True)
+            assert set(statuses) == {JobLifeCycle.CREATED, JobLifeCycle.FAILED}
+
 
 @pytest.mark.monitors_mark
 class TestEventsJobsStatusesHandling(TestEventsBaseJobsStatusesHandling):
@@ -171,3 +242,68 @@ class TestEventsDockerizerJobsStatusesHandling(TestEventsBaseJobsStatusesHandlin
 
 # Prevent this base class from running tests
 del TestEventsBaseJobsStatusesHandling
+
+
+@pytest.mark.monitors_mark
+class TestStatusesCoalescer(BaseTest):
+    DISABLE_RUNNER = True
+
+    @staticmethod
+    def get_pod_state(job_uuid, status):
+        return {'status': status, 'details': {'labels': {'job_uuid': job_uuid.hex}}}
+
+    def test_coalesce_the_states_per_job(self):
+        coalescer = StatusesCoalescer(window=1)
+        task = K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES
+        job1 = uuid.uuid4()
+        job2 = uuid.uuid4()
+        coalescer.add(task=task, pod_state=self.get_pod_state(job1, JobLifeCycle.BUILDING))
+        coalescer.add(task=task, pod_state=self.get_pod_state(job1, JobLifeCycle.RUNNING))
+        coalescer.add(task=task, pod_state=self.get_pod_state(job2, JobLifeCycle.RUNNING))
+        coalescer.add(task=task, pod_state=self.get_pod_state(job2, JobLifeCycle.FAILED))
+        # A done state is not superseded
+        coalescer.add(task=task, pod_state=self.get_pod_state(job2, JobLifeCycle.RUNNING))
+
+        stats_backend = MemoryStatsBackend(prefix='')
+        with patch('monitor_statuses.coalescer.celery_app.send_task') as send_task:
+            with patch.object(stats.backend, '_wrapped', stats_backend):
+                coalescer.flush()
+
+        assert send_task.call_count == 2
+        assert [call[0][0] for call in send_task.call_args_list] == [task, task]
+        payloads = [call[1]['kwargs']['payload'] for call in send_task.call_args_list]
+        assert payloads == [self.get_pod_state(job1, JobLifeCycle.RUNNING),
+                            self.get_pod_state(job2, JobLifeCycle.FAILED)]
+        assert coalescer.num_received == 5
+        assert coalescer.num_coalesced == 3
+        assert coalescer.num_sent == 2
+        assert stats_backend.counters == {'statuses.received': 5,
+                                          'statuses.coalesced': 3,
+                                          'statuses.sent': 2}
+
+        # Nothing to send
+        with patch('monitor_statuses.coalescer.celery_app.send_task') as send_task:
+            coalescer.flush()
+        assert send_task.call_count == 0
+
+    def test_experiment_jobs_states_are_sent_in_bulk(self):
+        coalescer = StatusesCoalescer(window=1)
+        experiment_job_task = K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOB_STATUSES
+        job_task = K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_JOB_STATUSES
+        experiment_jobs = [uuid.uuid4() for _ in range(3)]
+        for job_uuid in experiment_jobs:
+            coalescer.add(task=experiment_job_task,
+                          pod_state=self.get_pod_state(job_uuid, JobLifeCycle.RUNNING))
+        coalescer.add(task=job_task, pod_state=self.get_pod_state(uuid.uuid4(),
+                                                                  JobLifeCycle.RUNNING))
+
+        with patch('monitor_statuses.coalescer.celery_app.send_task') as send_task:
+            coalescer.stop()
+
+        assert send_task.call_count == 2
+        assert send_task.call_args_list[0][0][0] == job_task
+        assert (send_task.call_args_list[1][0][0] ==
+                K8SEventsCeleryTasks.K8S_EVENTS_HANDLE_EXPERIMENT_JOBS_STATUSES)
+        payloads = send_task.call_args_list[1][1]['kwargs']['payloads']
+        assert payloads == [self.get_pod_state(job_uuid, JobLifeCycle.RUNNING)
+                            for job_uuid in experiment_jobs]
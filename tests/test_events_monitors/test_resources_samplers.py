@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+from mock import MagicMock
+
+from monitor_resources.samplers import (
+    CgroupSampler,
+    DockerSampler,
+    DockerStreamSampler,
+    get_sampler
+)
+from tests.utils import BaseTest
+
+
+@pytest.mark.monitors_mark
+class TestCgroupSampler(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.root = tempfile.mkdtemp()
+        self.cgroup_root = os.path.join(self.root, 'cgroup')
+        self.proc_root = os.path.join(self.root, 'proc')
+        self.write(self.proc_root, 'meminfo', 'MemTotal:       16384 kB\nMemFree:  1024 kB')
+        self.set_system_cpu(100)
+        self.container = MagicMock(id='container-id', attrs={'State': {'Pid': 42}})
+        self.container.name = 'container'
+        self.sampler = CgroupSampler(cgroup_root=self.cgroup_root, proc_root=self.proc_root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+        super().tearDown()
+
+    @staticmethod
+    def write(path, filename, content):
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, filename), 'w') as f:
+            f.write(content)
+
+    def set_system_cpu(self, ticks):
+        self.write(self.proc_root, 'stat', 'cpu  {} 0 0 0 0 0 0 0 0 0\ncpu0 0 0 0 0'.format(ticks))
+
+    def set_v1(self, usage, percpu_usage, memory_usage, memory_limit):
+        self.write(os.path.join(self.proc_root, '42'),
+                   'cgroup',
+                   '4:memory:/docker/container-id\n3:cpu,cpuacct:/docker/container-id')
+        cpu_path = os.path.join(self.cgroup_root, 'cpuacct', 'docker', 'container-id')
+        self.write(cpu_path, 'cpuacct.usage', str(usage))
+        self.write(cpu_path, 'cpuacct.usage_percpu', ' '.join(str(u) for u in percpu_usage))
+        memory_path = os.path.join(self.cgroup_root, 'memory', 'docker', 'container-id')
+        self.write(memory_path, 'memory.usage_in_bytes', str(memory_usage))
+        self.write(memory_path, 'memory.limit_in_bytes', str(memory_limit))
+
+    def set_v2(self, usage_usec, memory_usage, memory_max):
+        self.write(os.path.join(self.proc_root, '42'), 'cgroup', '0::/docker/container-id')
+        path = os.path.join(self.cgroup_root, 'docker', 'container-id')
+        self.write(path, 'cpu.stat', 'usage_usec {}\nuser_usec 0\nsystem_usec 0'.format(usage_usec))
+        self.write(path, 'memory.current', str(memory_usage))
+        self.write(path, 'memory.max', memory_max)
+
+    def test_get_sampler(self):
+        assert isinstance(get_sampler('docker'), DockerSampler)
+        sampler = get_sampler('cgroup', cgroup_root=self.cgroup_root, proc_root=self.proc_root)
+        assert isinstance(sampler, CgroupSampler)
+        assert sampler.cgroup_root == self.cgroup_root
+
+    def test_cgroup_v1(self):
+        self.set_v1(usage=1000, percpu_usage=[400, 600], memory_usage=512, memory_limit=2 ** 62)
+        # The first sample is only used for the deltas
+        assert self.sampler.get_stats(self.container) is None
+
+        self.set_v1(usage=3000, percpu_usage=[1000, 2000], memory_usage=1024, memory_limit=2048)
+        self.set_system_cpu(200)
+        stats = self.sampler.get_stats(self.container)
+        assert stats['precpu_stats']['cpu_usage']['total_usage'] == 1000
+        assert stats['cpu_stats']['cpu_usage']['total_usage'] == 3000
+        assert stats['cpu_stats']['cpu_usage']['percpu_usage'] == [1000, 2000]
+        assert (stats['cpu_stats']['system_cpu_usage'] -
+                stats['precpu_stats']['system_cpu_usage']) == 100 * 10 ** 9 // os.sysconf(
+            'SC_CLK_TCK')
+        assert stats['memory_stats'] == {'usage': 1024, 'limit': 2048}
+
+    def test_cgroup_v1_limit_is_bound_to_host_memory(self):
+        self.set_v1(usage=1000, percpu_usage=[1000], memory_usage=512, memory_limit=2 ** 62)
+        self.sampler.get_stats(self.container)
+        stats = self.sampler.get_stats(self.container)
+        assert stats['memory_stats'] == {'usage': 512, 'limit': 16384 * 1024}
+
+    def test_cgroup_v2(self):
+        self.set_v2(usage_usec=1, memory_usage=512, memory_max='max')
+        assert self.sampler.get_stats(self.container) is None
+
+        self.set_v2(usage_usec=3, memory_usage=1024, memory_max='4096')
+        self.set_system_cpu(200)
+        stats = self.sampler.get_stats(self.container)
+        assert stats['precpu_stats']['cpu_usage'] == {'total_usage': 1000}
+        assert stats['cpu_stats']['cpu_usage'] == {'total_usage': 3000}
+        assert stats['memory_stats'] == {'usage': 1024, 'limit': 4096}
+        assert stats['cpu_stats']['online_cpus'] == os.cpu_count()
+
+    def test_stopped_container_is_discarded(self):
+        self.set_v2(usage_usec=1, memory_usage=512, memory_max='max')
+        assert self.sampler.get_stats(self.container) is None
+        assert self.container.id in self.sampler._previous_stats
+
+        shutil.rmtree(os.path.join(self.cgroup_root, 'docker'))
+        assert self.sampler.get_stats(self.container) is None
+        assert self.container.id not in self.sampler._previous_stats
+        assert self.container.id not in self.sampler._cgroups
+
+
+@pytest.mark.monitors_mark
+class TestDockerStreamSampler(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.container = MagicMock(id='container-id')
+        self.container.name = 'container'
+        self.container.stats.return_value = iter([{'sample': 1}, {'sample': 2}])
+        self.sampler = DockerStreamSampler()
+
+    def test_stream_owning_the_subscription_keeps_the_latest_sample(self):
+        self.sampler._threads[self.container.id] = threading.current_thread()
+        self.sampler._consume(self.container)
+        # The ended stream drops its subscription
+        assert self.container.id not in self.sampler._threads
+        assert self.container.id not in self.sampler._latest_stats
+
+    def test_discarded_stream_does_not_touch_newer_subscription(self):
+        # The stream of the current thread was discarded and the container subscribed again
+        newer_thread = threading.Thread()
+        self.sampler._threads[self.container.id] = newer_thread
+        self.sampler._latest_stats[self.container.id] = {'sample': 0}
+
+        self.sampler._consume(self.container)
+        assert self.sampler._threads[self.container.id] is newer_thread
+        assert self.sampler._latest_stats[self.container.id] == {'sample': 0}
+        # The stale stream stopped at its first sample
+        assert self.container.stats.return_value.__next__() == {'sample': 2}
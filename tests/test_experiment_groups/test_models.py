@@ -16,8 +16,10 @@ from constants.experiments import ExperimentLifeCycle
 from constants.urls import API_V1
 from db.managers.deleted import ArchivedManager, LiveManager
 from db.models.experiment_groups import ExperimentGroup, ExperimentGroupIteration, GroupTypes
-from db.models.experiments import Experiment, ExperimentMetric
+from db.models.experiments import Experiment, ExperimentMetric, ExperimentStatus
 from db.redis.group_check import GroupChecks
+from event_manager.events.experiment import EXPERIMENT_NEW_STATUS
+from event_manager.events.experiment_group import EXPERIMENT_GROUP_EXPERIMENTS_CREATED
 from factories.factory_experiment_groups import ExperimentGroupFactory, ExperimentGroupStatusFactory
 from factories.factory_experiments import (
     ExperimentFactory,
@@ -42,6 +44,8 @@ from hpsearch.search_managers import (
     HyperbandSearchManager,
     RandomSearchManager
 )
+from hpsearch.spec_template import ExperimentSpecTemplate
+from hpsearch.tasks import base as hpsearch_base
 from hpsearch.tasks.bo import hp_bo_start
 from hpsearch.tasks.hyperband import hp_hyperband_start
 from scheduler.tasks.experiment_groups import experiments_group_stop_experiments
@@ -727,6 +731,120 @@ class TestExperimentGroupModel(BaseTest):
         assert experiment_group.all_experiments.count() == 2
 
 
+@pytest.mark.experiment_groups_mark
+class TestExperimentGroupExperimentsCreation(BaseTest):
+    content = """---
+    version: 1
+
+    kind: group
+
+    tags: [fixtures]
+
+    hptuning:
+      concurrency: 2
+      matrix:
+        lr:
+          values: [0.01, 0.1]
+        optimizer:
+          values: [adam, sgd]
+
+    build:
+      image: my_image
+
+    run:
+      cmd: train --lr={{ lr }} --optimizer={{ optimizer }}
+"""
+
+    def test_spec_template_is_supported(self):
+        assert ExperimentSpecTemplate.is_supported(self.content) is True
+        assert ExperimentSpecTemplate.is_supported(
+            self.content.replace('{{ lr }}', '{{ lr * 2 }}')) is False
+        assert ExperimentSpecTemplate.is_supported(
+            self.content.replace('{{ lr }}', '{{ lr | int }}')) is False
+        assert ExperimentSpecTemplate.is_supported(
+            self.content.replace('{{ lr }}', '{% if lr %}1{% endif %}')) is False
+
+    def test_spec_template_renders_the_parsed_configs(self):
+        with patch('hpsearch.tasks.grid.hp_grid_search_create.apply_async'):
+            experiment_group = ExperimentGroupFactory(content=self.content)
+
+        suggestions = experiment_group.get_suggestions()
+        template = ExperimentSpecTemplate.get_template(experiment_group=experiment_group,
+                                                       suggestion=suggestions[0])
+        assert template is not None
+        specification = experiment_group.specification
+        for suggestion in suggestions:
+            expected = specification.get_experiment_spec(matrix_declaration=suggestion)
+            assert template.render(suggestion) == expected.parsed_data
+
+    def test_spec_template_parses_the_suggestions_with_evaluated_values(self):
+        assert ExperimentSpecTemplate.is_plain_value('adam') is True
+        assert ExperimentSpecTemplate.is_plain_value(0.01) is True
+        assert ExperimentSpecTemplate.is_plain_value(True) is True
+        assert ExperimentSpecTemplate.is_plain_value('1e-3') is False
+        assert ExperimentSpecTemplate.is_plain_value('[1, 2]') is False
+        assert ExperimentSpecTemplate.is_plain_value('{{ lr }}') is False
+        assert ExperimentSpecTemplate.is_plain_value([1, 2]) is False
+
+        with patch('hpsearch.tasks.grid.hp_grid_search_create.apply_async'):
+            experiment_group = ExperimentGroupFactory(content=self.content)
+
+        template = ExperimentSpecTemplate.get_template(
+            experiment_group=experiment_group,
+            suggestion={'lr': 0.01, 'optimizer': 'adam'})
+        assert template is not None
+        assert ExperimentSpecTemplate.get_template(
+            experiment_group=experiment_group,
+            suggestion={'lr': '1e-3', 'optimizer': 'adam'}) is None
+        specification = experiment_group.specification
+        for suggestion in [{'lr': '1e-3', 'optimizer': 'adam'},
+                           {'lr': 0.1, 'optimizer': 'True'},
+                           {'lr': [0.1, 0.2], 'optimizer': 'sgd'}]:
+            expected = specification.get_experiment_spec(matrix_declaration=suggestion)
+            assert template.render(suggestion) == expected.parsed_data
+
+    def test_group_experiments_are_bulk_created(self):
+        with patch('hpsearch.tasks.grid.hp_grid_search_start.apply_async'):
+            with patch('auditor.record') as auditor_record:
+                experiment_group = ExperimentGroupFactory(content=self.content)
+
+        event_types = [call[1].get('event_type') for call in auditor_record.call_args_list]
+        assert event_types.count(EXPERIMENT_GROUP_EXPERIMENTS_CREATED) == 1
+        assert EXPERIMENT_NEW_STATUS not in event_types
+
+        experiments = Experiment.objects.filter(experiment_group=experiment_group)
+        assert experiments.count() == 4
+        assert ExperimentStatus.objects.filter(experiment__in=experiments).count() == 4
+        for experiment in experiments:
+            assert experiment.last_status == ExperimentLifeCycle.CREATED
+            assert experiment.status.status == ExperimentLifeCycle.CREATED
+            assert experiment.tags == ['fixtures']
+            assert experiment.specification.run.cmd == 'train --lr={} --optimizer={}'.format(
+                experiment.declarations['lr'], experiment.declarations['optimizer'])
+        assert experiment_group.pending_experiments.count() == 4
+
+    def test_group_experiments_are_created_in_chunks(self):
+        with patch.object(hpsearch_base, 'BULK_CREATE_CHUNK_SIZE', 3):
+            with patch('hpsearch.tasks.grid.hp_grid_search_start.apply_async'):
+                with patch('auditor.record') as auditor_record:
+                    experiment_group = ExperimentGroupFactory(content=self.content)
+
+        event_types = [call[1].get('event_type') for call in auditor_record.call_args_list]
+        assert event_types.count(EXPERIMENT_GROUP_EXPERIMENTS_CREATED) == 2
+        assert experiment_group.experiments.count() == 4
+
+    def test_group_experiments_fallback_to_the_signals(self):
+        content = self.content.replace('{{ lr }}', '{{ lr * 2 }}')
+        with patch('hpsearch.tasks.grid.hp_grid_search_start.apply_async'):
+            with patch('auditor.record') as auditor_record:
+                experiment_group = ExperimentGroupFactory(content=content)
+
+        event_types = [call[1].get('event_type') for call in auditor_record.call_args_list]
+        assert EXPERIMENT_GROUP_EXPERIMENTS_CREATED not in event_types
+        assert event_types.count(EXPERIMENT_NEW_STATUS) == 4
+        assert experiment_group.experiments.count() == 4
+
+
 @pytest.mark.experiment_groups_mark
 class TestExperimentGroupCommit(BaseViewTest):
     def setUp(self):
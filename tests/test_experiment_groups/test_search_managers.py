@@ -1,4 +1,5 @@
 # pylint:disable=too-many-lines
+import itertools
 import numpy as np
 
 from unittest.mock import patch
@@ -22,6 +23,8 @@ from hpsearch.search_managers import (
 )
 from hpsearch.search_managers.bayesian_optimization.optimizer import BOOptimizer
 from hpsearch.search_managers.bayesian_optimization.space import SearchSpace
+from hpsearch.search_managers.grid import GridSpace
+from hpsearch.search_managers.utils import Suggestion, get_random_suggestions
 from schemas.hptuning import HPTuningConfig, MatrixConfig
 from tests.utils import BaseTest
 
@@ -106,6 +109,56 @@ class TestGridSearchManager(BaseTest):
 
         assert to_numpy_mock.call_count == 2
 
+    def test_grid_space_follows_the_product_order(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        matrix = hptuning_config.matrix
+        grid = GridSpace(matrix=matrix)
+        keys = list(matrix.keys())
+        expected = [dict(zip(keys, v))
+                    for v in itertools.product(*[v.to_numpy() for v in matrix.values()])]
+        assert grid.size == len(expected) == 60
+        assert [grid.get_suggestion(i) for i in range(grid.size)] == expected
+        assert list(grid.get_suggestions(start=10, stop=100)) == expected[10:]
+        with self.assertRaises(IndexError):
+            grid.get_suggestion(60)
+
+    def test_get_suggestions_slice(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'grid_search': {'n_experiments': 10},
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_num_grid_suggestions() == 10
+        suggestions = manager.get_suggestions()
+        chunks = [manager.get_suggestions_slice(start=start, stop=start + 3)
+                  for start in range(0, 10, 3)]
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        assert sum(chunks, []) == suggestions
+
+    def test_get_suggestions_slice_of_a_large_grid(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {'feature{}'.format(i): {'range': [0, 100, 1]} for i in range(6)}
+        })
+        manager = GridSearchManager(hptuning_config=hptuning_config)
+        assert manager.get_num_grid_suggestions() == 100 ** 6
+        suggestions = manager.get_suggestions_slice(start=100 ** 6 - 2, stop=100 ** 6 + 10)
+        keys = list(hptuning_config.matrix.keys())
+        assert suggestions == [dict({key: 99 for key in keys}, **{keys[-1]: 98}),
+                               {key: 99 for key in keys}]
+
 
 @pytest.mark.experiment_groups_mark
 class TestRandomSearchManager(BaseTest):
@@ -192,6 +245,63 @@ class TestRandomSearchManager(BaseTest):
 
         assert sample_mock.call_count == 4
 
+    def test_get_random_suggestions_are_unique(self):
+        hptuning_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'linspace': [1, 2, 5]},
+                'feature3': {'range': [1, 5, 1]}
+            }
+        })
+        matrix = hptuning_config.matrix
+        # Near exhaustive requests are sampled without replacement
+        for n_suggestions in [20, 59, 60, 100]:
+            suggestions = get_random_suggestions(matrix=matrix,
+                                                 n_suggestions=n_suggestions,
+                                                 suggestion_params={'num_epochs': 1},
+                                                 seed=1)
+            assert len(suggestions) == min(n_suggestions, 60)
+            assert len({Suggestion(params=s) for s in suggestions}) == len(suggestions)
+            assert all(s['num_epochs'] == 1 for s in suggestions)
+
+        assert get_random_suggestions(matrix=matrix, n_suggestions=30, seed=1) == \
+            get_random_suggestions(matrix=matrix, n_suggestions=30, seed=1)
+
+    def test_get_random_suggestions_large_requests(self):
+        continuous_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'values': [1, 2, 3]},
+                'feature2': {'uniform': [0, 1]},
+                'feature3': {'qlognormal': [0, 0.5, 0.51]}
+            }
+        })
+        discrete_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {'feature{}'.format(i): {'range': [0, 100, 1]} for i in range(6)}
+        })
+        exhaustive_config = HPTuningConfig.from_dict({
+            'concurrency': 2,
+            'matrix': {
+                'feature1': {'range': [0, 100, 1]},
+                'feature2': {'range': [0, 100, 1]},
+                'feature3': {'range': [0, 10, 1]}
+            }
+        })
+        for name, hptuning_config in [('continuous', continuous_config),
+                                      ('discrete', discrete_config),
+                                      ('exhaustive', exhaustive_config)]:
+            for n_suggestions in [100, 1000]:
+                suggestions = get_random_suggestions(matrix=hptuning_config.matrix,
+                                                     n_suggestions=n_suggestions,
+                                                     seed=1)
+                assert len(suggestions) == n_suggestions, name
+                assert all(set(s.keys()) == set(hptuning_config.matrix.keys())
+                           for s in suggestions), name
+                if name != 'continuous':
+                    assert all(0 <= v < 100 for s in suggestions for v in s.values()), name
+
 
 @pytest.mark.experiment_groups_mark
 class TestHyperbandSearchManager(BaseTest):
@@ -1087,3 +1197,106 @@ class TestBOSearchManager(BaseTest):
         assert 0.001 <= suggestion['learning_rate'] <= 0.01
         assert suggestion['dropout'] in [0.25, 0.3]
         assert suggestion['activation'] in ['relu', 'sigmoid']
+
+    def test_optimizer_warm_starts_from_kernel_params(self):
+        configs = [
+            {'feature1': 1, 'feature2': 1, 'feature3': 1},
+            {'feature1': 2, 'feature2': 1.2, 'feature3': 2},
+            {'feature1': 3, 'feature2': 1.3, 'feature3': 3},
+            {'feature1': 2, 'feature2': 1.5, 'feature3': 4}
+        ]
+        metrics = [1, 2, 3, 4]
+        optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config)
+        assert optimizer.kernel_params is None
+        optimizer.add_observations(configs=configs, metrics=metrics)
+        optimizer.get_suggestion()
+        kernel_params = optimizer.kernel_params
+        assert set(kernel_params.keys()) == {'length_scale'}
+
+        optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config,
+                                kernel_params=kernel_params)
+        gaussian_process = optimizer.utility_function.gaussian_process
+        assert gaussian_process.kernel.length_scale == kernel_params['length_scale']
+        assert gaussian_process.n_restarts_optimizer == 0
+
+    def test_iteration_suggestions_keep_kernel_params(self):
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 1,
+            'num_suggestions': 1,
+            'old_experiment_ids': [1, 2, 3],
+            'old_experiments_configs': [[1, {'feature1': 1, 'feature2': 1, 'feature3': 1}],
+                                        [2, {'feature1': 2, 'feature2': 1.2, 'feature3': 2}],
+                                        [3, {'feature1': 3, 'feature2': 1.3, 'feature3': 3}]],
+            'old_experiments_metrics': [[1, 1], [2, 2], [3, 3]],
+            'experiment_ids': [],
+            'experiments_configs': [],
+            'experiments_metrics': [],
+            'kernel_params': {'length_scale': 2.}
+        })
+        assert iteration_config.kernel_params == {'length_scale': 2.}
+        assert iteration_config.to_dict()['kernel_params'] == {'length_scale': 2.}
+
+        assert self.manager1.kernel_params is None
+        suggestions = self.manager1.get_suggestions(iteration_config)
+        assert len(suggestions) == 1
+        assert self.manager1.kernel_params is not None
+
+    def test_iteration_suggestions_only_encode_the_new_experiments(self):
+        configs = [[1, {'feature1': 1, 'feature2': 1, 'feature3': 1}],
+                   [2, {'feature1': 2, 'feature2': 1.2, 'feature3': 2}],
+                   [3, {'feature1': 3, 'feature2': 1.3, 'feature3': 3}]]
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 1,
+            'num_suggestions': 1,
+            'old_experiment_ids': [1, 2],
+            'old_experiments_configs': configs[:2],
+            'old_experiments_metrics': [[1, 1], [2, 2]],
+            'experiment_ids': [],
+            'experiments_configs': [],
+            'experiments_metrics': [],
+        })
+        self.manager1.get_suggestions(iteration_config)
+        encoded_observations = self.manager1.encoded_observations
+        assert encoded_observations == [[1, [1, 1, 1]], [2, [2, 1.2, 2]]]
+
+        iteration_config = BOIterationConfig.from_dict({
+            'iteration': 2,
+            'num_suggestions': 1,
+            'old_experiment_ids': [1, 2, 3],
+            'old_experiments_configs': configs,
+            'old_experiments_metrics': [[1, 1], [2, 2], [3, 3]],
+            'experiment_ids': [],
+            'experiments_configs': [],
+            'experiments_metrics': [],
+            'encoded_observations': encoded_observations,
+        })
+        assert iteration_config.to_dict()['encoded_observations'] == encoded_observations
+        with patch.object(SearchSpace, 'encode_config',
+                          autospec=True,
+                          side_effect=SearchSpace.encode_config) as encode_config_mock:
+            self.manager1.get_suggestions(iteration_config)
+
+        assert encode_config_mock.call_count == 1
+        assert self.manager1.encoded_observations == encoded_observations + [[3, [3, 1.3, 3]]]
+
+    @pytest.mark.filterwarnings('ignore::UserWarning')
+    def test_warm_started_suggestions_across_observations(self):
+        random_generator = np.random.RandomState(1)
+        for n_observations in [10, 50]:
+            configs = [{'feature1': int(random_generator.randint(1, 4)),
+                        'feature2': float(random_generator.uniform(1, 2)),
+                        'feature3': int(random_generator.randint(1, 5))}
+                       for _ in range(n_observations)]
+            metrics = [c['feature1'] + c['feature2'] - c['feature3'] for c in configs]
+            kernel_params = None
+            for _ in range(2):
+                optimizer = BOOptimizer(hptuning_config=self.manager1.hptuning_config,
+                                        kernel_params=kernel_params)
+                optimizer.n_warmup = 1000
+                optimizer.n_iter = 10
+                optimizer.add_observations(configs=configs, metrics=metrics)
+                suggestion = optimizer.get_suggestion()
+                kernel_params = optimizer.kernel_params
+                assert 1 <= suggestion['feature1'] <= 3
+                assert 1 <= suggestion['feature2'] <= 2
+                assert 1 <= suggestion['feature3'] <= 5
@@ -1,5 +1,6 @@
 import os
 
+from datetime import timedelta
 from unittest.mock import patch
 
 import mock
@@ -21,6 +22,7 @@ from db.models.cloning_strategies import CloningStrategy
 from db.models.experiment_jobs import ExperimentJob
 from db.models.experiments import Experiment, ExperimentStatus
 from db.models.job_resources import JobResources
+from db.redis.statuses import RedisExperimentJobStatuses
 from dockerizer.tasks import build_experiment
 from factories.factory_experiment_groups import ExperimentGroupFactory
 from factories.factory_experiments import (
@@ -202,6 +204,22 @@ class TestExperimentModel(BaseTest):
         assert ExperimentStatus.objects.filter(experiment=experiment).count() == 1
         assert experiment.last_status == ExperimentLifeCycle.CREATED
 
+    def test_last_status_column_is_kept_in_sync(self):
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
+            experiment = ExperimentFactory()
+
+        experiment.set_status(ExperimentLifeCycle.SCHEDULED)
+        assert experiment.last_status == ExperimentLifeCycle.SCHEDULED
+        # The status can be filtered without joining the statuses table
+        queryset = Experiment.objects.filter(last_status=ExperimentLifeCycle.SCHEDULED)
+        assert 'db_experimentstatus' not in str(queryset.query)
+        assert list(queryset) == [experiment]
+
+        experiment.set_status(ExperimentLifeCycle.RUNNING)
+        experiment.refresh_from_db()
+        assert experiment.last_status == ExperimentLifeCycle.RUNNING
+        assert experiment.last_status == experiment.status.status
+
     def test_independent_experiment_creation_triggers_experiment_scheduling_mocks(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as mock_fct:
             with patch.object(Experiment, 'set_status') as mock_fct2:
@@ -346,6 +364,20 @@ class TestExperimentModel(BaseTest):
         assert delete_logs_path.call_count == 1
         assert mock_fct.call_count == 1
 
+    @patch('scheduler.tasks.storage.stores_schedule_logs_deletion.apply_async')
+    @patch('scheduler.tasks.storage.stores_schedule_outputs_deletion.apply_async')
+    def test_delete_experiment_clears_the_jobs_statuses_vector(self, _, __):
+        experiment = ExperimentFactory()
+        job = ExperimentJobFactory(experiment=experiment)
+        # Loads the vector
+        assert experiment.job_statuses == [(job.role, JobLifeCycle.CREATED)]
+        assert RedisExperimentJobStatuses.get_job_statuses(experiment.id) == [
+            (job.role, JobLifeCycle.CREATED)]
+
+        experiment_id = experiment.id
+        experiment.delete()
+        assert RedisExperimentJobStatuses.get_job_statuses(experiment_id) is None
+
     def test_set_metrics(self):
         config = ExperimentSpecification.read(experiment_spec_content)
         experiment = ExperimentFactory(config=config.parsed_data)
@@ -371,6 +403,29 @@ class TestExperimentModel(BaseTest):
 
         assert experiment.metrics.count() == 3
 
+    def test_set_metrics_many_uses_bulk_create(self):
+        config = ExperimentSpecification.read(experiment_spec_content)
+        experiment = ExperimentFactory(config=config.parsed_data)
+        assert experiment.metrics.count() == 0
+
+        data = [{
+            'created_at': timezone.now() - timedelta(seconds=10),
+            'values': {'accuracy': 0.8, 'loss': 0.5}
+        }, {
+            'created_at': timezone.now(),
+            'values': {'accuracy': 0.9}
+        }, {
+            'created_at': timezone.now() - timedelta(seconds=5),
+            'values': {'accuracy': 0.85, 'precision': 0.7}
+        }]
+        with patch('auditor.record') as auditor_record:
+            experiments_set_metrics(experiment_id=experiment.id, data=data)
+
+        assert auditor_record.call_count == 1
+        assert experiment.metrics.count() == 3
+        experiment.refresh_from_db()
+        assert experiment.last_metric == {'accuracy': 0.9, 'loss': 0.5, 'precision': 0.7}
+
     def test_master_success_influences_other_experiment_workers_status(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             # with patch.object(Experiment, 'set_status') as _:  # noqa
@@ -434,6 +489,33 @@ class TestExperimentModel(BaseTest):
         assert no_jobs_xp.last_status is None
         assert xp_with_jobs.last_status == ExperimentLifeCycle.RUNNING
 
+    def test_experiments_sync_jobs_statuses_only_checks_the_out_of_sync_experiments(self):
+        with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
+            experiment = ExperimentFactory()
+        with patch.object(Experiment, 'set_status') as _:  # noqa
+            job = ExperimentJobFactory(experiment=experiment)
+            ExperimentJobStatusFactory(job=job, status=JobLifeCycle.RUNNING)
+        ExperimentStatusFactory(experiment=experiment, status=ExperimentLifeCycle.RUNNING)
+
+        with patch('scheduler.tasks.experiments.'
+                   'experiments_check_status.apply_async') as check_status_mock:
+            experiments_sync_jobs_statuses()
+        assert check_status_mock.call_count == 0
+
+        # The job statuses are loaded, the status is calculated without queries
+        experiment.refresh_from_db()
+        with self.assertNumQueries(0):
+            assert experiment.calculated_status == ExperimentLifeCycle.RUNNING
+
+        with patch('scheduler.tasks.experiments.'
+                   'experiments_check_status.apply_async') as check_status_mock:
+            ExperimentJobStatusFactory(job=job, status=JobLifeCycle.SUCCEEDED)
+            experiments_sync_jobs_statuses()
+        # The job status' check and the sync's check
+        assert check_status_mock.call_count == 2
+        with self.assertNumQueries(0):
+            assert experiment.calculated_status == ExperimentLifeCycle.SUCCEEDED
+
     def test_copying_an_experiment(self):
         with patch('scheduler.tasks.experiments.experiments_build.apply_async') as _:  # noqa
             experiment1 = ExperimentFactory()
@@ -1,4 +1,5 @@
 # pylint:disable=too-many-lines
+import json
 import os
 import time
 
@@ -575,6 +576,61 @@ class TestProjectExperimentLastMetricListViewV1(BaseViewTest):
         assert resp.data['count'] == self.queryset.count()
         assert len(resp.data['results']) == self.queryset.count()
 
+    def test_get_cursor_pages(self):
+        Experiment.objects.bulk_create([
+            Experiment(project=self.project, user=self.auth_client.user)
+            for _ in range(20)
+        ])
+        queryset = self.queryset.order_by('-updated_at', '-id')
+        ids = []
+        url = self.url + '?cursor=&limit=10'
+        while url:
+            resp = self.auth_client.get(url)
+            assert resp.status_code == status.HTTP_200_OK
+            assert 'count' not in resp.data
+            assert len(resp.data['results']) <= 10
+            ids += [xp['id'] for xp in resp.data['results']]
+            url = resp.data['next']
+
+        assert ids == list(queryset.values_list('id', flat=True))
+
+        resp = self.auth_client.get(self.url + '?cursor=&metrics=true')
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.data['next'] is None
+        assert resp.data['results'] == self.metrics_serializer_class(queryset, many=True).data
+
+    def test_get_cursor_raises_for_invalid_cursor_or_ordering(self):
+        resp = self.auth_client.get(self.url + '?cursor=foo')
+        assert resp.status_code == status.HTTP_404_NOT_FOUND
+
+        resp = self.auth_client.get(self.url + '?cursor=&sort=created_at')
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_get_stream(self):
+        resp = self.auth_client.get(self.url + '?stream=true&metrics=true')
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.streaming
+        data = json.loads(b''.join(resp.streaming_content).decode('utf-8'))
+        assert data['results'] == self.metrics_serializer_class(self.queryset, many=True).data
+
+        resp = self.auth_client.get(self.url + '?stream=true&declarations=true')
+        assert resp.status_code == status.HTTP_200_OK
+        data = json.loads(b''.join(resp.streaming_content).decode('utf-8'))
+        assert data['results'] == self.declarations_serializer_class(
+            self.queryset, many=True).data
+
+        resp = self.auth_client.get(self.url + '?stream=true')
+        assert resp.status_code == status.HTTP_200_OK
+        data = json.loads(b''.join(resp.streaming_content).decode('utf-8'))
+        assert [xp['id'] for xp in data['results']] == [xp.id for xp in self.queryset]
+
+    def test_light_serializers_use_projections(self):
+        with patch.object(queries, 'experiments_metrics',
+                          wraps=queries.experiments_metrics) as projection_mock:
+            resp = self.auth_client.get(self.url + '?metrics=true')
+        assert resp.status_code == status.HTTP_200_OK
+        assert projection_mock.all.call_count == 1
+
 
 @pytest.mark.experiments_mark
 class TestExperimentGroupExperimentListViewV1(BaseViewTest):
@@ -0,0 +1,51 @@
+import os
+import tempfile
+
+import pytest
+
+from libs.archive import evict_archives, touch_archive
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestArchivesEviction(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.archive_root = tempfile.mkdtemp()
+
+    def create_archive(self, name, size, mtime):
+        archive_path = os.path.join(self.archive_root, name)
+        with open(archive_path, 'wb') as fp:
+            fp.write(b'0' * size)
+        os.utime(archive_path, (mtime, mtime))
+        return archive_path
+
+    def test_evict_least_recently_used_archives(self):
+        archive1 = self.create_archive('repo-1.tar.gz', size=10, mtime=1)
+        archive2 = self.create_archive('repo-2.tar.gz', size=10, mtime=2)
+        archive3 = self.create_archive('repo-3.tar.gz', size=10, mtime=3)
+        lock = self.create_archive('.lock-ab', size=0, mtime=0)
+
+        evict_archives(archive_root=self.archive_root, max_size=30)
+        assert all(os.path.exists(path) for path in [archive1, archive2, archive3])
+
+        evict_archives(archive_root=self.archive_root, max_size=20)
+        assert not os.path.exists(archive1)
+        assert os.path.exists(archive2)
+        assert os.path.exists(archive3)
+        assert os.path.exists(lock)
+
+    def test_evict_keeps_the_touched_and_the_new_archives(self):
+        archive1 = self.create_archive('repo-1.tar.gz', size=10, mtime=1)
+        archive2 = self.create_archive('repo-2.tar.gz', size=10, mtime=2)
+        archive3 = self.create_archive('repo-3.tar.gz', size=10, mtime=3)
+
+        assert touch_archive(archive1) is True
+        assert touch_archive(os.path.join(self.archive_root, 'repo-4.tar.gz')) is False
+
+        evict_archives(archive_root=self.archive_root, max_size=20, keep=archive2)
+        assert os.path.exists(archive1)
+        assert os.path.exists(archive2)
+        assert not os.path.exists(archive3)
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+
+from db.models.build_jobs import BuildJob
+from db.models.experiment_groups import ExperimentGroup
+from db.models.experiments import Experiment, ExperimentMetric, ExperimentStatus
+from db.models.jobs import Job, JobStatus
+from db.models.projects import Project
+from event_manager.events.experiment_group import EXPERIMENT_GROUP_DELETED
+from event_manager.events.project import PROJECT_DELETED
+from factories.factory_build_jobs import BuildJobFactory
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory, ExperimentMetricFactory
+from factories.factory_jobs import JobFactory
+from factories.factory_projects import ProjectFactory
+from libs.deletion import SubtreeDeletion, delete_experiment_group, delete_project
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestSubtreeDeletion(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.project = ProjectFactory()
+        self.group = ExperimentGroupFactory(project=self.project)
+        for experiment in [ExperimentFactory(project=self.project, experiment_group=self.group),
+                           ExperimentFactory(project=self.project, experiment_group=self.group),
+                           ExperimentFactory(project=self.project)]:
+            ExperimentMetricFactory(experiment=experiment)
+            ExperimentMetricFactory(experiment=experiment)
+        JobFactory(project=self.project)
+        BuildJobFactory(project=self.project)
+
+        # Another project that must not be touched
+        self.other_experiment = ExperimentFactory()
+        ExperimentMetricFactory(experiment=self.other_experiment)
+
+    def test_delete_project(self):
+        with patch('auditor.record') as auditor_record:
+            summary = delete_project(self.project, batch_size=1)
+
+        assert Project.all.filter(id=self.project.id).exists() is False
+        assert ExperimentGroup.all.count() == 0
+        assert list(Experiment.all.values_list('id', flat=True)) == [self.other_experiment.id]
+        assert ExperimentMetric.objects.count() == 1
+        assert ExperimentStatus.objects.exclude(experiment=self.other_experiment).count() == 0
+        assert Job.all.count() == 0
+        assert JobStatus.objects.count() == 0
+        assert BuildJob.all.count() == 0
+        assert summary['db.ExperimentMetric'] == 6
+        assert summary['db.Experiment'] == 3
+
+        # Only the project's deletion is audited
+        event_types = [call[1].get('event_type') for call in auditor_record.call_args_list]
+        assert event_types == [PROJECT_DELETED]
+
+    def test_delete_experiment_group(self):
+        with patch('auditor.record') as auditor_record:
+            delete_experiment_group(self.group, batch_size=1)
+
+        assert ExperimentGroup.all.count() == 0
+        assert Experiment.all.count() == 2
+        assert ExperimentMetric.objects.count() == 4
+
+        event_types = [call[1].get('event_type') for call in auditor_record.call_args_list]
+        assert event_types == [EXPERIMENT_GROUP_DELETED]
+
+    def test_interrupted_deletion_resumes(self):
+        with patch.object(SubtreeDeletion, '_delete_root', side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                delete_project(self.project, batch_size=1)
+
+        # The subtree is deleted but the root is kept to resume the deletion
+        assert Project.all.filter(id=self.project.id).exists() is True
+        assert Experiment.all.filter(project=self.project).count() == 0
+
+        delete_project(Project.all.get(id=self.project.id), batch_size=1)
+        assert Project.all.filter(id=self.project.id).exists() is False
@@ -0,0 +1,76 @@
+import io
+import os
+import tarfile
+import tempfile
+
+import pytest
+
+from libs.repos.upload import sync_repo_files
+from tests.utils import BaseTest
+
+
+@pytest.mark.libs_mark
+class TestSyncRepoFiles(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_path = tempfile.mkdtemp()
+        self.repo_path = os.path.join(self.tmp_path, 'repo')
+        os.makedirs(os.path.join(self.repo_path, '.git'))
+        with open(os.path.join(self.repo_path, '.git', 'HEAD'), 'w') as head:
+            head.write('ref: refs/heads/master')
+
+    def create_tar(self, files, mtime=1000):
+        tar_file_name = os.path.join(self.tmp_path, 'repo.tar.gz')
+        with tarfile.open(tar_file_name, 'w:gz') as tar:
+            for name, content in files.items():
+                member = tarfile.TarInfo(name)
+                member.size = len(content)
+                member.mtime = mtime
+                member.mode = 0o644
+                tar.addfile(member, io.BytesIO(content))
+        return tar_file_name
+
+    def get_files(self):
+        return sorted(os.path.relpath(os.path.join(root, file_name), self.repo_path)
+                      for root, _, files in os.walk(self.repo_path)
+                      for file_name in files)
+
+    def read(self, name):
+        with open(os.path.join(self.repo_path, name), 'rb') as f:
+            return f.read()
+
+    def test_sync_writes_only_the_changed_files(self):
+        files = {'a.py': b'a' * 100, 'd/b.py': b'b', 'c.py': b'c'}
+        summary = sync_repo_files(self.repo_path, self.create_tar(files))
+        assert summary == {'added': 3, 'modified': 0, 'deleted': 0}
+        assert self.get_files() == ['.git/HEAD', 'a.py', 'c.py', 'd/b.py']
+
+        summary = sync_repo_files(self.repo_path, self.create_tar(files))
+        assert summary == {'added': 0, 'modified': 0, 'deleted': 0}
+
+        # Same size and different content
+        files['a.py'] = b'a' * 99 + b'z'
+        summary = sync_repo_files(self.repo_path, self.create_tar(files, mtime=2000))
+        assert summary == {'added': 0, 'modified': 1, 'deleted': 0}
+        assert self.read('a.py') == b'a' * 99 + b'z'
+
+        # Same content and different mtime
+        summary = sync_repo_files(self.repo_path, self.create_tar(files, mtime=3000))
+        assert summary == {'added': 0, 'modified': 0, 'deleted': 0}
+
+    def test_sync_deletes_the_missing_files(self):
+        sync_repo_files(self.repo_path, self.create_tar({'a.py': b'a', 'd/e/b.py': b'b'}))
+        summary = sync_repo_files(self.repo_path, self.create_tar({'a.py': b'aa', 'f/c.py': b''}))
+        assert summary == {'added': 1, 'modified': 1, 'deleted': 1}
+        assert self.get_files() == ['.git/HEAD', 'a.py', 'f/c.py']
+        assert not os.path.exists(os.path.join(self.repo_path, 'd'))
+
+    def test_sync_skips_the_members_outside_the_working_tree(self):
+        files = {'a.py': b'a', '.git/HEAD': b'evil', '../b.py': b'b', './c.py': b'c'}
+        summary = sync_repo_files(self.repo_path, self.create_tar(files))
+        assert summary == {'added': 2, 'modified': 0, 'deleted': 0}
+        assert self.get_files() == ['.git/HEAD', 'a.py', 'c.py']
+        assert self.read('.git/HEAD') == b'ref: refs/heads/master'
+        assert not os.path.exists(os.path.join(self.tmp_path, 'b.py'))
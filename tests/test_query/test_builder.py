@@ -13,7 +13,15 @@ from factories.factory_experiments import (
     ExperimentMetricFactory,
     ExperimentStatusFactory
 )
-from query.builder import ComparisonCondition, DateTimeCondition, EqualityCondition, ValueCondition
+from query.builder import (
+    CallbackCondition,
+    ComparisonCondition,
+    DateTimeCondition,
+    EqualityCondition,
+    JSONComparisonCondition,
+    JSONValueCondition,
+    ValueCondition
+)
 from query.exceptions import QueryConditionException
 from tests.utils import BaseTest
 
@@ -513,3 +521,77 @@ class TestValueCondition(BaseTest):
                                   name='declarations__loss',
                                   params=['lll', 'ppp', 'foo', 'bar', 'moo'])
         assert queryset.count() == 0
+
+
+@pytest.mark.query_mark
+class TestJSONConditions(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_json_operators(self):
+        op = JSONComparisonCondition._eq_operator('last_metric__loss', 0.1)
+        assert op == Q(last_metric__contains={'loss': 0.1})
+        op = JSONComparisonCondition._neq_operator('last_metric__loss', 0.1)
+        assert op == ~Q(last_metric__contains={'loss': 0.1})
+        op = JSONComparisonCondition._lt_operator('last_metric__loss', 0.1)
+        assert op == Q(last_metric__loss__lt=0.1)
+
+        op = JSONValueCondition._in_operator('declarations__loss', ['foo', 'bar'])
+        assert op == Q(declarations__contains={'loss': 'foo'}) | Q(
+            declarations__contains={'loss': 'bar'})
+        op = JSONValueCondition._nin_operator('declarations__loss', ['foo', 'bar'])
+        assert op == ~(Q(declarations__contains={'loss': 'foo'}) | Q(
+            declarations__contains={'loss': 'bar'}))
+
+        assert (JSONComparisonCondition(op='=').operator ==
+                JSONComparisonCondition._eq_operator)
+        assert (JSONComparisonCondition(op='<=').operator ==
+                ComparisonCondition._lte_operator)
+        assert JSONValueCondition(op='|').operator == JSONValueCondition._in_operator
+
+    def test_json_apply(self):
+        ExperimentMetricFactory(values={'loss': 0.1, 'step': 1})
+        ExperimentMetricFactory(values={'loss': 0.3, 'step': 10})
+        ExperimentFactory(declarations={'rate': 1, 'loss': 'foo'})
+        ExperimentFactory(declarations={'rate': -1, 'loss': 'bar'})
+
+        eq_cond = JSONComparisonCondition(op='eq')
+        neq_cond = JSONComparisonCondition(op='eq', negation=True)
+        in_cond = JSONValueCondition(op='in')
+        nin_cond = JSONValueCondition(op='in', negation=True)
+
+        queryset = eq_cond.apply(queryset=Experiment.objects,
+                                 name='last_metric__loss',
+                                 params=0.1)
+        assert queryset.count() == 1
+
+        queryset = eq_cond.apply(queryset=Experiment.objects,
+                                 name='last_metric__step',
+                                 params=10)
+        assert queryset.count() == 1
+
+        queryset = neq_cond.apply(queryset=Experiment.objects,
+                                  name='declarations__rate',
+                                  params=1)
+        assert queryset.count() == 3
+
+        queryset = in_cond.apply(queryset=Experiment.objects,
+                                 name='declarations__loss',
+                                 params=['foo', 'bar', 'moo'])
+        assert queryset.count() == 2
+
+        queryset = nin_cond.apply(queryset=Experiment.objects,
+                                  name='declarations__loss',
+                                  params=['foo', 'moo'])
+        assert queryset.count() == 3
+
+
+@pytest.mark.query_mark
+class TestCallbackCondition(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_built_conditions_do_not_share_the_negation(self):
+        condition = CallbackCondition(lambda queryset, params, negation: negation)
+        negated_cond = condition(op='=', negation=True)
+        cond = condition(op='=', negation=False)
+        assert negated_cond.apply(queryset=None, name='field', params=None) is True
+        assert cond.apply(queryset=None, name='field', params=None) is False
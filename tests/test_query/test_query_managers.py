@@ -4,7 +4,9 @@ from flaky import flaky
 
 from django.db.models import Q
 
+from constants import content_types
 from db.models.experiments import Experiment
+from factories.factory_searches import SearchFactory
 from query.builder import (
     ArrayCondition,
     ComparisonCondition,
@@ -17,9 +19,11 @@ from query.managers.build import BuildQueryManager
 from query.managers.experiment import ExperimentQueryManager
 from query.managers.experiment_group import ExperimentGroupQueryManager
 from query.managers.job import JobQueryManager
-from query.parser import QueryOpSpec
+from query.parser import QueryOpSpec, tokenize_query
 from tests.utils import BaseTest
 
+# pylint:disable=protected-access
+
 
 @pytest.mark.query_mark
 class TestQueryManager(BaseTest):
@@ -179,10 +183,10 @@ class TestQueryManager(BaseTest):
             str(Experiment.objects.filter(
                 last_metric__loss__lte=0.8
             ).filter(
-                status__status__in=['starting', 'running']
+                last_status__in=['starting', 'running']
             ).query),
             str(Experiment.objects.filter(
-                status__status__in=['starting', 'running']
+                last_status__in=['starting', 'running']
             ).filter(
                 last_metric__loss__lte=0.8
             ).query)
@@ -204,3 +208,43 @@ class TestQueryManager(BaseTest):
             ).query)
         ]
         assert str(result_queryset.query) in queries
+
+    def test_plans_are_cached_by_manager_and_query(self):
+        plan = ExperimentQueryManager.get_plan(self.query2)
+        assert ExperimentQueryManager.get_plan(self.query2) is plan
+        assert plan == ExperimentQueryManager.compile(self.query2)
+        assert [key for key, _, _ in plan] == ['metric.loss', 'status']
+        assert [name for _, name, _ in plan] == ['last_metric__loss', 'last_status']
+
+        # Another manager has its own plan
+        assert JobQueryManager.get_plan('status:running') is not ExperimentQueryManager.get_plan(
+            'status:running')
+
+        # The invalid queries are not cached
+        for _ in range(2):
+            with self.assertRaises(QueryError):
+                ExperimentQueryManager.get_plan(self.query5)
+
+    def test_parsed_query_plans(self):
+        query = ('metric.loss:<=0.8, metric.accuracy:>0.9, status:starting|running, '
+                 'tags:~tag1|tag2, declarations.lr:0.1, started_at:2012-12-12..2042-12-12')
+        assert set(tokenize_query(query)) == {'metric.loss',
+                                              'metric.accuracy',
+                                              'status',
+                                              'tags',
+                                              'declarations.lr',
+                                              'started_at'}
+
+        plan = ExperimentQueryManager.get_plan(query)
+        assert ExperimentQueryManager.get_plan(query) is plan
+        assert plan == ExperimentQueryManager.compile(query)
+
+    def test_saved_searches_are_precompiled(self):
+        query_spec = 'status:running, metric.loss:<0.01'
+        SearchFactory(content_type=content_types.EXPERIMENT, query={'query': query_spec})
+        hits = ExperimentQueryManager._get_cached_plan.cache_info().hits
+        ExperimentQueryManager.get_plan(query_spec)
+        assert ExperimentQueryManager._get_cached_plan.cache_info().hits == hits + 1
+
+        # The invalid queries are saved
+        SearchFactory(content_type=content_types.EXPERIMENT, query={'query': 'foobar:1'})
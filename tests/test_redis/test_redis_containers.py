@@ -0,0 +1,55 @@
+import uuid
+
+import pytest
+
+from db.redis.containers import RedisJobContainers
+from factories.factory_experiments import ExperimentJobFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisJobContainers(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.jobs = [ExperimentJobFactory() for _ in range(3)]
+        self.container_ids = [uuid.uuid4().hex for _ in range(3)]
+        for container_id, job in zip(self.container_ids, self.jobs):
+            RedisJobContainers.monitor(container_id=container_id, job_uuid=job.uuid.hex)
+
+    def test_get_jobs(self):
+        assert RedisJobContainers.get_jobs([]) == {}
+        unknown_container_id = uuid.uuid4().hex
+        jobs = RedisJobContainers.get_jobs(self.container_ids + [unknown_container_id])
+        assert jobs == {
+            container_id: (job.uuid.hex, job.experiment.uuid.hex)
+            for container_id, job in zip(self.container_ids, self.jobs)
+        }
+        for container_id in self.container_ids:
+            assert jobs[container_id] == RedisJobContainers.get_job(container_id)
+
+    def test_remove_containers(self):
+        RedisJobContainers.remove_containers([])
+        assert set(RedisJobContainers.get_containers()) == set(self.container_ids)
+
+        RedisJobContainers.remove_containers(self.container_ids[:2])
+        assert RedisJobContainers.get_containers() == self.container_ids[2:]
+        assert list(RedisJobContainers.get_jobs(self.container_ids).keys()) == [
+            self.container_ids[2]]
+
+    def test_remove_job(self):
+        job_uuid = self.jobs[0].uuid.hex
+        RedisJobContainers.remove_job(job_uuid)
+        assert set(RedisJobContainers.get_containers()) == set(self.container_ids[1:])
+        assert RedisJobContainers.get_job(self.container_ids[0]) == (None, None)
+        assert RedisJobContainers.get_experiment_for_job(job_uuid) is None
+
+    def test_remove_jobs(self):
+        RedisJobContainers.remove_jobs([])
+        assert set(RedisJobContainers.get_containers()) == set(self.container_ids)
+
+        RedisJobContainers.remove_jobs([job.uuid.hex for job in self.jobs[:2]] + ['unknown'])
+        assert RedisJobContainers.get_containers() == self.container_ids[2:]
+        assert list(RedisJobContainers.get_jobs(self.container_ids).keys()) == [
+            self.container_ids[2]]
@@ -72,3 +72,21 @@ class TestRedisHeartBeat(BaseTest):
         RedisHeartBeat.build_ping(1)
         self.assertEqual(heartbeat.is_alive(), True)
         self.assertEqual(RedisHeartBeat.build_is_alive(1), True)
+
+    def test_redis_heartbeat_get_dead(self):
+        for i in range(1, 4):
+            RedisHeartBeat(experiment=i).clear()
+            RedisHeartBeat(job=i).clear()
+            RedisHeartBeat(build=i).clear()
+
+        self.assertEqual(RedisHeartBeat.get_dead_experiments([]), [])
+        self.assertEqual(RedisHeartBeat.get_dead_experiments([1, 2, 3]), [1, 2, 3])
+        RedisHeartBeat.experiment_ping(2)
+        self.assertEqual(RedisHeartBeat.get_dead_experiments([1, 2, 3]), [1, 3])
+
+        RedisHeartBeat.job_ping(1)
+        RedisHeartBeat.job_ping(3)
+        self.assertEqual(RedisHeartBeat.get_dead_jobs([1, 2, 3]), [2])
+
+        RedisHeartBeat.build_ping(1)
+        self.assertEqual(RedisHeartBeat.get_dead_builds([1, 2, 3]), [2, 3])
@@ -0,0 +1,99 @@
+import pytest
+
+from mock import patch
+
+from db.getters.experiments import get_cached_experiment_ref
+from db.getters.projects import get_cached_project
+from db.getters.tokens import get_cached_token
+from db.models.tokens import Token
+from db.redis.lookups import RedisLookups
+from factories.factory_experiment_groups import ExperimentGroupFactory
+from factories.factory_experiments import ExperimentFactory
+from factories.factory_projects import ProjectFactory
+from factories.factory_users import UserFactory
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisLookups(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_lookups_are_invalidated_by_ref(self):
+        RedisLookups.set(kind=RedisLookups.PROJECTS, lookup='owner.name', ref=1, value={'id': 1})
+        RedisLookups.set(kind=RedisLookups.PROJECTS, lookup='owner.other', ref=1, value={'id': 1})
+        RedisLookups.set(kind=RedisLookups.PROJECTS, lookup='owner.foo', ref=2, value={'id': 2})
+        assert RedisLookups.get(kind=RedisLookups.PROJECTS, lookup='owner.name') == {'id': 1}
+
+        RedisLookups.invalidate(kind=RedisLookups.PROJECTS, ref=1)
+        assert RedisLookups.get(kind=RedisLookups.PROJECTS, lookup='owner.name') is None
+        assert RedisLookups.get(kind=RedisLookups.PROJECTS, lookup='owner.other') is None
+        assert RedisLookups.get(kind=RedisLookups.PROJECTS, lookup='owner.foo') == {'id': 2}
+
+        hit_rates = RedisLookups.get_hit_rates()
+        assert hit_rates[RedisLookups.PROJECTS] == {'requests': 4, 'misses': 2, 'hit_rate': 0.5}
+        assert hit_rates[RedisLookups.TOKENS] == {'requests': 0, 'misses': 0, 'hit_rate': None}
+
+    def test_cached_token_is_invalidated_on_refresh(self):
+        user = UserFactory()
+        token = Token.objects.get(user=user)
+        key = token.key
+        assert get_cached_token(key=key).user == user
+        assert get_cached_token(key=key).user == user
+        assert RedisLookups.get_hit_rates()[RedisLookups.TOKENS]['misses'] == 1
+
+        token.refresh()
+        assert get_cached_token(key=key) is None
+        assert get_cached_token(key=token.key).user == user
+
+    def test_cached_project_is_invalidated_on_rename(self):
+        project = ProjectFactory()
+        owner_name = project.owner.name
+        name = project.name
+        assert get_cached_project(owner_name=owner_name, project_name=name).id == project.id
+
+        project.name = 'new-name'
+        project.save()
+        assert get_cached_project(owner_name=owner_name, project_name=name) is None
+        assert get_cached_project(owner_name=owner_name,
+                                  project_name='new-name').id == project.id
+
+    def test_cached_experiment_ref_is_resolved_in_its_project(self):
+        experiment = ExperimentFactory()
+        project = experiment.project
+        experiment_ref = get_cached_experiment_ref(project=project, experiment_id=experiment.id)
+        assert experiment_ref.id == experiment.id
+        assert experiment_ref.project == project
+        assert get_cached_experiment_ref(project=ProjectFactory(),
+                                         experiment_id=experiment.id) is None
+
+        experiment.delete()
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id) is None
+
+    def test_cached_experiment_ref_is_kept_on_updates(self):
+        experiment = ExperimentFactory()
+        project = experiment.project
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id)
+
+        experiment.last_metric = {'loss': 0.1}
+        experiment.save(update_fields=['last_metric'])
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id)
+        assert RedisLookups.get_hit_rates()[RedisLookups.EXPERIMENTS]['misses'] == 1
+
+    def test_cached_experiment_ref_is_invalidated_on_archive(self):
+        experiment = ExperimentFactory()
+        project = experiment.project
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id)
+
+        experiment.archive()
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id) is None
+
+    def test_cached_experiment_ref_is_invalidated_on_group_archive(self):
+        with patch('hpsearch.tasks.grid.hp_grid_search_start.apply_async'):
+            experiment_group = ExperimentGroupFactory()
+        experiment = ExperimentFactory(experiment_group=experiment_group,
+                                       project=experiment_group.project)
+        project = experiment.project
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id)
+
+        experiment_group.archive()
+        assert get_cached_experiment_ref(project=project, experiment_id=experiment.id) is None
@@ -0,0 +1,87 @@
+import uuid
+
+from contextlib import contextmanager
+
+import pytest
+
+from mock import patch
+from redis.connection import Connection
+
+from db.redis.containers import RedisJobContainers
+from db.redis.to_stream import RedisToStream
+from tests.utils import BaseTest
+
+
+@contextmanager
+def count_round_trips():
+    """Count the commands, or the pipelines, sent to redis."""
+    round_trips = []
+    send_packed_command = Connection.send_packed_command
+
+    def send(connection, command):
+        round_trips.append(command)
+        return send_packed_command(connection, command)
+
+    with patch.object(Connection, 'send_packed_command', autospec=True, side_effect=send):
+        yield round_trips
+
+
+@pytest.mark.redis_mark
+class TestRedisRoundTrips(BaseTest):
+    """Micro-benchmark of the redis round trips for an experiment with 32 jobs."""
+    DISABLE_RUNNER = True
+    NUM_JOBS = 32
+
+    def setUp(self):
+        super().setUp()
+        self.experiment_uuid = uuid.uuid4().hex
+        self.jobs = [{'uuid': uuid.uuid4().hex, 'name': 'worker.{}'.format(i)}
+                     for i in range(self.NUM_JOBS)]
+        self.container_ids = [uuid.uuid4().hex for _ in range(self.NUM_JOBS)]
+
+        # Register the containers as `RedisJobContainers.monitor` does without the db lookups
+        red = RedisJobContainers.connection()
+        for container_id, job in zip(self.container_ids, self.jobs):
+            red.sadd(RedisJobContainers.KEY_CONTAINERS, container_id)
+            red.hset(RedisJobContainers.KEY_CONTAINERS_TO_JOBS, container_id, job['uuid'])
+            red.sadd(RedisJobContainers.KEY_JOBS_TO_CONTAINERS.format(job['uuid']), container_id)
+            red.hset(RedisJobContainers.KEY_JOBS_TO_EXPERIMENTS, job['uuid'], self.experiment_uuid)
+        RedisToStream.monitor_experiment_resources(self.experiment_uuid)
+        RedisToStream.set_latest_jobs_resources({
+            job['uuid']: {'job_uuid': job['uuid'], 'cpu_percentage': 10} for job in self.jobs
+        })
+
+    def test_get_latest_experiment_resources(self):
+        with count_round_trips() as round_trips:
+            for job in self.jobs:
+                RedisToStream.get_latest_job_resources(job=job['uuid'], job_name=job['name'])
+        assert len(round_trips) == self.NUM_JOBS
+
+        with count_round_trips() as round_trips:
+            resources = RedisToStream.get_latest_experiment_resources(self.jobs, as_json=True)
+        assert len(resources) == self.NUM_JOBS
+        assert len(round_trips) == 1
+
+    def test_monitor_lookups(self):
+        with count_round_trips() as round_trips:
+            for container_id in self.container_ids:
+                job_uuid, experiment_uuid = RedisJobContainers.get_job(container_id)
+                assert (RedisToStream.is_monitored_job_resources(job_uuid) or
+                        RedisToStream.is_monitored_experiment_resources(experiment_uuid))
+        assert len(round_trips) >= 4 * self.NUM_JOBS
+
+        with count_round_trips() as round_trips:
+            jobs = RedisJobContainers.get_jobs(self.container_ids)
+            monitored_jobs = RedisToStream.get_monitored_jobs_resources(list(jobs.values()))
+            RedisToStream.set_latest_jobs_resources({
+                job_uuid: {'job_uuid': job_uuid} for job_uuid in monitored_jobs
+            })
+        assert len(monitored_jobs) == self.NUM_JOBS
+        assert len(round_trips) == 4
+
+    def test_remove_jobs(self):
+        with count_round_trips() as round_trips:
+            RedisJobContainers.remove_jobs([job['uuid'] for job in self.jobs])
+        assert RedisJobContainers.get_containers() == []
+        # WATCH, SUNION, the MULTI/EXEC pipeline and UNWATCH
+        assert len(round_trips) <= 4
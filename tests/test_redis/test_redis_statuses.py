@@ -0,0 +1,48 @@
+import pytest
+
+from constants.jobs import JobLifeCycle
+from db.redis.statuses import RedisExperimentJobStatuses
+from schemas.tasks import TaskType
+from tests.utils import BaseTest
+
+
+@pytest.mark.redis_mark
+class TestRedisExperimentJobStatuses(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_job_statuses_are_only_used_once_loaded(self):
+        RedisExperimentJobStatuses.set_job_status(experiment_id=1,
+                                                  job_id=1,
+                                                  role=TaskType.MASTER,
+                                                  status=JobLifeCycle.RUNNING)
+        assert RedisExperimentJobStatuses.get_job_statuses(1) is None
+
+        # The loading does not overwrite the statuses written in the meantime
+        RedisExperimentJobStatuses.load({1: [(1, TaskType.MASTER, JobLifeCycle.CREATED),
+                                             (2, TaskType.WORKER, None)]})
+        assert sorted(RedisExperimentJobStatuses.get_job_statuses(1)) == [
+            (TaskType.MASTER, JobLifeCycle.RUNNING),
+            (TaskType.WORKER, None)]
+
+        RedisExperimentJobStatuses.set_job_status(experiment_id=1,
+                                                  job_id=2,
+                                                  role=TaskType.WORKER,
+                                                  status=JobLifeCycle.SUCCEEDED)
+        assert sorted(RedisExperimentJobStatuses.get_job_statuses(1)) == [
+            (TaskType.MASTER, JobLifeCycle.RUNNING),
+            (TaskType.WORKER, JobLifeCycle.SUCCEEDED)]
+
+        RedisExperimentJobStatuses.clear(1)
+        assert RedisExperimentJobStatuses.get_job_statuses(1) is None
+
+    def test_get_experiments_job_statuses(self):
+        RedisExperimentJobStatuses.load({
+            1: [(1, TaskType.MASTER, JobLifeCycle.RUNNING)],
+            2: [],
+        })
+        assert RedisExperimentJobStatuses.get_experiments_job_statuses([1, 2, 3]) == {
+            1: [(TaskType.MASTER, JobLifeCycle.RUNNING)],
+            2: [],
+            3: None,
+        }
+        assert RedisExperimentJobStatuses.get_experiments_job_statuses([]) == {}
@@ -105,3 +105,62 @@ class TestRedisToStream(BaseTest):
         assert RedisToStream.is_monitored_experiment_logs(experiment_uuid) is True
         RedisToStream.remove_experiment_logs(experiment_uuid)
         assert RedisToStream.is_monitored_experiment_logs(experiment_uuid) is False
+
+    def test_get_monitored_jobs_resources(self):
+        job_uuid1 = uuid.uuid4().hex
+        job_uuid2 = uuid.uuid4().hex
+        job_uuid3 = uuid.uuid4().hex
+        experiment_uuid = uuid.uuid4().hex
+        assert RedisToStream.get_monitored_jobs_resources([]) == set([])
+        assert RedisToStream.get_monitored_jobs_resources([
+            (job_uuid1, None), (job_uuid2, experiment_uuid), (job_uuid3, None)
+        ]) == set([])
+
+        RedisToStream.monitor_job_resources(job_uuid1)
+        RedisToStream.monitor_experiment_resources(experiment_uuid)
+        assert RedisToStream.get_monitored_jobs_resources([
+            (job_uuid1, None), (job_uuid2, experiment_uuid), (job_uuid3, None)
+        ]) == {job_uuid1, job_uuid2}
+
+    def test_set_latest_jobs_resources(self):
+        job_uuid1 = uuid.uuid4().hex
+        job_uuid2 = uuid.uuid4().hex
+        RedisToStream.set_latest_jobs_resources({})
+        RedisToStream.set_latest_jobs_resources({
+            job_uuid1: {'job_uuid': job_uuid1, 'cpu_percentage': 10},
+            job_uuid2: {'job_uuid': job_uuid2, 'cpu_percentage': 20},
+        })
+        assert RedisToStream.get_latest_job_resources(job_uuid1, 'job1', as_json=True) == {
+            'job_uuid': job_uuid1, 'job_name': 'job1', 'cpu_percentage': 10
+        }
+        assert RedisToStream.get_latest_job_resources(job_uuid2, 'job2', as_json=True) == {
+            'job_uuid': job_uuid2, 'job_name': 'job2', 'cpu_percentage': 20
+        }
+
+    def test_is_monitored_job_or_experiment(self):
+        job_uuid = uuid.uuid4().hex
+        experiment_uuid = uuid.uuid4().hex
+        assert RedisToStream.is_monitored_job_or_experiment_resources(
+            job_uuid, experiment_uuid) is False
+        assert RedisToStream.is_monitored_job_or_experiment_logs(job_uuid, None) is False
+
+        RedisToStream.monitor_experiment_resources(experiment_uuid)
+        RedisToStream.monitor_job_logs(job_uuid)
+        assert RedisToStream.is_monitored_job_or_experiment_resources(
+            job_uuid, experiment_uuid) is True
+        assert RedisToStream.is_monitored_job_or_experiment_resources(job_uuid, None) is False
+        assert RedisToStream.is_monitored_job_or_experiment_logs(job_uuid, None) is True
+
+    def test_get_latest_experiment_resources(self):
+        jobs = [{'uuid': uuid.uuid4().hex, 'name': 'master.{}'.format(i)} for i in range(3)]
+        assert RedisToStream.get_latest_experiment_resources([], as_json=True) == []
+        assert RedisToStream.get_latest_experiment_resources(jobs, as_json=True) == []
+
+        RedisToStream.set_latest_jobs_resources({
+            jobs[0]['uuid']: {'job_uuid': jobs[0]['uuid'], 'cpu_percentage': 10},
+            jobs[2]['uuid']: {'job_uuid': jobs[2]['uuid'], 'cpu_percentage': 20},
+        })
+        assert RedisToStream.get_latest_experiment_resources(jobs, as_json=True) == [
+            {'job_uuid': jobs[0]['uuid'], 'job_name': 'master.0', 'cpu_percentage': 10},
+            {'job_uuid': jobs[2]['uuid'], 'job_name': 'master.2', 'cpu_percentage': 20},
+        ]
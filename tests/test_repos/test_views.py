@@ -278,6 +278,43 @@ class TestUploadFilesView(BaseViewTest):
         # Log old user, otherwise other tests will crash
         self.auth_client.login_user(user)
 
+    def test_handle_new_files_task_incremental(self):
+        user = self.auth_client.user
+        code_file_path = '{}/{}/{}/{}'.format(
+            conf.get('REPOS_MOUNT_PATH'), user.username, self.project.name, self.project.name)
+
+        def upload(filename):
+            response = self.auth_client.put(
+                self.url,
+                data={'repo': self.get_upload_file(filename),
+                      'json': json.dumps({'incremental': True})},
+                content_type=MULTIPART_CONTENT)
+            assert response.status_code == status.HTTP_200_OK
+            return response.data
+
+        assert upload('repo') == {'added': 2, 'modified': 0, 'deleted': 0}
+        commit_hash, commit = git.get_last_commit(code_file_path)
+        assert commit.author.email == user.email
+        assert sorted(os.listdir(code_file_path)) == ['.git', 'f1', 'f2']
+
+        # Uploading the same files does not create a new commit
+        assert upload('repo') == {'added': 0, 'modified': 0, 'deleted': 0}
+        assert git.get_last_commit(code_file_path)[0] == commit_hash
+
+        # f1 updated, f2 deleted and f3 added
+        assert upload('updated_repo') == {'added': 1, 'modified': 1, 'deleted': 1}
+        commit_hash, _ = git.get_last_commit(code_file_path)
+        assert len(git.get_committed_files(code_file_path, commit_hash)) == 3
+        assert sorted(os.listdir(code_file_path)) == ['.git', 'f1', 'f3']
+
+        # f1 updated, f3 deleted and a folder with 1 file added
+        assert upload('repo_with_folder') == {'added': 1, 'modified': 1, 'deleted': 1}
+        commit_hash, _ = git.get_last_commit(code_file_path)
+        assert len(git.get_committed_files(code_file_path, commit_hash)) == 3
+        assert sorted(os.listdir(code_file_path)) == ['.git', 'f1', 'f_folder']
+        with open(os.path.join(code_file_path, 'f1')) as f1:
+            assert len(f1.read()) == 4
+
     def test_cannot_upload_if_project_has_a_running_notebook(self):
         user = self.auth_client.user
         repo_name = self.project.name
@@ -351,9 +388,12 @@ class DownloadRepoViewTest(BaseViewTest):
         response = self.auth_client.get(self.download_url)
         self.assertEqual(response.status_code, 200)
         self.assertTrue(ProtectedView.NGINX_REDIRECT_HEADER in response)
+        commit_hash, _ = git.get_last_commit(code_file_path)
         self.assertEqual(
             response[ProtectedView.NGINX_REDIRECT_HEADER],
-            '{}/{}-master.tar.gz'.format(conf.get('REPOS_ARCHIVE_ROOT'), self.project.name))
+            '{}/{}-{}.tar.gz'.format(conf.get('REPOS_ARCHIVE_ROOT'),
+                                     self.project.name,
+                                     commit_hash))
 
     def test_redirects_nginx_to_file_works_with_internal_client(self):
         self.upload_file()
@@ -369,6 +409,32 @@ class DownloadRepoViewTest(BaseViewTest):
         response = self.internal_client.get(self.download_url)
         self.assertEqual(response.status_code, 200)
         self.assertTrue(ProtectedView.NGINX_REDIRECT_HEADER in response)
+        commit_hash, _ = git.get_last_commit(code_file_path)
         self.assertEqual(
             response[ProtectedView.NGINX_REDIRECT_HEADER],
-            '{}/{}-master.tar.gz'.format(conf.get('REPOS_ARCHIVE_ROOT'), self.project.name))
+            '{}/{}-{}.tar.gz'.format(conf.get('REPOS_ARCHIVE_ROOT'),
+                                     self.project.name,
+                                     commit_hash))
+
+    def test_archives_are_cached_by_commit(self):
+        self.upload_file()
+        user = self.auth_client.user
+        code_file_path = '{}/{}/{}/{}'.format(
+            conf.get('REPOS_MOUNT_PATH'), user.username, self.project.name, self.project.name)
+        commit_hash, _ = git.get_last_commit(code_file_path)
+        archive_path = '{}/{}-{}.tar.gz'.format(conf.get('REPOS_ARCHIVE_ROOT'),
+                                                self.project.name,
+                                                commit_hash)
+
+        response = self.auth_client.get(self.download_url)
+        assert response.status_code == status.HTTP_200_OK
+        assert os.path.exists(archive_path)
+
+        with patch('git.repo.base.Repo.archive') as archive_mock:
+            response = self.internal_client.get(self.download_url)
+            assert response.status_code == status.HTTP_200_OK
+            response = self.auth_client.get(self.download_url + '?commit={}'.format(commit_hash))
+            assert response.status_code == status.HTTP_200_OK
+
+        assert archive_mock.call_count == 0
+        assert response[ProtectedView.NGINX_REDIRECT_HEADER] == archive_path
@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+import pytest
+
+import stats
+
+from constants.experiments import ExperimentLifeCycle
+from factories.factory_experiments import ExperimentFactory
+from stats.memory import MemoryStatsBackend
+from stats.noop import NoOpStatsBackend
+from streams.socket_manager import SocketManager
+from tests.utils import BaseTest
+
+
+@pytest.mark.stats_mark
+class TestStatsBackends(BaseTest):
+    DISABLE_RUNNER = True
+
+    def test_memory_backend_records_the_metrics(self):
+        backend = MemoryStatsBackend(prefix='polyaxon')
+        backend.incr('tasks')
+        backend.incr('tasks', 2)
+        backend.gauge('sockets', 3)
+        backend.histogram('suggestions', 5)
+        backend.timing('set_status', 10)
+
+        assert backend.counters == {'polyaxon.tasks': 3}
+        assert backend.gauges == {'polyaxon.sockets': 3}
+        assert backend.histograms == {'polyaxon.suggestions': [5]}
+        assert backend.timings == {'polyaxon.set_status': [10]}
+
+    def test_timers_record_failed_calls(self):
+        backend = MemoryStatsBackend(prefix='')
+
+        @backend.timed('decorated')
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            fail()
+        with backend.timer('block'):
+            pass
+
+        assert len(backend.timings['decorated']) == 1
+        assert len(backend.timings['block']) == 1
+        assert backend.timings['block'][0] >= 0
+
+    def test_buffered_metrics_are_emitted_on_flush(self):
+        backend = MemoryStatsBackend(prefix='', buffer_size=10, flush_interval=60)
+        backend.incr('tasks')
+        backend.gauge('sockets', 1)
+        assert backend.counters == {}
+        assert backend.gauges == {}
+
+        backend.flush()
+        assert backend.counters == {'tasks': 1}
+        assert backend.gauges == {'sockets': 1}
+
+    def test_noop_backend_does_not_wrap_functions(self):
+        backend = NoOpStatsBackend()
+
+        def f():
+            return 1
+
+        assert backend.timed('f')(f) is f
+        with backend.timer('block'):
+            backend.incr('tasks')
+
+
+@pytest.mark.stats_mark
+class TestStatsInstrumentation(BaseTest):
+    DISABLE_RUNNER = True
+
+    def setUp(self):
+        super().setUp()
+        self.backend = MemoryStatsBackend(prefix='')
+        patcher = patch.object(stats.backend, '_wrapped', self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_set_status_is_timed(self):
+        experiment = ExperimentFactory()
+        self.backend.reset()
+        experiment.set_status(ExperimentLifeCycle.SCHEDULED)
+        assert len(self.backend.timings['db.experiment.set_status']) == 1
+
+    def test_sockets_are_counted(self):
+        count = SocketManager.sockets_count
+        manager = SocketManager()
+        ws1, ws2 = object(), object()
+        manager.add_socket(ws1)
+        manager.add_socket(ws1)
+        manager.add_socket(ws2)
+        assert self.backend.gauges['streams.sockets'] == count + 2
+
+        manager.remove_sockets({ws1, object()})
+        assert self.backend.gauges['streams.sockets'] == count + 1
+        manager.remove_sockets(ws2)
+        assert SocketManager.sockets_count == count
@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+from streams.log_frames import LogFrames, LogLinesReader
+from streams.socket_manager import SlowConsumerPolicies, SocketManager
+
+
+class FakeStream(object):
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    async def readany(self):
+        return self.chunks.pop(0) if self.chunks else b''
+
+
+class FakeSocket(object):
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.messages = []
+        self.closed = False
+
+    async def send(self, message):
+        await asyncio.sleep(self.delay)
+        self.messages.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.streams_mark
+class TestLogFrames(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.ws_managers = []
+
+    def tearDown(self):
+        # Cancel the pending senders
+        for ws_manager in self.ws_managers:
+            ws_manager.remove_sockets(set(ws_manager.ws))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    def get_ws_manager(self, **kwargs):
+        ws_manager = SocketManager(**kwargs)
+        self.ws_managers.append(ws_manager)
+        return ws_manager
+
+    def test_reader_drains_the_available_lines(self):
+        reader = LogLinesReader(FakeStream([b'line1\nline2\nli', b'ne3\n', b'line4']))
+        assert self.loop.run_until_complete(reader.read()) == [b'line1', b'line2']
+        assert self.loop.run_until_complete(reader.read()) == [b'line3']
+        assert self.loop.run_until_complete(reader.read()) == []
+        assert self.loop.run_until_complete(reader.read()) == [b'line4']
+        assert self.loop.run_until_complete(reader.read()) is None
+
+    def test_frames_are_flushed_by_size(self):
+        ws_manager = MagicMock()
+        log_frames = LogFrames(ws_manager=ws_manager, max_size=10)
+        log_frames.add('12345')
+        assert ws_manager.publish.call_count == 0
+        log_frames.add('67890')
+        assert ws_manager.publish.call_count == 1
+        assert json.loads(ws_manager.publish.call_args[0][0]) == {'log_lines': '12345\n67890'}
+
+        log_frames.add('last')
+        log_frames.stop()
+        assert ws_manager.publish.call_count == 2
+
+    def test_frames_are_flushed_by_time(self):
+        ws_manager = MagicMock()
+        log_frames = LogFrames(ws_manager=ws_manager, max_delay=0.01)
+        log_frames.start()
+        for i in range(1000):
+            log_frames.add('line{}'.format(i))
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        log_frames.stop()
+        assert ws_manager.publish.call_count == 1
+        lines = json.loads(ws_manager.publish.call_args[0][0])['log_lines'].split('\n')
+        assert len(lines) == 1000
+
+    def test_publish_to_sockets_concurrently(self):
+        ws_manager = self.get_ws_manager()
+        sockets = [FakeSocket(delay=0.05) for _ in range(20)]
+        for ws in sockets:
+            ws_manager.add_socket(ws)
+        ws_manager.publish('frame')
+        # The sends are not sequential
+        self.loop.run_until_complete(asyncio.sleep(0.2))
+        assert all(ws.messages == ['frame'] for ws in sockets)
+
+    def test_slow_socket_drops_the_oldest_frames(self):
+        ws_manager = self.get_ws_manager(queue_size=2)
+        slow_ws = FakeSocket(delay=1)
+        ws_manager.add_socket(slow_ws)
+        for i in range(5):
+            ws_manager.publish('frame{}'.format(i))
+        assert list(ws_manager._queues[slow_ws]._queue) == ['frame3', 'frame4']
+        assert slow_ws in ws_manager.ws
+
+    def test_slow_socket_is_closed(self):
+        ws_manager = self.get_ws_manager(queue_size=2, policy=SlowConsumerPolicies.CLOSE)
+        slow_ws = FakeSocket(delay=1)
+        ws = FakeSocket()
+        ws_manager.add_socket(slow_ws)
+        ws_manager.add_socket(ws)
+        # The first frame is being sent, the 2 next ones are pending
+        for i in range(4):
+            ws_manager.publish('frame{}'.format(i))
+            self.loop.run_until_complete(asyncio.sleep(0))
+        assert ws_manager.ws == {ws}
+        assert slow_ws.closed is True
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        assert ws.messages == ['frame0', 'frame1', 'frame2', 'frame3']
+
+    def test_failing_socket_is_removed(self):
+        ws_manager = self.get_ws_manager()
+        failing_ws = FakeSocket()
+        failing_ws.send = MagicMock(side_effect=RuntimeError)
+        ws = FakeSocket()
+        ws_manager.add_socket(failing_ws)
+        ws_manager.add_socket(ws)
+        ws_manager.publish('frame')
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        assert ws_manager.ws == {ws}
+        assert failing_ws not in ws_manager._queues
+        assert ws.messages == ['frame']
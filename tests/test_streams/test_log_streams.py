@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import pytest
+
+from streams.log_frames import LogFrames
+from streams.log_streams import PodLogStreams
+
+
+class FakeContent(object):
+    def __init__(self):
+        self.chunks = asyncio.Queue()
+
+    async def readany(self):
+        return await self.chunks.get()
+
+
+class FakeK8SApi(object):
+    def __init__(self):
+        self.responses = []
+
+    async def read_namespaced_pod_log(self, pod_id, namespace, **kwargs):
+        response = MagicMock(content=FakeContent())
+        self.responses.append(response)
+        return response
+
+
+@pytest.mark.streams_mark
+class TestPodLogStreams(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.k8s_api = FakeK8SApi()
+        self.log_streams = PodLogStreams()
+
+    def tearDown(self):
+        self.log_streams.stop()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    def run_loop(self):
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+    def subscribe(self, pod_id='pod', task_type=None, task_idx=None):
+        ws_manager = MagicMock()
+        log_frames = LogFrames(ws_manager=ws_manager, max_size=1)
+        stream = self.log_streams.subscribe(k8s_api=self.k8s_api,
+                                            log_frames=log_frames,
+                                            pod_id=pod_id,
+                                            container='container',
+                                            namespace='namespace',
+                                            task_type=task_type,
+                                            task_idx=task_idx)
+        return stream, log_frames, ws_manager
+
+    @staticmethod
+    def get_lines(ws_manager):
+        return [json.loads(call[0][0])['log_lines'] for call in ws_manager.publish.call_args_list]
+
+    def test_one_upstream_per_pod_container(self):
+        stream1, _, ws_manager1 = self.subscribe()
+        stream2, _, ws_manager2 = self.subscribe()
+        stream3, _, _ = self.subscribe(pod_id='other_pod')
+        self.run_loop()
+        assert stream1 is stream2
+        assert stream1 is not stream3
+        assert len(self.k8s_api.responses) == 2
+
+        self.k8s_api.responses[0].content.chunks.put_nowait(b'line1\nline2\n')
+        self.run_loop()
+        lines1 = self.get_lines(ws_manager1)
+        assert len(lines1) == 2
+        assert lines1 == self.get_lines(ws_manager2)
+
+    def test_lines_are_formatted_per_subscriber(self):
+        stream, _, job_ws_manager = self.subscribe()
+        task_stream, _, task_ws_manager = self.subscribe(task_type='worker', task_idx=0)
+        self.run_loop()
+        assert task_stream is stream
+        assert len(self.k8s_api.responses) == 1
+
+        self.k8s_api.responses[0].content.chunks.put_nowait(b'line1\n')
+        self.run_loop()
+        _, _, late_task_ws_manager = self.subscribe(task_type='worker', task_idx=0)
+        job_lines = self.get_lines(job_ws_manager)
+        task_lines = self.get_lines(task_ws_manager)
+        assert len(job_lines) == len(task_lines) == 1
+        assert ' worker.1 -- line1' not in job_lines[0]
+        assert job_lines[0].endswith(' -- line1')
+        assert task_lines[0].endswith(' worker.1 -- line1')
+        assert self.get_lines(late_task_ws_manager) == task_lines
+
+    def test_late_subscribers_get_the_recent_lines(self):
+        stream, _, _ = self.subscribe()
+        self.run_loop()
+        self.k8s_api.responses[0].content.chunks.put_nowait(b'line1\nline2\n')
+        self.run_loop()
+
+        late_stream, _, ws_manager = self.subscribe()
+        assert late_stream is stream
+        assert len(self.get_lines(ws_manager)) == 2
+        assert len(self.k8s_api.responses) == 1
+
+    def test_upstream_closed_when_the_last_subscriber_leaves(self):
+        stream, log_frames1, _ = self.subscribe()
+        _, log_frames2, _ = self.subscribe()
+        self.run_loop()
+
+        self.log_streams.unsubscribe(stream=stream, log_frames=log_frames1)
+        self.run_loop()
+        assert stream.is_done is False
+
+        self.log_streams.unsubscribe(stream=stream, log_frames=log_frames2)
+        self.run_loop()
+        assert stream.is_done is True
+        assert self.k8s_api.responses[0].close.call_count == 1
+        assert self.log_streams.streams == {}
+
+        # A new subscriber opens a new upstream
+        new_stream, _, _ = self.subscribe()
+        self.run_loop()
+        assert new_stream is not stream
+        assert len(self.k8s_api.responses) == 2
+
+    def test_resubscribe_right_after_the_last_subscriber_leaves(self):
+        stream, log_frames, _ = self.subscribe()
+        self.run_loop()
+
+        self.log_streams.unsubscribe(stream=stream, log_frames=log_frames)
+        # Re-subscribe before the cancelled stream's task is done
+        new_stream, _, ws_manager = self.subscribe()
+        assert new_stream is not stream
+        self.run_loop()
+        assert stream.is_done is True
+        assert self.log_streams.streams == {new_stream.key: new_stream}
+
+        self.k8s_api.responses[1].content.chunks.put_nowait(b'line1\n')
+        self.run_loop()
+        assert len(self.get_lines(ws_manager)) == 1
+
+    def test_upstream_end(self):
+        stream, _, _ = self.subscribe()
+        self.run_loop()
+        self.k8s_api.responses[0].content.chunks.put_nowait(b'')
+        self.loop.run_until_complete(stream.wait(timeout=1))
+        assert stream.is_done is True
+        assert self.log_streams.streams == {}
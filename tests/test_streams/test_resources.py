@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from constants.experiments import ExperimentLifeCycle
+from streams.resources.experiments import experiment_resources
+from streams.resources.logs import log_experiment
+from streams.socket_manager import SocketManager
+
+
+class FakeWebSocket(object):
+    def __init__(self):
+        self._connection_lost = False
+        self.messages = []
+
+    async def send(self, message):
+        await asyncio.sleep(0)
+        self.messages.append(message)
+
+
+@pytest.mark.streams_mark
+class TestExperimentStreams(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.request = MagicMock()
+        self.request.app.experiment_resources_ws_managers = {}
+        self.request.app.experiment_logs_ws_managers = {}
+        self.experiment = MagicMock(last_status=ExperimentLifeCycle.SUCCEEDED, is_done=True)
+        self.experiment.uuid.hex = 'experiment_uuid'
+        self.experiment.jobs.values.return_value = []
+        for patcher in [
+            patch('streams.resources.experiments.SOCKET_SLEEP', 0.01),
+            patch('streams.resources.experiments.RESOURCES_CHECK', 1),
+            patch('streams.resources.experiments.RedisToStream'),
+            patch('streams.resources.experiments.auditor'),
+            patch('streams.resources.experiments.validate_experiment',
+                  return_value=(self.experiment, None)),
+            patch('streams.resources.logs.SOCKET_SLEEP', 0.01),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_finished_experiment_streams_remove_their_sockets(self):
+        count = SocketManager.sockets_count
+        resources_sockets = [FakeWebSocket() for _ in range(3)]
+        logs_sockets = [FakeWebSocket() for _ in range(3)]
+        # The handlers are called without the authentication
+        handlers = [experiment_resources.__wrapped__(self.request,
+                                                     ws,
+                                                     username='user',
+                                                     project_name='project',
+                                                     experiment_id=1)
+                    for ws in resources_sockets]
+        handlers += [log_experiment(request=self.request,
+                                    ws=ws,
+                                    experiment=self.experiment,
+                                    namespace='namespace',
+                                    container='container')
+                     for ws in logs_sockets]
+        self.loop.run_until_complete(asyncio.wait_for(asyncio.gather(*handlers), timeout=5))
+
+        assert SocketManager.sockets_count == count
+        assert self.request.app.experiment_resources_ws_managers == {}
+        for ws_manager in self.request.app.experiment_logs_ws_managers.values():
+            assert ws_manager.ws == set()
+        for ws in logs_sockets:
+            assert json.loads(ws.messages[-1])['status'] == ExperimentLifeCycle.SUCCEEDED
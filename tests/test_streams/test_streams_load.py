@@ -0,0 +1,218 @@
+import asyncio
+import json
+import time
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from streams.constants import EXECUTOR_MAX_WORKERS
+from streams.log_frames import LogFrames
+from streams.log_streams import PodLogStreams
+from streams.resources.experiments import experiment_resources
+from streams.resources.logs import log_job_pod
+from streams.socket_manager import SocketManager
+
+
+class FakeContent(object):
+    def __init__(self):
+        self.chunks = asyncio.Queue()
+
+    async def readany(self):
+        return await self.chunks.get()
+
+
+class FakeK8SApi(object):
+    def __init__(self):
+        self.responses = []
+
+    async def read_namespaced_pod_log(self, pod_id, namespace, **kwargs):
+        response = MagicMock(content=FakeContent())
+        self.responses.append(response)
+        return response
+
+
+class FakeWebSocket(object):
+    def __init__(self):
+        self._connection_lost = False
+        self.frames = []
+        self.sent_at = []
+
+    async def send(self, message):
+        await asyncio.sleep(0)
+        self.frames.append(message)
+        self.sent_at.append(time.monotonic())
+
+    def get_lines(self):
+        """The lines received without their timestamp prefix."""
+        lines = []
+        for frame in self.frames:
+            lines += [line.split(' -- ', 1)[1]
+                      for line in json.loads(frame)['log_lines'].split('\n')]
+        return lines
+
+
+@pytest.mark.streams_mark
+class TestStreamsLoad(TestCase):
+    """Load test of the logs of one pod followed by many sockets of one streams worker."""
+    NUM_SOCKETS = 200
+    NUM_LINES = 1000
+    CHUNK_SIZE = 50
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.k8s_api = FakeK8SApi()
+        self.request = MagicMock()
+        self.request.app.pod_log_streams = PodLogStreams()
+
+    def tearDown(self):
+        self.request.app.pod_log_streams.stop()
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.loop.close()
+
+    async def run_sockets(self):
+        ws_manager = SocketManager()
+        sockets = [FakeWebSocket() for _ in range(self.NUM_SOCKETS)]
+        handlers = []
+        all_log_frames = []
+        for ws in sockets:
+            ws_manager.add_socket(ws)
+            log_frames = LogFrames(ws_manager=ws_manager, ws=ws)
+            log_frames.start()
+            all_log_frames.append(log_frames)
+            handlers.append(asyncio.ensure_future(log_job_pod(request=self.request,
+                                                              k8s_api=self.k8s_api,
+                                                              ws=ws,
+                                                              ws_manager=ws_manager,
+                                                              log_frames=log_frames,
+                                                              pod_id='pod',
+                                                              container='container',
+                                                              namespace='namespace')))
+        await asyncio.sleep(0.01)
+
+        content = self.k8s_api.responses[0].content
+        for start in range(0, self.NUM_LINES, self.CHUNK_SIZE):
+            chunk = ''.join('line{}\n'.format(i)
+                            for i in range(start, start + self.CHUNK_SIZE))
+            content.chunks.put_nowait(chunk.encode())
+            await asyncio.sleep(0.01)
+        # The upstream ends, the handlers return
+        content.chunks.put_nowait(b'')
+        _, pending = await asyncio.wait(handlers, timeout=5)
+        for log_frames in all_log_frames:
+            log_frames.stop()
+        # Let the sockets' senders drain their queues
+        await asyncio.sleep(0.1)
+        ws_manager.remove_sockets(set(sockets))
+        await asyncio.sleep(0)
+        return sockets, pending
+
+    def test_all_sockets_get_all_the_lines_in_order(self):
+        sockets, pending = self.loop.run_until_complete(self.run_sockets())
+
+        assert not pending
+        # One upstream follow shared by all the sockets
+        assert len(self.k8s_api.responses) == 1
+        expected_lines = ['line{}'.format(i) for i in range(self.NUM_LINES)]
+        for ws in sockets:
+            assert ws.get_lines() == expected_lines
+            # The lines are batched in frames, not sent one by one
+            assert len(ws.frames) < self.NUM_LINES / 10
+
+
+@pytest.mark.streams_mark
+class TestStreamsPollingLoad(TestCase):
+    """Load test of the resources sockets of one streams worker polling a slow db.
+
+    Every poll of an experiment's status blocks for `QUERY_DURATION`, the polls are run in the
+    executor, so the event loop keeps serving the other sockets while the queries run.
+    """
+    NUM_SOCKETS = 32
+    QUERY_DURATION = 0.2
+    RUN_DURATION = 1.5
+    SOCKET_SLEEP = 0.01
+    # A round of polls of all the sockets takes NUM_SOCKETS * QUERY_DURATION / max_workers
+    MAX_FRAMES_GAP = 1
+    MAX_LOOP_LAG = 0.1
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.request = MagicMock()
+        self.request.app.experiment_resources_ws_managers = {}
+        self.experiments = {}
+        for experiment_id in range(self.NUM_SOCKETS):
+            experiment = MagicMock(is_done=False)
+            experiment.uuid.hex = 'experiment{}'.format(experiment_id)
+            experiment.jobs.values.return_value = []
+            # The blocking status query
+            experiment.refresh_from_db.side_effect = lambda: time.sleep(self.QUERY_DURATION)
+            self.experiments[experiment_id] = experiment
+
+        def validate_experiment(request, username, project_name, experiment_id):
+            return self.experiments[experiment_id], None
+
+        for patcher in [
+            patch('streams.resources.experiments.SOCKET_SLEEP', self.SOCKET_SLEEP),
+            # The status is refreshed on every iteration
+            patch('streams.resources.experiments.RESOURCES_CHECK', 0),
+            patch('streams.resources.experiments.CHECK_DELAY', 1),
+            patch('streams.resources.experiments.RedisToStream'),
+            patch('streams.resources.experiments.auditor'),
+            patch('streams.resources.experiments.validate_experiment',
+                  side_effect=validate_experiment),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.loop.close()
+
+    async def measure_loop_lag(self, lags):
+        interval = 0.01
+        while True:
+            start = self.loop.time()
+            await asyncio.sleep(interval)
+            lags.append(self.loop.time() - start - interval)
+
+    async def run_sockets(self):
+        sockets = [FakeWebSocket() for _ in range(self.NUM_SOCKETS)]
+        lags = []
+        lag_task = asyncio.ensure_future(self.measure_loop_lag(lags))
+        count = SocketManager.sockets_count
+        # The handlers are called without the authentication
+        handlers = [asyncio.ensure_future(experiment_resources.__wrapped__(
+            self.request,
+            ws,
+            username='user',
+            project_name='project',
+            experiment_id=experiment_id)) for experiment_id, ws in enumerate(sockets)]
+        await asyncio.sleep(self.RUN_DURATION)
+        sockets_count = SocketManager.sockets_count - count
+
+        # The experiments are done, the handlers return
+        for experiment in self.experiments.values():
+            experiment.is_done = True
+        _, pending = await asyncio.wait(handlers, timeout=5)
+        lag_task.cancel()
+        return sockets, sockets_count, lags, pending
+
+    def test_slow_queries_do_not_stall_the_other_sockets(self):
+        assert EXECUTOR_MAX_WORKERS * self.MAX_FRAMES_GAP > (
+            self.NUM_SOCKETS * self.QUERY_DURATION)
+        sockets, sockets_count, lags, pending = self.loop.run_until_complete(
+            self.run_sockets())
+
+        assert not pending
+        # The worker holds all the sockets at once
+        assert sockets_count == self.NUM_SOCKETS
+        # The loop is never blocked by a query
+        assert max(lags) < self.MAX_LOOP_LAG
+        for ws in sockets:
+            # Every socket keeps receiving frames while the others' queries run
+            assert len(ws.sent_at) >= 2
+            assert max(t2 - t1 for t1, t2 in zip(ws.sent_at, ws.sent_at[1:])) < (
+                self.MAX_FRAMES_GAP)
+        assert self.request.app.experiment_resources_ws_managers == {}